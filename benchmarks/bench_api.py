@@ -0,0 +1,384 @@
+"""Measure every ``get_*`` method against the local mock server.
+
+Every call uses a distinct key so identical requests are not coalesced.
+Reports requests/sec, p50/p99 latency, parse CPU time and memory per item at
+several concurrency levels. Run with ``python -m benchmarks.bench_api``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, List, Sequence, Tuple
+
+from benchmarks.mock_server import MockMagicEden, replay_session
+from benchmarks.payloads import make_payload
+from magicpyden import MagicEdenApi
+from magicpyden.constants import MAX_PAGE_LIMIT
+from magicpyden.endpoint import EndPoint
+from magicpyden.ratelimit import RateLimiter
+
+Call = Callable[[MagicEdenApi, str], Awaitable[Any]]
+Measures = Tuple[float, ...]
+
+DEFAULT_REQUESTS = 200
+UNLIMITED = 10**9
+MILLISECONDS = 1000
+TAIL_SHARE = 0.99
+HEADER = ("method", "conc", "req/s", "p50 ms", "p99 ms", "parse ms", "B/item")
+NAME_WIDTH = 28
+WIDTHS = (5, 10, 9, 9, 10, 9)
+FORMATS = (".1f", ".2f", ".2f", ".2f", ".0f")
+
+
+async def get_token_metadata(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request token metadata.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_token_metadata(key)
+
+
+async def get_token_listings(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request token listings.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_token_listings(key)
+
+
+async def get_token_offers_received(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of offers received by token.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_token_offers_received(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_token_activities(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of token activities.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_token_activities(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_wallet_tokens(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of wallet tokens.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_wallet_tokens(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_wallet_activities(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of wallet activities.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_wallet_activities(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_wallet_offers_made(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of offers made by wallet.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_wallet_offers_made(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_wallet_offers_received(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of offers received by wallet.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_wallet_offers_received(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_wallet_escrow_balance(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request wallet escrow balance.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_wallet_escrow_balance(key)
+
+
+async def get_collections(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of collections, offset by key length.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_collections(offset=len(key), limit=MAX_PAGE_LIMIT)
+
+
+async def get_collection_listings(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request collection listings.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_collection_listings(key)
+
+
+async def get_collection_activities(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of collection activities.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_collection_activities(key, limit=MAX_PAGE_LIMIT)
+
+
+async def get_collection_stats(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request collection stats.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_collection_stats(key)
+
+
+async def get_launchpad_collections(api: MagicEdenApi, key: str) -> Any:
+    """
+    Request a full page of launchpad collections, offset by key length.
+
+    :param api: API object
+    :param key: Distinct request key
+    :return: Parsed response
+    """
+    return await api.get_launchpad_collections(offset=len(key), limit=MAX_PAGE_LIMIT)
+
+
+METHODS: Tuple[Call, ...] = (
+    get_token_metadata,
+    get_token_listings,
+    get_token_offers_received,
+    get_token_activities,
+    get_wallet_tokens,
+    get_wallet_activities,
+    get_wallet_offers_made,
+    get_wallet_offers_received,
+    get_wallet_escrow_balance,
+    get_collections,
+    get_collection_listings,
+    get_collection_activities,
+    get_collection_stats,
+    get_launchpad_collections,
+)
+
+
+def percentile(samples: List[float], share: float) -> float:
+    """
+    Pick sample at share of the sorted samples.
+
+    :param samples: Measured samples
+    :param share: Share between 0 and 1
+    :return: Sample
+    """
+    ordered = sorted(samples)
+    position = int(len(ordered) * share)
+    return ordered[min(position, len(ordered) - 1)]
+
+
+def create_api(arguments: argparse.Namespace, **options: Any) -> MagicEdenApi:
+    """
+    Create API object without rate limit.
+
+    :param arguments: Command line arguments
+    :param options: Other arguments of ``MagicEdenApi``
+    :return: API object
+    """
+    return MagicEdenApi(
+        rate_limiter=RateLimiter(rate=UNLIMITED, burst=UNLIMITED),
+        trusted=arguments.trusted,
+        **options,
+    )
+
+
+async def collect_latencies(
+    api: MagicEdenApi, call: Call, concurrency: int, requests: int
+) -> List[float]:
+    """
+    Send requests from concurrent workers, each with a distinct key.
+
+    :param api: API object
+    :param call: Benchmarked method
+    :param concurrency: Number of workers
+    :param requests: Number of requests
+    :return: Latency of every request in milliseconds
+    """
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:  # noqa: WPS430
+        for index in remaining:
+            started = time.perf_counter()
+            await call(api, f"key{index}")
+            latencies.append((time.perf_counter() - started) * MILLISECONDS)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def measure_throughput(
+    arguments: argparse.Namespace, base_url: str, call: Call, concurrency: int
+) -> Measures:
+    """
+    Send requests through the mock server.
+
+    :param arguments: Command line arguments
+    :param base_url: Url of mock server
+    :param call: Benchmarked method
+    :param concurrency: Number of workers
+    :return: Requests per second, median and tail latency in milliseconds
+    """
+    async with create_api(arguments, base_url=base_url) as api:
+        started = time.perf_counter()
+        latencies = await collect_latencies(api, call, concurrency, arguments.requests)
+        elapsed = time.perf_counter() - started
+    return (
+        arguments.requests / elapsed,
+        statistics.median(latencies),
+        percentile(latencies, TAIL_SHARE),
+    )
+
+
+async def measure_cpu(api: MagicEdenApi, call: Call) -> float:
+    """
+    Measure CPU time of a call.
+
+    :param api: API object
+    :param call: Benchmarked method
+    :return: CPU milliseconds
+    """
+    started = time.process_time()
+    await call(api, "key")
+    return (time.process_time() - started) * MILLISECONDS
+
+
+async def measure_memory(api: MagicEdenApi, call: Call) -> float:
+    """
+    Measure memory held by the parsed response.
+
+    :param api: API object
+    :param call: Benchmarked method
+    :return: Bytes per parsed item
+    """
+    tracemalloc.start()
+    parsed = await call(api, "key")
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(parsed) if isinstance(parsed, list) else 1
+    return size / max(count, 1)
+
+
+async def measure_parsing(arguments: argparse.Namespace, call: Call) -> Measures:
+    """
+    Parse a full recorded payload replayed without network.
+
+    :param arguments: Command line arguments
+    :param call: Benchmarked method
+    :return: Parse CPU milliseconds and bytes per item
+    """
+    endpoint = EndPoint[call.__name__[len("get_") :]]  # noqa: E203
+    session = replay_session(make_payload(endpoint))
+    async with create_api(arguments, session=session) as api:
+        return await measure_cpu(api, call), await measure_memory(api, call)
+
+
+def print_row(cells: Sequence[str]) -> None:
+    """
+    Print result row, the method name left aligned.
+
+    :param cells: Method name and measures
+    """
+    name, *measures = cells
+    aligned = [name.ljust(NAME_WIDTH)]
+    aligned.extend(map(str.rjust, measures, WIDTHS))
+    print("".join(aligned))  # noqa: WPS421
+
+
+async def bench(arguments: argparse.Namespace, base_url: str, call: Call) -> None:
+    """
+    Measure method at every concurrency level.
+
+    :param arguments: Command line arguments
+    :param base_url: Url of mock server
+    :param call: Benchmarked method
+    """
+    parsing = await measure_parsing(arguments, call)
+    for concurrency in arguments.concurrency:
+        throughput = await measure_throughput(arguments, base_url, call, concurrency)
+        cells = map(format, (*throughput, *parsing), FORMATS)
+        print_row((call.__name__, str(concurrency), *cells))
+
+
+async def run(arguments: argparse.Namespace) -> None:
+    """
+    Benchmark every method against a mock server.
+
+    :param arguments: Command line arguments
+    """
+    server = MockMagicEden(
+        latency=arguments.latency,
+        jitter=arguments.jitter,
+        error_rate=arguments.error_rate,
+        throttle_rate=arguments.throttle_rate,
+    )
+    base_url = await server.start()
+    print_row(HEADER)
+    try:  # noqa: WPS501
+        for call in METHODS:
+            await bench(arguments, base_url, call)
+    finally:
+        await server.close()
+    print(server.counters)  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--throttle-rate", type=float, default=0)
+    parser.add_argument("--trusted", action="store_true")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,51 @@
+"""Compare memory per activity row of pydantic models and columnar tables.
+
+Run with ``python -m benchmarks.bench_columnar``.
+"""
+
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.payloads import make_payload
+from magicpyden.columnar import ActivityTable
+from magicpyden.endpoint import EndPoint
+from magicpyden.parsing import parse_model
+from magicpyden.schema import CollectionActivities
+
+ROWS = 20000
+
+
+def measure(build: Callable[[], Any]) -> float:
+    """
+    Measure memory held by the built object.
+
+    :param build: Builds the object from ``ROWS`` rows
+    :return: Bytes per row
+    """
+    tracemalloc.start()
+    built = build()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / ROWS
+
+
+def build_table(body: bytes) -> ActivityTable:
+    """
+    Decode body into a columnar table.
+
+    :param body: JSON array of activities
+    :return: Filled table
+    """
+    table = ActivityTable()
+    table.extend(json.loads(body))
+    return table
+
+
+if __name__ == "__main__":
+    body = json.dumps(make_payload(EndPoint.collection_activities, ROWS)).encode()
+    models = measure(lambda: parse_model(CollectionActivities, json.loads(body)))
+    table = measure(lambda: build_table(body))
+    ratio = models / table
+    print(f"models {models:8.1f} B/row", end="  ")  # noqa: WPS421
+    print(f"table {table:8.1f} B/row  x{ratio:5.1f}")  # noqa: WPS421
@@ -0,0 +1,65 @@
+"""Compare memory per activity row of plain and compact models.
+
+Run with ``python -m benchmarks.bench_compact``.
+"""
+
+import json
+import tracemalloc
+from functools import partial
+from typing import Any, Callable
+
+from benchmarks.payloads import make_payload
+from magicpyden.compact import CompactMode
+from magicpyden.endpoint import EndPoint
+from magicpyden.parsing import parse_model
+from magicpyden.schema import CollectionActivities
+
+ROWS = 20000
+
+
+def measure(build: Callable[[], Any]) -> float:
+    """
+    Measure memory held by the built models.
+
+    :param build: Builds models from ``ROWS`` rows
+    :return: Bytes per row
+    """
+    tracemalloc.start()
+    built = build()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / ROWS
+
+
+def build_models(body: bytes) -> Any:
+    """
+    Parse activities into plain models.
+
+    :param body: JSON array of activities
+    :return: Models
+    """
+    return parse_model(CollectionActivities, json.loads(body))
+
+
+def build_compact_models(body: bytes, decode_addresses: bool) -> Any:
+    """
+    Parse activities into compacted models.
+
+    :param body: JSON array of activities
+    :param decode_addresses: Store addresses as decoded bytes
+    :return: Models
+    """
+    compact = CompactMode(decode_addresses=decode_addresses)
+    return compact.apply(build_models(body))
+
+
+if __name__ == "__main__":
+    body = json.dumps(make_payload(EndPoint.collection_activities, ROWS)).encode()
+    plain = measure(partial(build_models, body))
+    print(f"plain            {plain:8.1f} B/row")  # noqa: WPS421
+    for decode_addresses in (False, True):
+        compact = measure(partial(build_compact_models, body, decode_addresses))
+        saved = 1 - compact / plain
+        label = "compact+address" if decode_addresses else "compact"
+        row = f"{label:<16} {compact:8.1f} B/row"
+        print(row, f" saved {saved:6.1%}")  # noqa: WPS421
@@ -0,0 +1,97 @@
+"""Compare validated, trusted and lazy model building on recorded payloads.
+
+Lazy parsing is measured reading one field of every item.
+
+Run with ``python -m benchmarks.bench_parsing``.
+"""
+
+import time
+from typing import Any, Callable, List, Type
+
+from pydantic import BaseModel
+
+from benchmarks.payloads import make_payload
+from magicpyden.endpoint import EndPoint
+from magicpyden.lazy import parse_lazy
+from magicpyden.parsing import parse_model
+from magicpyden.schema import (
+    CollectionActivities,
+    CollectionListings,
+    Tokens,
+    WalletActivities,
+)
+
+CASES = (
+    (EndPoint.collection_activities, CollectionActivities, "price"),
+    (EndPoint.wallet_activities, WalletActivities, "price"),
+    (EndPoint.collection_listings, CollectionListings, "price"),
+    (EndPoint.wallet_tokens, Tokens, "name"),
+)
+REPEAT = 20
+SIZE = 500
+
+
+def best_of(parse: Callable[[], Any]) -> float:
+    """
+    Time parsing, keeping the fastest of ``REPEAT`` runs.
+
+    :param parse: Parses the payload
+    :return: Seconds
+    """
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def read_lazy(model: Type[BaseModel], payload: Any, field: str) -> List[Any]:
+    """
+    Parse payload lazily and read one field of every item.
+
+    :param model: Model of payload
+    :param payload: Decoded JSON payload
+    :param field: Field read from every item
+    :return: Field values
+    """
+    return [getattr(parsed, field) for parsed in parse_lazy(model, payload)]
+
+
+def report(label: str, timing: float, baseline: float) -> None:
+    """
+    Print timing and its speedup over the baseline, on the current line.
+
+    :param label: Name of parsing mode
+    :param timing: Seconds
+    :param baseline: Seconds of validated parsing
+    """
+    milliseconds = timing * 1000
+    speedup = baseline / timing
+    print(f"{label} {milliseconds:8.2f} ms", end="  ")  # noqa: WPS421
+    print(f"x{speedup:5.1f}", end="  ")  # noqa: WPS421
+
+
+def bench(endpoint: EndPoint, model: Type[BaseModel], field: str) -> None:
+    """
+    Compare parsing modes on a recorded payload of endpoint.
+
+    :param endpoint: Endpoint of payload
+    :param model: Model of payload
+    :param field: Field read from every lazily parsed item
+    """
+    payload = make_payload(endpoint, SIZE)
+    validated = best_of(lambda: parse_model(model, payload))
+    trusted = best_of(lambda: parse_model(model, payload, trusted=True))
+    lazy = best_of(lambda: read_lazy(model, payload, field))
+    header = f"{endpoint.name:<24} {SIZE:>4} items"
+    print(header, end=" ")  # noqa: WPS421
+    report("validated", validated, validated)
+    report("trusted", trusted, validated)
+    report("lazy", lazy, validated)
+    print()  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    for endpoint, model, field in CASES:
+        bench(endpoint, model, field)
@@ -0,0 +1,228 @@
+"""Local stand-in for the Magic Eden API serving recorded payloads.
+
+Run standalone with ``python -m benchmarks.mock_server --port 8080``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from functools import lru_cache, partial
+from http import HTTPStatus
+from typing import Any, Dict, Mapping, Optional, cast
+
+from aiohttp import ClientSession, web
+
+from benchmarks.payloads import SINGLE_OBJECT_ENDPOINTS, make_payload
+from magicpyden.endpoint import EndPoint
+
+DEFAULT_HISTORY_SIZE = 2000
+DEFAULT_PORT = 8080
+
+
+class MockMagicEden:
+    def __init__(  # noqa: WPS211
+        self,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        throttle_rate: float = 0,
+        tail_rate: float = 0,
+        tail_latency: float = 0,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        seed: Optional[int] = 0,
+    ) -> None:
+        """
+        Initialize stand-in server.
+
+        :param latency: Seconds added to every response
+        :param jitter: Maximum random seconds added on top of latency
+        :param error_rate: Share of requests answered with 503
+        :param throttle_rate: Share of requests answered with 429
+        :param tail_rate: Share of requests slowed down by ``tail_latency``
+        :param tail_latency: Seconds added to slow requests
+        :param history_size: Number of records behind every list endpoint
+        :param seed: Seed of injected latency and failures
+        """
+        self.error_rate = error_rate
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self._latency = latency
+        self._jitter = jitter
+        self._throttle_rate = throttle_rate
+        self._history_size = history_size
+        self.counters: Dict[str, int] = {"served": 0, "errors": 0, "throttled": 0}
+        self._random = random.Random(seed)  # noqa: S311
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    def create_app(self) -> web.Application:
+        """
+        Create application with a route for every endpoint.
+
+        :return: aiohttp application
+        """
+        app = web.Application()
+        for endpoint in EndPoint:
+            path = endpoint.value.format("{key}")
+            app.router.add_get(f"/v2/{path}", partial(self.respond, endpoint))
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving.
+
+        :param host: Interface to bind
+        :param port: Port to bind, a free one by default
+        :return: Base url to pass to ``MagicEdenApi``
+        """
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}/v2"
+        return self.base_url
+
+    async def close(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def respond(self, endpoint: EndPoint, request: web.Request) -> web.Response:
+        """
+        Answer request with recorded payload or injected failure.
+
+        :param endpoint: Requested endpoint
+        :param request: Incoming request
+        :return: Response
+        """
+        delay = self._latency + self._random.uniform(0, self._jitter)
+        if self._random.random() < self.tail_rate:
+            delay += self.tail_latency
+        if delay:
+            await asyncio.sleep(delay)
+
+        draw = self._random.random()
+        if draw < self._throttle_rate:
+            self.counters["throttled"] += 1
+            return web.json_response(
+                {}, status=HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": "0"}
+            )
+        if draw < self._throttle_rate + self.error_rate:
+            self.counters["errors"] += 1
+            return web.json_response({}, status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        self.counters["served"] += 1
+        offset = int(request.query.get("offset", 0))
+        limit = int(request.query.get("limit", 100))
+        return web.Response(
+            body=self._body(endpoint, offset, limit), content_type="application/json"
+        )
+
+    @lru_cache(maxsize=None)  # noqa: B019
+    def _body(self, endpoint: EndPoint, offset: int, limit: int) -> bytes:
+        payload: Any = make_payload(endpoint, self._history_size)
+        if endpoint not in SINGLE_OBJECT_ENDPOINTS:
+            payload = payload[offset : offset + limit]  # noqa: E203
+        return json.dumps(payload).encode()
+
+
+class ReplayResponse:
+    def __init__(self, body: bytes) -> None:
+        """
+        Initialize successful response with a fixed body.
+
+        :param body: Response body
+        """
+        self.status = HTTPStatus.OK
+        self.headers: Mapping[str, str] = {}
+        self._body = body
+
+    async def __aenter__(self) -> "ReplayResponse":
+        """
+        Enter response context.
+
+        :return: This response
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """
+        Leave response context.
+
+        :param exc_info: Exception raised in context, if any
+        """
+
+    def raise_for_status(self) -> None:
+        """Accept response, it is always successful."""
+
+    async def read(self) -> bytes:
+        """
+        Read response body.
+
+        :return: Response body
+        """
+        return self._body
+
+
+class ReplaySession:
+    def __init__(self, body: bytes) -> None:
+        """
+        Initialize session answering every request with the same body.
+
+        :param body: Response body
+        """
+        self.body = body
+        self.closed = False
+
+    def get(self, **request: Any) -> ReplayResponse:
+        """
+        Answer request without network.
+
+        :param request: Url, query parameters and headers, ignored
+        :return: Response context
+        """
+        return ReplayResponse(self.body)
+
+
+def replay_session(payload: Any) -> ClientSession:
+    """
+    Create session answering every request with payload, without network.
+
+    Pass it as ``session`` of ``MagicEdenApi`` to measure parsing alone.
+
+    :param payload: Decoded JSON payload
+    :return: Stand-in for a client session
+    """
+    return cast(ClientSession, ReplaySession(json.dumps(payload).encode()))
+
+
+async def serve(arguments: argparse.Namespace) -> None:
+    """
+    Serve until interrupted.
+
+    :param arguments: Command line arguments
+    """
+    server = MockMagicEden(
+        latency=arguments.latency,
+        jitter=arguments.jitter,
+        error_rate=arguments.error_rate,
+        throttle_rate=arguments.throttle_rate,
+        tail_rate=arguments.tail_rate,
+        tail_latency=arguments.tail_latency,
+    )
+    print(await server.start(port=arguments.port))  # noqa: WPS421
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--throttle-rate", type=float, default=0)
+    parser.add_argument("--tail-rate", type=float, default=0)
+    parser.add_argument("--tail-latency", type=float, default=0)
+    asyncio.run(serve(parser.parse_args()))
@@ -0,0 +1,192 @@
+"""Recorded Magic Eden responses used by benchmarks, one sample record per endpoint."""
+
+from copy import deepcopy
+from typing import Any, Dict
+
+from magicpyden.endpoint import EndPoint
+
+MINT = "ACcbkzxT3vyRqzKKbaFgwkY2hSaLGCF3BmCzDCew4vk8"
+WALLET = "8C1iDS8cN2eihPTVTfPtudEsa7gkFUFFXjoL3csuYMA"
+AUCTION_HOUSE = "E8cU1WiRWjanGxmn96ewBgk9vPTcL6AEZ1t6F6fkgUWe"
+PDA = "3XRqFBv1xzdGv2ESGx6bkBtYXUEpKhxQvPgYhZbKdXyA"
+TOKEN_ADDRESS = "BaHf3oWpg8pEXqZQQtQvRHzLvPDnNMhztoCzYHzJ5EXP"
+SIGNATURE = "".join(
+    (
+        "5U6k5QwVp6Eh7YbK4eRkq4tXzr9HuQqTUnH2C4aY7nQ8",
+        "dWm3pXfV5cG3Kf1bRkQoT3XN2nYw7e8MvFJYkFs4qZz1",
+    )
+)
+SIGNATURE_TAIL = SIGNATURE[8:]
+
+
+def ipfs_url(cid: str) -> str:
+    """
+    Build gateway URL of IPFS content.
+
+    :param cid: Content identifier
+    :return: URL
+    """
+    return f"https://{cid}.ipfs.dweb.link/"
+
+
+TOKEN_METADATA = {
+    "mintAddress": MINT,
+    "owner": WALLET,
+    "supply": 1,
+    "collection": "degods",
+    "name": "DeGod #4201",
+    "updateAuthority": "AxFuniPo7RaDgPH6Gizf4GZmLQFc4M5ipckeeZfkrPNn",
+    "primarySaleHappened": 1,
+    "sellerFeeBasisPoints": 999,
+    "image": "https://metadata.degods.com/g/4200.png",
+    "animationUrl": None,
+    "externalUrl": "https://degods.com/",
+    "attributes": [
+        {"trait_type": "background", "value": "Pink"},
+        {"trait_type": "skin", "value": "Glitch"},
+        {"trait_type": "specialty", "value": "None"},
+        {"trait_type": "clothes", "value": "Hoodie"},
+        {"trait_type": "neck", "value": "Gold Chain"},
+        {"trait_type": "head", "value": "Beanie"},
+        {"trait_type": "eyes", "value": "Laser"},
+        {"trait_type": "mouth", "value": "Smile"},
+    ],
+    "properties": {
+        "files": [
+            {"uri": "https://metadata.degods.com/g/4200.png", "type": "image/png"}
+        ],
+        "category": "image",
+        "creators": [
+            {"address": "9MynErYQ5Qi6obp4YwwdoDmXkZ1hYVtPUqYmJJ3rZ9Kn", "share": 0},
+            {"address": "AxFuniPo7RaDgPH6Gizf4GZmLQFc4M5ipckeeZfkrPNn", "share": 100},
+        ],
+    },
+    "delegate": None,
+}
+
+TOKEN_LISTING = {
+    "pdaAddress": PDA,
+    "auctionHouse": AUCTION_HOUSE,
+    "tokenAddress": TOKEN_ADDRESS,
+    "tokenMint": MINT,
+    "seller": WALLET,
+    "tokenSize": 1,
+    "price": 325.5,
+}
+
+OFFER = {
+    "pdaAddress": PDA,
+    "tokenMint": MINT,
+    "auctionHouse": AUCTION_HOUSE,
+    "buyer": WALLET,
+    "buyerReferral": "",
+    "tokenSize": 1,
+    "price": 300,
+    "expiry": 1672531200,
+}
+
+ACTIVITY = {
+    "signature": SIGNATURE,
+    "type": "buyNow",
+    "source": "magiceden_v2",
+    "tokenMint": MINT,
+    "collection": "degods",
+    "collectionSymbol": "degods",
+    "slot": 148236112,
+    "blockTime": 1661300000,
+    "buyer": WALLET,
+    "buyerReferral": "",
+    "seller": "2ZJH7oRTmt5rvEWV1e3P6W5mXamhnZZ6iDqc4SzGdNHB",
+    "sellerReferral": "autMW8SgBkVYeBgqYiTuJZnkvDZMVU2MHJh9Jh7CSQ2",
+    "price": 325.5,
+}
+
+COLLECTION = {
+    "symbol": "degods",
+    "name": "DeGods",
+    "description": "10,000 of the most degenerate gods in the universe.",
+    "image": ipfs_url("bafkreib7uvbfzvp4a3l3m3n3x7o3xgyp6ljz4y2mj2b6wfvb6ba3ro4ipi"),
+    "twitter": "https://twitter.com/DeGodsNFT",
+    "discord": "https://discord.gg/dedao",
+    "website": "https://degods.com",
+    "categories": ["pfps"],
+}
+
+COLLECTION_LISTING = {
+    "pdaAddress": PDA,
+    "auctionHouse": AUCTION_HOUSE,
+    "tokenAddress": TOKEN_ADDRESS,
+    "tokenMint": MINT,
+    "seller": WALLET,
+    "tokenSize": 1,
+    "price": 325.5,
+}
+
+LAUNCHPAD_COLLECTION = {
+    "symbol": "okay_bears",
+    "name": "Okay Bears",
+    "description": "Okay Bears is a culture shift.",
+    "featured": False,
+    "edition": "open",
+    "image": ipfs_url("bafybeif3dpkk3gpxwpjfrdpjfwd5kwd6g4yn7uxskbpbk5u6xr5vfdwwwq"),
+    "price": 1.5,
+    "size": 10000,
+    "launchDatetime": "2022-04-26T16:00:00.000Z",
+}
+
+RECORDS: Dict[EndPoint, Any] = {
+    EndPoint.token_metadata: TOKEN_METADATA,
+    EndPoint.token_listings: TOKEN_LISTING,
+    EndPoint.token_offers_received: OFFER,
+    EndPoint.token_activities: ACTIVITY,
+    EndPoint.wallet_tokens: TOKEN_METADATA,
+    EndPoint.wallet_activities: ACTIVITY,
+    EndPoint.wallet_offers_made: OFFER,
+    EndPoint.wallet_offers_received: OFFER,
+    EndPoint.wallet_escrow_balance: {"buyerEscrow": PDA, "balance": 12.5},
+    EndPoint.collections: COLLECTION,
+    EndPoint.collection_listings: COLLECTION_LISTING,
+    EndPoint.collection_activities: ACTIVITY,
+    EndPoint.collection_stats: {
+        "symbol": "degods",
+        "floorPrice": 325500000000,
+        "listedCount": 312,
+        "avgPrice24hr": 331200000000,
+        "volumeAll": 1545632000000000,
+    },
+    EndPoint.launchpad_collections: LAUNCHPAD_COLLECTION,
+}
+
+SINGLE_OBJECT_ENDPOINTS = frozenset(
+    (EndPoint.token_metadata, EndPoint.wallet_escrow_balance, EndPoint.collection_stats)
+)
+
+
+def make_payload(endpoint: EndPoint, size: int = 500) -> Any:
+    """
+    Build response payload for endpoint.
+
+    List endpoints return ``size`` records with distinct signatures and slots so
+    pages look like real history.
+
+    :param endpoint: Endpoint to build payload for
+    :param size: Number of records in list payloads
+    :return: Decoded JSON payload
+    """
+    record = RECORDS[endpoint]
+    if endpoint in SINGLE_OBJECT_ENDPOINTS:
+        return deepcopy(record)
+
+    payload = []
+    for index in range(size):
+        row = deepcopy(record)
+        if "signature" in row:
+            _renumber(row, index)
+        payload.append(row)
+    return payload
+
+
+def _renumber(activity: Dict[str, Any], index: int) -> None:
+    activity["signature"] = f"{index:08d}{SIGNATURE_TAIL}"
+    activity["slot"] -= index
+    activity["blockTime"] -= index * 7
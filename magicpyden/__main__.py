@@ -0,0 +1,87 @@
+"""Command line interface of magicpyden.
+
+Snapshot every collection with ``python -m magicpyden crawl snapshot/``.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from magicpyden.api import BASE_URL
+from magicpyden.constants import (
+    DEFAULT_BURST,
+    DEFAULT_CRAWL_CONCURRENCY,
+    DEFAULT_RATE_LIMIT,
+)
+from magicpyden.crawler import CrawlOptions, ShardResult, crawl, export_parquet
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create parser of command line arguments.
+
+    :return: Argument parser
+    """
+    parser = argparse.ArgumentParser(prog="magicpyden", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    crawl_parser = commands.add_parser(
+        "crawl", help="snapshot stats and listings of every collection"
+    )
+    crawl_parser.add_argument("output", help="directory of NDJSON shard files")
+    crawl_parser.add_argument("--workers", type=int, help="default: one per core")
+    crawl_parser.add_argument("--rate", type=float, default=DEFAULT_RATE_LIMIT)
+    crawl_parser.add_argument("--burst", type=int, default=DEFAULT_BURST)
+    crawl_parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CRAWL_CONCURRENCY
+    )
+    crawl_parser.add_argument("--base-url", default=BASE_URL)
+    crawl_parser.add_argument("--trusted", action="store_true")
+    crawl_parser.add_argument("--parquet", help="also export to this Parquet file")
+    return parser
+
+
+def report(shards: List[ShardResult]) -> bool:
+    """
+    Print number of written collections and symbols of failed ones.
+
+    :param shards: Result of every shard
+    :return: True if any collection failed
+    """
+    failed = [symbol for shard in shards for symbol in shard.failed]
+    written = sum(shard.written for shard in shards)
+    failed_count = len(failed)
+    print(f"written: {written}, failed: {failed_count}")  # noqa: WPS421
+    if failed:
+        print("rerun to retry:", " ".join(failed), file=sys.stderr)  # noqa: WPS421
+    return bool(failed)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run command.
+
+    :param argv: Command line arguments, ``sys.argv`` by default
+    :return: Exit status, 1 if any collection failed
+    """
+    arguments = create_parser().parse_args(argv)
+    options = CrawlOptions(
+        base_url=arguments.base_url,
+        concurrency=arguments.concurrency,
+        trusted=arguments.trusted,
+    )
+    shards = crawl(
+        arguments.output,
+        workers=arguments.workers,
+        rate=arguments.rate,
+        burst=arguments.burst,
+        options=options,
+    )
+    failed = report(shards)
+    if arguments.parquet:
+        export_parquet(arguments.output, arguments.parquet)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
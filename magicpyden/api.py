@@ -1,9 +1,66 @@
-from typing import Any, List
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from itertools import count
+from http import HTTPStatus
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientResponseError, ClientSession
 from inflection import camelize
+from pydantic import BaseModel
 
+from magicpyden.batch import BatchResult, collect, fetch_many
+from magicpyden.cache import ResponseCache, ValidatorStore, Validators, make_cache_key
+from magicpyden.columnar import ActivityTable, ListingTable, build_table
+from magicpyden.compact import CompactMode
+from magicpyden.concurrency import AdaptiveConcurrency
+from magicpyden.constants import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PREFETCH,
+    MAX_COLLECTION_LISTINGS_LIMIT,
+    MAX_PAGE_LIMIT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    STREAM_CHUNK_SIZE,
+)
 from magicpyden.endpoint import EndPoint
+from magicpyden.hooks import RequestEvent, RequestHook
+from magicpyden.lazy import parse_lazy
+from magicpyden.pagination import paginate
+from magicpyden.parsing import JsonLoads, default_json_loads, parse_model
+from magicpyden.portfolio import PortfolioValuer
+from magicpyden.ratelimit import RateLimiter, parse_retry_after
+from magicpyden.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgingPolicy,
+    is_retryable,
+    is_upstream_failure,
+)
+from magicpyden.scheduler import (
+    Priority,
+    PriorityScheduler,
+    current_priority,
+    request_priority,
+)
 from magicpyden.schema import (
     CollectionActivities,
     CollectionActivityItem,
@@ -30,19 +87,93 @@ from magicpyden.schema import (
     WalletOffersMade,
     WalletOffersReceived,
 )
+from magicpyden.session import SessionConfig
+from magicpyden.singleflight import SingleFlight
+from magicpyden.streaming import JsonArrayParser, StreamProgress
+from magicpyden.traits import TraitIndex
 
 BASE_URL = "https://api-mainnet.magiceden.dev/v2"
 
+REQUEST_ERRORS = (ClientError, asyncio.TimeoutError)
+PAGE_PARAMS = frozenset(("offset", "limit"))
 
-class MagicEdenApi:
-    def __init__(self, base_url: str = BASE_URL) -> None:
+PathArgs = Tuple[str, ...]
+Query = Dict[str, Any]
+StreamRequest = Callable[[int], AsyncIterator[Any]]
+
+
+class MagicEdenApi:  # noqa: WPS230
+    def __init__(  # noqa: WPS211
+        self,
+        base_url: str = BASE_URL,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        session_config: Optional[SessionConfig] = None,
+        session: Optional[ClientSession] = None,
+        cache: Optional[ResponseCache] = None,
+        trusted: bool = False,
+        json_loads: JsonLoads = default_json_loads,
+        hooks: Sequence[RequestHook] = (),
+        validators: Optional[ValidatorStore] = None,
+        compact: Optional[CompactMode] = None,
+        lazy: bool = False,
+        scheduler: Optional[PriorityScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+    ) -> None:
         """
         Initialize API object.
 
         :param base_url: Base url of Magic Eden API
+        :param rate_limiter: Rate limiter, may be shared between API objects
+        :param max_retries: Retries of throttled or server error responses
+        :param session_config: Connection pool and timeout settings
+        :param session: Session shared with other API objects, left open on exit
+        :param cache: Cache of slowly changing responses, disabled by default
+        :param trusted: Build models from responses without pydantic validation
+        :param json_loads: JSON decoder accepting bytes, orjson when installed
+        :param hooks: Observers of requests, e.g. ``MetricsCollector``
+        :param validators: Store of ETag/Last-Modified validators enabling
+            conditional requests, disabled by default
+        :param compact: Interning of repeated strings in parsed models,
+            disabled by default
+        :param lazy: Return lazy models validating fields on first access,
+            not combinable with ``compact``
+        :param scheduler: Scheduler ordering requests by priority, sized to the
+            connection pool by default
+        :param circuit_breaker: Per-endpoint breaker failing fast, or serving
+            stale cached bodies, while upstream is unhealthy. Disabled by default
+        :param hedging: Policy sending a duplicate of requests slower than
+            usual, disabled by default
+        :param concurrency: Per-endpoint limits of requests in flight adapting
+            to latency and errors, disabled by default
+        :raises ValueError: If both ``compact`` and ``lazy`` are set
         """
+        if compact is not None and lazy:
+            raise ValueError("compact mode does not apply to lazy models")
         self._base_url = base_url
-        self._session: ClientSession = ClientSession(raise_for_status=True)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self._max_retries = max_retries
+        self._session_config = session_config or SessionConfig()
+        self._session: Optional[ClientSession] = session
+        self._owns_session = session is None
+        self.cache = cache
+        self._in_flight: SingleFlight[bytes] = SingleFlight()
+        self.trusted = trusted
+        self.json_loads = json_loads
+        self.hooks = list(hooks)
+        self.validators = validators
+        self.compact = compact
+        self.lazy = lazy
+        self.scheduler = scheduler or PriorityScheduler(self._session_config.limit)
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        if hedging is not None:
+            self.hooks.append(hedging)
+        self.concurrency = concurrency
+        if concurrency is not None:
+            self.hooks.append(concurrency)
 
     async def __aenter__(self):
         """
@@ -50,8 +181,7 @@ class MagicEdenApi:
 
         :return: MagicEden Api instance
         """
-        if self._session.closed:
-            self._session = ClientSession(raise_for_status=True)
+        self._get_session()
         return self
 
     async def __aexit__(self, *err) -> None:
@@ -60,9 +190,22 @@ class MagicEdenApi:
 
         :param err: Error args
         """
-        if not self._session.closed:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close session unless it was supplied by the caller."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
+    def priority(self, priority: Priority) -> ContextManager[None]:
+        """
+        Send requests of the enclosed block, and tasks it starts, with priority.
+
+        :param priority: Priority of requests, e.g. ``Priority.high``
+        :return: Context manager
+        """
+        return request_priority(priority)
+
     async def get_token_metadata(self, token_mint: str) -> TokenMetadata:
         """
         Retrieve token metadata by mint address.
@@ -70,10 +213,59 @@ class MagicEdenApi:
         :param token_mint: Mint Address of token/NFT
         :return: Token metadata
         """
-        json_data = await self._request(
-            route=EndPoint.token_metadata.value.format(token_mint)
-        )
-        return TokenMetadata(**json_data)
+        return await self._get(TokenMetadata, EndPoint.token_metadata, token_mint)
+
+    def iter_many_token_metadata(
+        self,
+        token_mints: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Stream metadata of many tokens as requests complete.
+
+        :param token_mints: Mint addresses of tokens/NFTs, duplicates fetched once
+        :param concurrency: Maximum number of requests in flight
+        :return: Async iterator of results with token metadata or per-mint error
+        """
+        return fetch_many(self.get_token_metadata, token_mints, concurrency)
+
+    async def get_many_token_metadata(
+        self,
+        token_mints: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> Dict[str, BatchResult]:
+        """
+        Retrieve metadata of many tokens.
+
+        :param token_mints: Mint addresses of tokens/NFTs, duplicates fetched once
+        :param concurrency: Maximum number of requests in flight
+        :return: Results with token metadata or error by mint address
+        """
+        return await collect(self.iter_many_token_metadata(token_mints, concurrency))
+
+    async def get_trait_index(
+        self,
+        token_mints: Iterable[str],
+        index: Optional[TraitIndex] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> TraitIndex:
+        """
+        Index traits of many tokens as their metadata arrives.
+
+        Tokens whose metadata could not be fetched are left out.
+
+        :param token_mints: Mint addresses of tokens/NFTs, duplicates fetched once
+        :param index: Index to update, a new one by default
+        :param concurrency: Maximum number of requests in flight
+        :return: Trait index
+        """
+        if index is None:
+            index = TraitIndex()
+        fetched = self.iter_many_token_metadata(token_mints, concurrency)
+        async for batch_result in fetched:
+            if batch_result.ok:
+                index.add([batch_result.value])
+        return index
 
     async def get_token_listings(self, token_mint: str) -> List[TokenListingItem]:
         """
@@ -82,10 +274,7 @@ class MagicEdenApi:
         :param token_mint: Mint address of token/NFT
         :return: List of token listings
         """
-        json_data = await self._request(
-            route=EndPoint.token_listings.value.format(token_mint)
-        )
-        return TokenListings.parse_obj(json_data).__root__
+        return await self._get(TokenListings, EndPoint.token_listings, token_mint)
 
     async def get_token_offers_received(
         self, token_mint: str, offset: int = 0, limit: int = 100
@@ -98,12 +287,36 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of token offers received
         """
-        json_data = await self._request(
-            route=EndPoint.token_offers_received.value.format(token_mint),
+        return await self._get(
+            TokenOffersReceived,
+            EndPoint.token_offers_received,
+            token_mint,
+            offset=offset,
+            limit=limit,
+        )
+
+    def iter_token_offers_received(
+        self,
+        token_mint: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[TokenOfferReceivedItem]:
+        """
+        Stream received offers for specified token/NFT mint address across pages.
+
+        :param token_mint: Mint address of token/NFT
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of token offers received
+        """
+        return paginate(
+            partial(self.get_token_offers_received, token_mint),
             offset=offset,
             limit=limit,
+            prefetch=prefetch,
         )
-        return TokenOffersReceived.parse_obj(json_data).__root__
 
     async def get_token_activities(
         self, token_mint: str, offset: int = 0, limit: int = 100
@@ -116,12 +329,81 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of activities for specified token/NFT
         """
-        json_data = await self._request(
-            route=EndPoint.token_activities.value.format(token_mint),
+        return await self._get(
+            TokenActivities,
+            EndPoint.token_activities,
+            token_mint,
             offset=offset,
             limit=limit,
         )
-        return TokenActivities.parse_obj(json_data).__root__
+
+    def iter_token_activities(
+        self,
+        token_mint: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[TokenActivityItem]:
+        """
+        Stream activities for specified token/NFT mint address across pages.
+
+        :param token_mint: Mint address of token/NFT
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of activities for specified token/NFT
+        """
+        return paginate(
+            partial(self.get_token_activities, token_mint),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def stream_token_activities(
+        self, token_mint: str, offset: int = 0, limit: int = MAX_PAGE_LIMIT
+    ) -> AsyncIterator[TokenActivityItem]:
+        """
+        Parse activities for specified token/NFT one by one while the page downloads.
+
+        :param token_mint: Mint address of token/NFT
+        :param offset: The number of items to skip
+        :param limit: The number of items to return. Max 500
+        :return: Async iterator of activities for specified token/NFT
+        """
+        return self._stream(
+            TokenActivities,
+            EndPoint.token_activities,
+            token_mint,
+            offset=offset,
+            limit=limit,
+        )
+
+    async def get_token_activity_table(
+        self,
+        token_mint: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> ActivityTable:
+        """
+        Retrieve activities of token/NFT across pages into one columnar table.
+
+        Rows go straight from decoded JSON into packed columns, without models.
+
+        :param token_mint: Mint address of token/NFT
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Columnar table of activities for specified token/NFT
+        """
+        rows: AsyncIterator[Mapping[str, Any]] = paginate(
+            partial(self._get_json, EndPoint.token_activities, token_mint),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+        return await build_table(ActivityTable(), rows)
 
     async def get_wallet_tokens(
         self,
@@ -139,13 +421,64 @@ class MagicEdenApi:
         :param listed_only: Determines if only listed tokens should be retrieved
         :return: List of tokens/NFTS owned by specified wallet address
         """
-        json_data = await self._request(
-            route=EndPoint.wallet_tokens.value.format(wallet_address),
+        return await self._get(
+            Tokens,
+            EndPoint.wallet_tokens,
+            wallet_address,
+            offset=offset,
+            limit=limit,
+            listed_only=str(listed_only).lower(),
+        )
+
+    def iter_wallet_tokens(  # noqa: WPS211
+        self,
+        wallet_address: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        listed_only: bool = True,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[TokenMetadata]:
+        """
+        Stream tokens/NFTs owned by specified wallet address across pages.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param listed_only: Determines if only listed tokens should be retrieved
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of tokens/NFTS owned by specified wallet address
+        """
+        return paginate(
+            partial(self.get_wallet_tokens, wallet_address, listed_only=listed_only),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def stream_wallet_tokens(
+        self,
+        wallet_address: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        listed_only: bool = True,
+    ) -> AsyncIterator[TokenMetadata]:
+        """
+        Parse tokens/NFTs owned by wallet one by one while the page downloads.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to return. Max 500
+        :param listed_only: Determines if only listed tokens should be retrieved
+        :return: Async iterator of tokens/NFTS owned by specified wallet address
+        """
+        return self._stream(
+            Tokens,
+            EndPoint.wallet_tokens,
+            wallet_address,
             offset=offset,
             limit=limit,
             listed_only=str(listed_only).lower(),
         )
-        return Tokens.parse_obj(json_data).__root__
 
     async def get_wallet_activities(
         self, wallet_address: str, offset: int = 0, limit: int = 100
@@ -158,12 +491,81 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of wallet activities
         """
-        json_data = await self._request(
-            route=EndPoint.wallet_activities.value.format(wallet_address),
+        return await self._get(
+            WalletActivities,
+            EndPoint.wallet_activities,
+            wallet_address,
+            offset=offset,
+            limit=limit,
+        )
+
+    def iter_wallet_activities(
+        self,
+        wallet_address: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[WalletActivityItem]:
+        """
+        Stream wallet activities across pages.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of wallet activities
+        """
+        return paginate(
+            partial(self.get_wallet_activities, wallet_address),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def stream_wallet_activities(
+        self, wallet_address: str, offset: int = 0, limit: int = MAX_PAGE_LIMIT
+    ) -> AsyncIterator[WalletActivityItem]:
+        """
+        Parse wallet activities one by one while the page downloads.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to return. Max 500
+        :return: Async iterator of wallet activities
+        """
+        return self._stream(
+            WalletActivities,
+            EndPoint.wallet_activities,
+            wallet_address,
+            offset=offset,
+            limit=limit,
+        )
+
+    async def get_wallet_activity_table(
+        self,
+        wallet_address: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> ActivityTable:
+        """
+        Retrieve wallet activities across pages into one columnar table.
+
+        Rows go straight from decoded JSON into packed columns, without models.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Columnar table of wallet activities
+        """
+        rows: AsyncIterator[Mapping[str, Any]] = paginate(
+            partial(self._get_json, EndPoint.wallet_activities, wallet_address),
             offset=offset,
             limit=limit,
+            prefetch=prefetch,
         )
-        return WalletActivities.parse_obj(json_data).__root__
+        return await build_table(ActivityTable(), rows)
 
     async def get_wallet_offers_made(
         self, wallet_address: str, offset: int = 0, limit: int = 100
@@ -176,12 +578,36 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of offers made
         """
-        json_data = await self._request(
-            route=EndPoint.wallet_offers_made.value.format(wallet_address),
+        return await self._get(
+            WalletOffersMade,
+            EndPoint.wallet_offers_made,
+            wallet_address,
             offset=offset,
             limit=limit,
         )
-        return WalletOffersMade.parse_obj(json_data).__root__
+
+    def iter_wallet_offers_made(
+        self,
+        wallet_address: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[WalletOfferMadeItem]:
+        """
+        Stream offers made by specified wallet across pages.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of offers made
+        """
+        return paginate(
+            partial(self.get_wallet_offers_made, wallet_address),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
 
     async def get_wallet_offers_received(
         self, wallet_address: str, offset: int = 0, limit: int = 100
@@ -194,24 +620,83 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of offers received
         """
-        json_data = await self._request(
-            route=EndPoint.wallet_offers_received.value.format(wallet_address),
+        return await self._get(
+            WalletOffersReceived,
+            EndPoint.wallet_offers_received,
+            wallet_address,
             offset=offset,
             limit=limit,
         )
-        return WalletOffersReceived.parse_obj(json_data).__root__
 
-    async def get_wallet_escrow_balance(self, wallet_address: str):
+    def iter_wallet_offers_received(
+        self,
+        wallet_address: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[WalletOfferReceivedItem]:
+        """
+        Stream offers received by a wallet across pages.
+
+        :param wallet_address: Solana wallet address
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of offers received
+        """
+        return paginate(
+            partial(self.get_wallet_offers_received, wallet_address),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    async def get_wallet_escrow_balance(self, wallet_address: str) -> EscrowBalance:
         """
         Retrieve escrow balance for wallet.
 
         :param wallet_address: Solana wallet address
         :return: Wallet escrow balance
         """
-        json_data = await self._request(
-            route=EndPoint.wallet_escrow_balance.value.format(wallet_address)
+        return await self._get(
+            EscrowBalance, EndPoint.wallet_escrow_balance, wallet_address
+        )
+
+    def iter_wallet_portfolios(
+        self,
+        wallet_addresses: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Stream valuations of many wallets as they complete.
+
+        Tokens are valued at their collection floor price. Stats of every
+        collection are fetched once for all wallets.
+
+        :param wallet_addresses: Solana wallet addresses, duplicates valued once
+        :param concurrency: Maximum number of wallets valued at once
+        :return: Async iterator of results with wallet portfolio or per-wallet error
+        """
+        valuer = PortfolioValuer(
+            self._list_wallet_tokens,
+            self.get_wallet_escrow_balance,
+            self.get_collection_stats,
         )
-        return EscrowBalance(**json_data)
+        return fetch_many(valuer.value, wallet_addresses, concurrency)
+
+    async def get_wallet_portfolio(
+        self,
+        wallet_addresses: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> Dict[str, BatchResult]:
+        """
+        Value tokens and escrow balance of many wallets in SOL.
+
+        :param wallet_addresses: Solana wallet addresses, duplicates valued once
+        :param concurrency: Maximum number of wallets valued at once
+        :return: Results with wallet portfolio or error by wallet address
+        """
+        return await collect(self.iter_wallet_portfolios(wallet_addresses, concurrency))
 
     async def get_collections(
         self, offset: int = 0, limit: int = 200
@@ -223,12 +708,27 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: Available collections on Magic Eden
         """
-        json_data = await self._request(
-            route=str(EndPoint.collections),
-            offset=offset,
-            limit=limit,
+        return await self._get(
+            Collections, EndPoint.collections, offset=offset, limit=limit
+        )
+
+    def iter_collections(
+        self,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[CollectionItem]:
+        """
+        Stream collections across pages.
+
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of available collections on Magic Eden
+        """
+        return paginate(
+            self.get_collections, offset=offset, limit=limit, prefetch=prefetch
         )
-        return Collections.parse_obj(json_data).__root__
 
     async def get_collection_listings(
         self, collection_name: str, offset: int = 0, limit: int = 20
@@ -241,12 +741,62 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 20
         :return: List of listings for collection
         """
-        json_data = await self._request(
-            route=EndPoint.collection_listings.value.format(collection_name),
+        return await self._get(
+            CollectionListings,
+            EndPoint.collection_listings,
+            collection_name,
             offset=offset,
             limit=limit,
         )
-        return CollectionListings.parse_obj(json_data).__root__
+
+    def iter_collection_listings(
+        self,
+        collection_name: str,
+        offset: int = 0,
+        limit: int = MAX_COLLECTION_LISTINGS_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[CollectionListingItem]:
+        """
+        Stream tokens/NFT listings for collection across pages.
+
+        :param collection_name: Name of NFT collection
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 20
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of listings for collection
+        """
+        return paginate(
+            partial(self.get_collection_listings, collection_name),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    async def get_collection_listing_table(
+        self,
+        collection_name: str,
+        offset: int = 0,
+        limit: int = MAX_COLLECTION_LISTINGS_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> ListingTable:
+        """
+        Retrieve listings for collection across pages into one columnar table.
+
+        Rows go straight from decoded JSON into packed columns, without models.
+
+        :param collection_name: Name of NFT collection
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 20
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Columnar table of listings for collection
+        """
+        rows: AsyncIterator[Mapping[str, Any]] = paginate(
+            partial(self._get_json, EndPoint.collection_listings, collection_name),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+        return await build_table(ListingTable(), rows)
 
     async def get_collection_activities(
         self, collection_name: str, offset: int = 0, limit: int = 100
@@ -259,23 +809,122 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of activities for collection
         """
-        json_data = await self._request(
-            route=EndPoint.collection_activities.value.format(collection_name),
+        return await self._get(
+            CollectionActivities,
+            EndPoint.collection_activities,
+            collection_name,
+            offset=offset,
+            limit=limit,
+        )
+
+    def iter_collection_activities(
+        self,
+        collection_name: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[CollectionActivityItem]:
+        """
+        Stream activities for collection across pages.
+
+        :param collection_name: Name of NFT collection
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of activities for collection
+        """
+        return paginate(
+            partial(self.get_collection_activities, collection_name),
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def stream_collection_activities(
+        self, collection_name: str, offset: int = 0, limit: int = MAX_PAGE_LIMIT
+    ) -> AsyncIterator[CollectionActivityItem]:
+        """
+        Parse activities for collection one by one while the page downloads.
+
+        :param collection_name: Name of NFT collection
+        :param offset: The number of items to skip
+        :param limit: The number of items to return. Max 500
+        :return: Async iterator of activities for collection
+        """
+        return self._stream(
+            CollectionActivities,
+            EndPoint.collection_activities,
+            collection_name,
+            offset=offset,
+            limit=limit,
+        )
+
+    async def get_collection_activity_table(
+        self,
+        collection_name: str,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> ActivityTable:
+        """
+        Retrieve activities for collection across pages into one columnar table.
+
+        Rows go straight from decoded JSON into packed columns, without models.
+
+        :param collection_name: Name of NFT collection
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Columnar table of activities for collection
+        """
+        rows: AsyncIterator[Mapping[str, Any]] = paginate(
+            partial(self._get_json, EndPoint.collection_activities, collection_name),
             offset=offset,
             limit=limit,
+            prefetch=prefetch,
         )
-        return CollectionActivities.parse_obj(json_data).__root__
+        return await build_table(ActivityTable(), rows)
 
-    async def get_collection_stats(self, collection_name: str):
+    async def get_collection_stats(self, collection_name: str) -> CollectionStats:
         """
         Retrieve stats for collection.
 
-        :return: List of activities for collection
+        :param collection_name: Name of NFT collection
+        :return: Collection stats
+        """
+        return await self._get(
+            CollectionStats, EndPoint.collection_stats, collection_name
+        )
+
+    def iter_many_collection_stats(
+        self,
+        collection_names: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Stream stats of many collections as requests complete.
+
+        :param collection_names: Names of NFT collections, duplicates fetched once
+        :param concurrency: Maximum number of requests in flight
+        :return: Async iterator of results with collection stats or per-name error
+        """
+        return fetch_many(self.get_collection_stats, collection_names, concurrency)
+
+    async def get_many_collection_stats(
+        self,
+        collection_names: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> Dict[str, BatchResult]:
         """
-        json_data = await self._request(
-            route=EndPoint.collection_stats.value.format(collection_name),
+        Retrieve stats of many collections.
+
+        :param collection_names: Names of NFT collections, duplicates fetched once
+        :param concurrency: Maximum number of requests in flight
+        :return: Results with collection stats or error by collection name
+        """
+        return await collect(
+            self.iter_many_collection_stats(collection_names, concurrency)
         )
-        return CollectionStats(**json_data)
 
     async def get_launchpad_collections(
         self, offset: int = 0, limit: int = 200
@@ -287,27 +936,697 @@ class MagicEdenApi:
         :param limit: The number of items to return. Max 500
         :return: List of launchpad collections
         """
-        json_data = await self._request(
-            route=str(EndPoint.launchpad_collections), offset=offset, limit=limit
+        return await self._get(
+            LaunchPadCollections,
+            EndPoint.launchpad_collections,
+            offset=offset,
+            limit=limit,
         )
-        return LaunchPadCollections.parse_obj(json_data).__root__
 
-    async def _request(self, route: str, **kwargs) -> Any:
+    def iter_launchpad_collections(
+        self,
+        offset: int = 0,
+        limit: int = MAX_PAGE_LIMIT,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[LaunchpadCollectionItem]:
         """
-        Request data from defined ME endpoint.
+        Stream launchpad collections across pages.
 
-        :param route: ME endpoint to target
+        :param offset: The number of items to skip
+        :param limit: The number of items to request per page. Max 500
+        :param prefetch: The number of pages requested ahead of consumption
+        :return: Async iterator of launchpad collections
+        """
+        return paginate(
+            self.get_launchpad_collections,
+            offset=offset,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    async def get_raw(self, endpoint: EndPoint, *args: str, **kwargs) -> bytes:
+        """
+        Request endpoint and return its undecoded response body.
+
+        The request is cached, retried and rate limited like the others, for
+        callers decoding responses themselves.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint, e.g. a collection symbol
+        :param kwargs: Query parameters, e.g. ``offset`` and ``limit``
+        :return: Response body
+        """
+        query, key = self._make_request_key(endpoint, args, kwargs)
+        return await self._load_body(endpoint, args, query, key)
+
+    async def _list_wallet_tokens(self, wallet_address: str) -> List[TokenMetadata]:
+        """
+        Retrieve every token of wallet, listed or not, one page at a time.
+
+        Most wallets fit in one page, and valuations run for many wallets at
+        once, so no page is requested ahead.
+
+        :param wallet_address: Solana wallet address
+        :return: List of tokens/NFTs owned by wallet
+        """
+        tokens = self.iter_wallet_tokens(wallet_address, listed_only=False, prefetch=1)
+        return [token async for token in tokens]
+
+    async def _get(
+        self,
+        model: Type[BaseModel],
+        endpoint: EndPoint,
+        *args: str,
+        **kwargs,
+    ) -> Any:
+        """
+        Request endpoint and build response model.
+
+        :param model: Response model class
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :param kwargs: Optional keyword arguments
+        :return: Model or list of items for root models
+        """
+        query, key = self._make_request_key(endpoint, args, kwargs)
+        body = await self._load_body(endpoint, args, query, key)
+        if self.validators is not None:
+            parsed = self.validators.parsed_for(key, model, body)
+            if parsed is not None:
+                return parsed
+
+        parsed = self._build(model, endpoint, body)
+        if self.validators is not None:
+            self.validators.remember_parsed(key, model, body, parsed)
+        return parsed
+
+    def _build(self, model: Type[BaseModel], endpoint: EndPoint, body: bytes) -> Any:
+        """
+        Decode response body and build response model, reporting parse time.
+
+        :param model: Response model class
+        :param endpoint: ME endpoint targeted
+        :param body: Response body
+        :return: Model or list of items for root models, compacted if enabled
+        """
+        started = time.perf_counter()
+        parsed = self._parse(model, self.json_loads(body))
+        if self.compact is not None:
+            parsed = self.compact.apply(parsed)
+        parse_time = time.perf_counter() - started
+        self._emit(
+            "on_parse_done",
+            RequestEvent(endpoint, size=len(body), parse_time=parse_time),
+        )
+        return parsed
+
+    async def _get_json(self, endpoint: EndPoint, *args: str, **kwargs) -> Any:
+        """
+        Request endpoint and decode response body.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
         :param kwargs: Optional keyword arguments
         :return: JSON data
         """
-        response: ClientResponse
+        return self.json_loads(await self.get_raw(endpoint, *args, **kwargs))
+
+    def _parse(self, model: Type[BaseModel], json_data: Any) -> Any:
+        """
+        Build response model, skipping validation in trusted mode.
+
+        :param model: Response model class
+        :param json_data: Decoded JSON data
+        :return: Model instance or list of items for root models, lazy ones in
+            lazy mode
+        """
+        if self.lazy:
+            return parse_lazy(model, json_data, trusted=self.trusted)
+        return parse_model(model, json_data, trusted=self.trusted)
+
+    def _stream(
+        self,
+        model: Type[BaseModel],
+        endpoint: EndPoint,
+        *args: str,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Request list endpoint and build items while the response downloads.
+
+        Bypasses cache, revalidation, request sharing and hedging. Every attempt
+        is checked against and recorded in the circuit breaker. Requests are
+        retried until the first item is built, and the connection slot is held
+        until the response is consumed.
+
+        :param model: Root response model class of a list of items
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :param kwargs: Optional keyword arguments
+        :return: Async iterator of items, in order
+        """
+        query, _ = self._make_request_key(endpoint, args, kwargs)
+        request = partial(
+            self._stream_attempt,
+            model.__fields__["__root__"].type_,
+            endpoint,
+            self._url(endpoint, args),
+            query,
+        )
+        return self._stream_retrying(request, endpoint, current_priority())
+
+    async def _stream_retrying(  # noqa: WPS231
+        self, request: StreamRequest, endpoint: EndPoint, priority: Priority
+    ) -> AsyncIterator[Any]:
+        """
+        Stream items of a request, sending it again on retryable failures.
+
+        :param request: Sends one attempt given its number, streaming items
+        :param endpoint: ME endpoint to target
+        :param priority: Priority of request
+        :yield: Items, in order
+        :raises ClientResponseError: If the response failed and no retry is left
+        """
+        for attempt in count():
+            attempt_items = self._stream_in_slot(request, endpoint, priority, attempt)
+            try:  # noqa: WPS501, WPS503
+                async for streamed_item in attempt_items:
+                    yield streamed_item
+            except ClientResponseError as error:
+                if not self._should_retry(endpoint, error, attempt):
+                    raise
+                await asyncio.sleep(self._backoff(error, attempt))
+            else:
+                return
+            finally:
+                await attempt_items.aclose()
+
+    async def _stream_in_slot(
+        self,
+        request: StreamRequest,
+        endpoint: EndPoint,
+        priority: Priority,
+        attempt: int,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Stream items of one attempt in a slot of its priority, if circuit allows.
+
+        :param request: Sends one attempt given its number, streaming items
+        :param endpoint: ME endpoint to target
+        :param priority: Priority of request
+        :param attempt: Number of previous attempts
+        :yield: Items, in order
+        """
+        self._check_circuit(endpoint)
+        with self._recording_outcome(endpoint):
+            async with self._request_slot(endpoint, priority):
+                async for streamed_item in request(attempt):
+                    yield streamed_item
+
+    async def _stream_attempt(  # noqa: WPS211
+        self,
+        item_model: Type[BaseModel],
+        endpoint: EndPoint,
+        url: str,
+        query: Query,
+        attempt: int,
+    ) -> AsyncIterator[Any]:
+        """
+        Send request once and build items of its JSON array as chunks arrive.
+
+        Network time reported to hooks excludes time spent building items and
+        by the consumer. Item build time is reported once the response is read.
+
+        :param item_model: Item model class
+        :param endpoint: ME endpoint to target
+        :param url: Url of request
+        :param query: Query parameters
+        :param attempt: Number of previous attempts
+        :yield: Items, in order
+        """
+        self._emit("on_request_start", RequestEvent(endpoint, attempt))
+        progress = StreamProgress()
+        with self._reporting_failure(endpoint, attempt, progress.network_time):
+            async with self._get_session().get(url=url, params=query) as response:
+                streamed = self._stream_items(response, item_model, progress)
+                async for streamed_item in streamed:
+                    yield streamed_item
+                status = response.status
+        self._report_response(
+            RequestEvent(
+                endpoint, attempt, status, progress.size, progress.network_time()
+            )
+        )
+        self._emit(
+            "on_parse_done",
+            RequestEvent(endpoint, size=progress.size, parse_time=progress.parse_time),
+        )
+
+    async def _stream_items(
+        self,
+        response: ClientResponse,
+        item_model: Type[BaseModel],
+        progress: StreamProgress,
+    ) -> AsyncIterator[Any]:
+        """
+        Build items of a JSON array response as its chunks arrive.
 
-        kwargs = {
-            camelize(key) if key not in ("offset", "limit") else key: value
-            for key, value in kwargs.items()  # noqa: WPS110
+        :param response: Response being received
+        :param item_model: Item model class
+        :param progress: Progress updated with received bytes, parse time and
+            consumer time
+        :yield: Items, compacted if enabled
+        """
+        response.raise_for_status()
+        self.rate_limiter.update(response.headers)
+        parser = JsonArrayParser()
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            progress.size += len(chunk)
+            with progress.parsing():
+                decoded = parser.feed(chunk)
+            for json_data in decoded:
+                with progress.parsing():
+                    built = self._build_item(item_model, json_data)
+                with progress.pause():
+                    yield built
+        parser.close()
+
+    def _build_item(self, item_model: Type[BaseModel], json_data: Any) -> Any:
+        """
+        Build one streamed item.
+
+        :param item_model: Item model class
+        :param json_data: Decoded JSON item
+        :return: Item, compacted if enabled
+        """
+        built = self._parse(item_model, json_data)
+        if self.compact is not None:
+            self.compact.apply(built)
+        return built
+
+    def _make_request_key(
+        self, endpoint: EndPoint, args: PathArgs, kwargs: Query
+    ) -> Tuple[Query, str]:
+        """
+        Build query parameters and request key.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :param kwargs: Optional keyword arguments
+        :return: Query parameters and request key
+        """
+        query = {
+            key if key in PAGE_PARAMS else camelize(key): param_value
+            for key, param_value in kwargs.items()
         }
+        return query, make_cache_key(endpoint, args, query)
+
+    def _url(self, endpoint: EndPoint, args: PathArgs) -> str:
+        """
+        Build url of endpoint.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :return: Url without query
+        """
+        path = endpoint.value.format(*args)
+        return f"{self._base_url}/{path}"
+
+    async def _load_body(
+        self,
+        endpoint: EndPoint,
+        args: PathArgs,
+        query: Query,
+        key: str,
+    ) -> bytes:
+        """
+        Get response body from cache or a single shared request.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :param query: Query parameters
+        :param key: Request key
+        :return: Response body
+        """
+        body = self._get_cached(endpoint, key)
+        if body is None:
+            body = await self._in_flight.share(
+                key, partial(self._fetch, endpoint, args, query, key)
+            )
+        return body
+
+    def _get_cached(self, endpoint: EndPoint, key: str) -> Optional[bytes]:
+        """
+        Look up cached response body.
+
+        :param endpoint: ME endpoint to target
+        :param key: Request key
+        :return: Cached response body, if caching is enabled and entry is fresh
+        """
+        if self.cache is None or not self.cache.is_cached(endpoint):
+            return None
+        return self.cache.get(key)
+
+    def _set_cached(self, endpoint: EndPoint, key: str, body: bytes) -> None:
+        """
+        Store response body, if caching is enabled for endpoint.
+
+        :param endpoint: ME endpoint targeted
+        :param key: Request key
+        :param body: Response body
+        """
+        if self.cache is not None and self.cache.is_cached(endpoint):
+            self.cache.set(endpoint, key, body)
+
+    async def _fetch(
+        self,
+        endpoint: EndPoint,
+        args: PathArgs,
+        query: Query,
+        key: str,
+    ) -> bytes:
+        """
+        Send request and cache its response body.
+
+        While the circuit of endpoint is open, the last known body is served.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :param query: Query parameters
+        :param key: Request key
+        :return: Response body
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(endpoint):
+            return self._get_stale(endpoint, key)
+        with self._recording_outcome(endpoint):
+            body = await self._send(endpoint, args, query, key)
+        self._set_cached(endpoint, key, body)
+        return body
+
+    def _check_circuit(self, endpoint: EndPoint) -> None:
+        """
+        Fail fast while the circuit of endpoint is open.
+
+        :param endpoint: ME endpoint to target
+        :raises CircuitOpenError: If the circuit breaker holds requests back
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(endpoint):
+            raise CircuitOpenError(endpoint)
+
+    @contextmanager
+    def _recording_outcome(self, endpoint: EndPoint) -> Iterator[None]:
+        """
+        Record outcome of the request sent inside the block in the circuit breaker.
+
+        :param endpoint: ME endpoint targeted
+        :yield: Nothing
+        :raises REQUEST_ERRORS: If the request failed or timed out
+        """
+        try:
+            yield
+        except REQUEST_ERRORS as error:
+            self._record_outcome(endpoint, error)
+            raise
+        self._record_outcome(endpoint)
+
+    def _record_outcome(
+        self, endpoint: EndPoint, error: Optional[Exception] = None
+    ) -> None:
+        """
+        Record outcome of request in the circuit breaker, if enabled.
+
+        :param endpoint: ME endpoint targeted
+        :param error: Error raised by request, None on success
+        """
+        if self.circuit_breaker is None:
+            return
+        if error is not None and is_upstream_failure(error):
+            self.circuit_breaker.record_failure(endpoint)
+        else:
+            self.circuit_breaker.record_success(endpoint)
+
+    def _get_stale(self, endpoint: EndPoint, key: str) -> bytes:
+        """
+        Look up last known response body while circuit of endpoint is open.
+
+        :param endpoint: ME endpoint to target
+        :param key: Request key
+        :return: Cached or revalidation response body, even if expired
+        :raises CircuitOpenError: If no response body is known
+        """
+        if self.cache is not None:
+            body = self.cache.get_stale(key)
+            if body is not None:
+                return body
+        validators = None if self.validators is None else self.validators.get(key)
+        if validators is None:
+            raise CircuitOpenError(endpoint)
+        return validators.body
+
+    async def _send(
+        self,
+        endpoint: EndPoint,
+        args: PathArgs,
+        query: Query,
+        key: str,
+    ) -> bytes:
+        """
+        Send request, retrying throttled and server error responses.
+
+        :param endpoint: ME endpoint to target
+        :param args: Path arguments of endpoint
+        :param query: Query parameters
+        :param key: Request key
+        :return: Response body
+        :raises ClientResponseError: If the response failed and no retry is left
+        """
+        url = self._url(endpoint, args)
+        priority = current_priority()
+        attempt = 0
+        while True:  # noqa: WPS457
+            try:
+                return await self._scheduled_attempt(
+                    endpoint, url, query, attempt, key, priority
+                )
+            except ClientResponseError as error:
+                if not self._should_retry(endpoint, error, attempt):
+                    raise
+                await asyncio.sleep(self._backoff(error, attempt))
+            attempt += 1
+
+    def _should_retry(
+        self, endpoint: EndPoint, error: ClientResponseError, attempt: int
+    ) -> bool:
+        """
+        Decide if a failed request is sent again, reporting the retry to hooks.
+
+        :param endpoint: ME endpoint targeted
+        :param error: Error raised for failed response
+        :param attempt: Number of previous attempts
+        :return: True if the error is retryable and retries are left
+        """
+        if attempt == self._max_retries or not is_retryable(error.status):
+            return False
+        self._emit(
+            "on_retry",
+            RequestEvent(endpoint, attempt, error.status, error=error),
+        )
+        return True
+
+    async def _scheduled_attempt(  # noqa: WPS211
+        self,
+        endpoint: EndPoint,
+        url: str,
+        query: Query,
+        attempt: int,
+        key: str,
+        priority: Priority,
+    ) -> bytes:
+        """
+        Send request once its priority allows, hedging it if slower than usual.
+
+        A hedged duplicate is sent under the slot and rate-limit token of the
+        original request, so it never waits behind queued requests.
+
+        :param endpoint: ME endpoint to target
+        :param url: Url of request
+        :param query: Query parameters
+        :param attempt: Number of previous attempts
+        :param key: Request key
+        :param priority: Priority of request
+        :return: Response body
+        """
+        async with self._request_slot(endpoint, priority):
+            send = partial(self._attempt, endpoint, url, query, attempt, key)
+            if self.hedging is None:
+                return await send()
+            return await self.hedging.send(endpoint, send)
+
+    @asynccontextmanager
+    async def _request_slot(
+        self, endpoint: EndPoint, priority: Priority
+    ) -> AsyncIterator[None]:
+        """
+        Hold the endpoint's concurrency slot and a scheduler slot of priority.
+
+        :param endpoint: ME endpoint to target
+        :param priority: Priority of request
+        :yield: Nothing, once the request may be sent
+        """
+        async with self._endpoint_slot(endpoint):
+            async with self.scheduler.slot(priority, self.rate_limiter):
+                yield
+
+    @asynccontextmanager
+    async def _endpoint_slot(self, endpoint: EndPoint) -> AsyncIterator[None]:
+        """
+        Hold a slot of the adaptive concurrency limit of endpoint, if enabled.
+
+        :param endpoint: ME endpoint to target
+        :yield: Nothing, once the request may be sent
+        """
+        if self.concurrency is None:
+            yield
+            return
+        async with self.concurrency.slot(endpoint):
+            yield
+
+    async def _attempt(  # noqa: WPS211
+        self,
+        endpoint: EndPoint,
+        url: str,
+        query: Query,
+        attempt: int,
+        key: str,
+    ) -> bytes:
+        """
+        Send request once, reporting it to hooks.
+
+        :param endpoint: ME endpoint to target
+        :param url: Url of request
+        :param query: Query parameters
+        :param attempt: Number of previous attempts
+        :param key: Request key
+        :return: Response body, the stored one if it was not modified
+        """
+        validators = None if self.validators is None else self.validators.get(key)
+
+        self._emit("on_request_start", RequestEvent(endpoint, attempt))
+        elapsed = partial(_elapsed, time.perf_counter())
+        with self._reporting_failure(endpoint, attempt, elapsed):
+            async with self._get_session().get(
+                url=url,
+                params=query,
+                headers=validators.headers() if validators else None,
+            ) as response:
+                body = await self._read_body(response, key, validators)
+                status = response.status
+        self._report_response(
+            RequestEvent(endpoint, attempt, status, _body_size(status, body), elapsed())
+        )
+        return body
+
+    async def _read_body(
+        self, response: ClientResponse, key: str, validators: Optional[Validators]
+    ) -> bytes:
+        """
+        Read response body, reusing the stored one when not modified.
+
+        :param response: Response received
+        :param key: Request key
+        :param validators: Validators sent with request
+        :return: Response body
+        """
+        response.raise_for_status()
+        self.rate_limiter.update(response.headers)
+        if response.status == HTTPStatus.NOT_MODIFIED and validators:
+            self.validators.revalidated += 1  # type: ignore
+            return validators.body
+        body = await response.read()
+        if self.validators is not None:
+            self.validators.set(key, response.headers, body)
+        return body
+
+    @contextmanager
+    def _reporting_failure(
+        self, endpoint: EndPoint, attempt: int, network_time: Callable[[], float]
+    ) -> Iterator[None]:
+        """
+        Report a failed request to hooks before letting its error through.
+
+        :param endpoint: ME endpoint targeted
+        :param attempt: Number of previous attempts
+        :param network_time: Gives seconds spent on the request so far
+        :yield: Nothing
+        :raises REQUEST_ERRORS: If the request failed or timed out
+        """
+        try:
+            yield
+        except REQUEST_ERRORS as error:
+            status = getattr(error, "status", None)
+            self._report_response(
+                RequestEvent(
+                    endpoint,
+                    attempt,
+                    status,
+                    network_time=network_time(),
+                    error=error,
+                )
+            )
+            raise
+
+    def _report_response(self, event: RequestEvent) -> None:
+        """
+        Notify hooks of a response, successful or not.
+
+        :param event: Endpoint, attempt, status, body size, network time and
+            error of failed requests
+        """
+        self._emit("on_response", event)
+
+    def _emit(self, event_name: str, event: RequestEvent) -> None:
+        """
+        Notify hooks of request event.
+
+        :param event_name: Name of hook method
+        :param event: Request event
+        """
+        for hook in self.hooks:
+            getattr(hook, event_name)(event)
+
+    def _get_session(self) -> ClientSession:
+        """
+        Get session, creating it on first use inside the running loop.
+
+        :return: Client session
+        """
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = self._session_config.create_session()
+        return self._session
+
+    def _backoff(self, error: ClientResponseError, attempt: int) -> float:
+        """
+        Compute delay before retrying a failed request.
+
+        :param error: Error raised for failed response
+        :param attempt: Number of previous attempts
+        :return: Seconds to wait
+        """
+        header = error.headers.get("Retry-After") if error.headers else None
+        retry_after = parse_retry_after(header)
+        if error.status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.rate_limiter.throttle(retry_after)
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+def _elapsed(started: float) -> float:
+    return time.perf_counter() - started
+
 
-        async with self._session.get(
-            url=f"{self._base_url}/{route}", params=kwargs
-        ) as response:
-            return await response.json()
+def _body_size(status: int, body: bytes) -> int:
+    return 0 if status == HTTPStatus.NOT_MODIFIED else len(body)
@@ -0,0 +1,113 @@
+import asyncio
+import itertools
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+from magicpyden.resilience import cancel_all
+
+
+class BatchResult(NamedTuple):
+    key: str
+    value: Any  # noqa: WPS110
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Determine if key was fetched successfully.
+
+        :return: True if no error was raised
+        """
+        return self.error is None
+
+
+Fetch = Callable[[str], Awaitable[Any]]
+PendingResults = Set["asyncio.Future[BatchResult]"]
+
+
+async def _capture(fetch: Fetch, key: str) -> BatchResult:
+    try:
+        return BatchResult(key, await fetch(key))
+    except Exception as error:  # noqa: B902
+        return BatchResult(key, None, error)
+
+
+def _distinct(keys: Iterable[str]) -> Iterator[str]:
+    """
+    Iterate keys once each, in order of first occurrence.
+
+    :param keys: Keys, possibly repeated
+    :return: Iterator of distinct keys
+    """
+    return iter(dict.fromkeys(keys))
+
+
+def _schedule(
+    fetch: Fetch, remaining: Iterator[str], pending: PendingResults, concurrency: int
+) -> None:
+    """
+    Start fetching remaining keys until ``concurrency`` calls are in flight.
+
+    :param fetch: Coroutine function fetching one key
+    :param remaining: Keys not fetched yet, consumed as calls start
+    :param pending: Calls in flight
+    :param concurrency: Maximum number of calls in flight
+    """
+    for key in itertools.islice(remaining, max(concurrency - len(pending), 0)):
+        pending.add(asyncio.ensure_future(_capture(fetch, key)))
+
+
+async def fetch_many(
+    fetch: Fetch,
+    keys: Iterable[str],
+    concurrency: int,
+) -> AsyncIterator[BatchResult]:
+    """
+    Fetch every distinct key with at most ``concurrency`` calls in flight.
+
+    Errors are reported per key instead of aborting the batch.
+
+    :param fetch: Coroutine function fetching one key
+    :param keys: Keys to fetch, duplicates are fetched once
+    :param concurrency: Maximum number of calls in flight
+    :yield: Result of every key in completion order
+    :raises ValueError: If ``concurrency`` is not positive
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+
+    remaining = _distinct(keys)
+    pending: PendingResults = set()
+    _schedule(fetch, remaining, pending, concurrency)
+    try:  # noqa: WPS501
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            _schedule(fetch, remaining, pending, concurrency)
+            for task in done:
+                yield task.result()
+    finally:
+        await cancel_all(list(pending))
+
+
+async def collect(
+    results: AsyncIterator[BatchResult],  # noqa: WPS110
+) -> Dict[str, BatchResult]:
+    """
+    Gather streamed batch results by key.
+
+    :param results: Streamed batch results
+    :return: Results by key
+    """
+    return {batch_result.key: batch_result async for batch_result in results}
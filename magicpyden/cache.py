@@ -0,0 +1,384 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Type
+
+from magicpyden.constants import DEFAULT_CACHE_SIZE, SQLITE_CACHE_TIMEOUT
+from magicpyden.endpoint import EndPoint
+
+DEFAULT_CACHE_TTLS: Mapping[EndPoint, float] = MappingProxyType(
+    {
+        EndPoint.token_metadata: 3600,
+        EndPoint.collections: 3600,
+        EndPoint.launchpad_collections: 600,
+        EndPoint.collection_stats: 60,
+    }
+)
+
+ParsedEntry = Tuple[Type[Any], Any]
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+_CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS response_cache_accessed_at
+ON response_cache (accessed_at)
+"""
+_EVICT_LEAST_RECENT = """
+DELETE FROM response_cache WHERE key IN (
+    SELECT key FROM response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+)
+"""
+
+
+def make_cache_key(
+    endpoint: EndPoint, args: Tuple[str, ...], query: Mapping[str, str]
+) -> str:
+    """
+    Build cache key from endpoint and request parameters.
+
+    :param endpoint: Targeted endpoint
+    :param args: Path arguments of endpoint
+    :param query: Query parameters
+    :return: Key, independent of parameter order
+    """
+    pairs = sorted(map(_as_strings, query.items()))
+    key_parts = [endpoint.name, list(args), pairs]
+    return json.dumps(key_parts, separators=(",", ":"))
+
+
+def _as_strings(pair: Tuple[Any, Any]) -> Tuple[str, str]:
+    name, param_value = pair
+    return str(name), str(param_value)
+
+
+class CacheBackend(ABC):
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Initialize cache backend.
+
+        :param max_size: Maximum number of entries kept
+        """
+        self.max_size = max_size
+
+    @abstractmethod
+    def get(self, key: str, stale: bool = False) -> Optional[bytes]:
+        """
+        Retrieve unexpired entry.
+
+        :param key: Cache key
+        :param stale: Also return expired entries that were not evicted yet
+        :return: Cached response body, if any
+        """
+
+    @abstractmethod
+    def set(self, key: str, body: bytes, ttl: float) -> None:  # noqa: WPS125
+        """
+        Store entry, evicting the least recently used ones above max size.
+
+        :param key: Cache key
+        :param body: Response body
+        :param ttl: Seconds entry stays valid
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCache(CacheBackend):
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Initialize in-process LRU cache.
+
+        :param max_size: Maximum number of entries kept
+        """
+        super().__init__(max_size)
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: str, stale: bool = False) -> Optional[bytes]:
+        """
+        Retrieve unexpired entry.
+
+        Expired entries are kept until evicted, to be served when stale.
+
+        :param key: Cache key
+        :param stale: Also return expired entries that were not evicted yet
+        :return: Cached response body, if any
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic() and not stale:
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:  # noqa: WPS125
+        """
+        Store entry, evicting the least recently used ones above max size.
+
+        :param key: Cache key
+        :param body: Response body
+        :param ttl: Seconds entry stays valid
+        """
+        self._entries[key] = (time.monotonic() + ttl, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    def __init__(self, path: str, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Initialize on-disk LRU cache, shareable between worker processes.
+
+        The connection may be used from any thread, e.g. the event loop thread
+        of ``MagicEdenSyncClient``, and is guarded by a lock.
+
+        :param path: Path of SQLite database file
+        :param max_size: Maximum number of entries kept
+        """
+        super().__init__(max_size)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=SQLITE_CACHE_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_CREATE_TABLE)
+        self._connection.execute(_CREATE_INDEX)
+
+    def get(self, key: str, stale: bool = False) -> Optional[bytes]:
+        """
+        Retrieve unexpired entry.
+
+        :param key: Cache key
+        :param stale: Also return expired entries that were not evicted yet
+        :return: Cached response body, if any
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body FROM response_cache WHERE key = ? AND expires_at > ?",
+                (key, 0 if stale else now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return row[0]
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:  # noqa: WPS125
+        """
+        Store entry, evicting the least recently used ones above max size.
+
+        :param key: Cache key
+        :param body: Response body
+        :param ttl: Seconds entry stays valid
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?)",
+                (key, body, now + ttl, now),
+            )
+            self._connection.execute(_EVICT_LEAST_RECENT, (self.max_size,))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._connection.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Mapping[EndPoint, float]] = None,
+    ) -> None:
+        """
+        Initialize response cache.
+
+        :param backend: Storage of cached bodies, in-memory by default
+        :param ttls: Seconds responses of each endpoint stay valid, merged with
+            the defaults. Endpoints without a positive TTL are never cached
+        """
+        self.backend = backend or MemoryCache()
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+
+    def is_cached(self, endpoint: EndPoint) -> bool:
+        """
+        Determine if responses of endpoint are cached.
+
+        :param endpoint: Targeted endpoint
+        :return: True if endpoint has a positive TTL
+        """
+        return self.ttls.get(endpoint, 0) > 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve cached response body and count hit or miss.
+
+        :param key: Cache key
+        :return: Cached response body, if any
+        """
+        body = self.backend.get(key)
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    def get_stale(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve cached response body even if expired, without counting it.
+
+        :param key: Cache key
+        :return: Cached response body, if not evicted yet
+        """
+        return self.backend.get(key, stale=True)
+
+    def set(self, endpoint: EndPoint, key: str, body: bytes) -> None:  # noqa: WPS125
+        """
+        Store response body using endpoint TTL.
+
+        :param endpoint: Targeted endpoint
+        :param key: Cache key
+        :param body: Response body
+        """
+        self.backend.set(key, body, self.ttls[endpoint])
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of lookups served from cache.
+
+        :return: Ratio between 0 and 1
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class Validators(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Build conditional request headers.
+
+        :return: ``If-None-Match`` and ``If-Modified-Since`` headers
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Initialize LRU store of response validators and their parsed bodies.
+
+        Objects returned for unchanged responses are shared between callers
+        and should be treated as read-only.
+
+        :param max_size: Maximum number of requests remembered
+        """
+        self.max_size = max_size
+        self.revalidated = 0
+        self._entries: "OrderedDict[str, Validators]" = OrderedDict()
+        self._parsed: Dict[str, ParsedEntry] = {}
+
+    def get(self, key: str) -> Optional[Validators]:
+        """
+        Retrieve validators of request.
+
+        :param key: Request key
+        :return: Validators with response body, if any
+        """
+        validators = self._entries.get(key)
+        if validators is not None:
+            self._entries.move_to_end(key)
+        return validators
+
+    def set(  # noqa: WPS125
+        self, key: str, headers: Mapping[str, str], body: bytes
+    ) -> None:
+        """
+        Remember validators of response, if it has any.
+
+        :param key: Request key
+        :param headers: Response headers
+        :param body: Response body
+        """
+        self._parsed.pop(key, None)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = Validators(etag, last_modified, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._parsed.pop(evicted, None)
+
+    def parsed_for(self, key: str, model: Type[Any], body: bytes) -> Optional[Any]:
+        """
+        Retrieve object previously parsed from the very same response body.
+
+        :param key: Request key
+        :param model: Response model class
+        :param body: Response body
+        :return: Parsed object, if body was already parsed into model
+        """
+        validators = self._entries.get(key)
+        parsed = self._parsed.get(key)
+        if validators is None or validators.body is not body or parsed is None:
+            return None
+        parsed_model, parsed_object = parsed
+        return parsed_object if parsed_model is model else None
+
+    def remember_parsed(
+        self, key: str, model: Type[Any], body: bytes, parsed: Any
+    ) -> None:
+        """
+        Remember object parsed from stored response body.
+
+        :param key: Request key
+        :param model: Response model class
+        :param body: Response body
+        :param parsed: Parsed object
+        """
+        validators = self._entries.get(key)
+        if validators is not None and validators.body is body:
+            self._parsed[key] = (model, parsed)
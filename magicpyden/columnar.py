@@ -0,0 +1,234 @@
+import math
+from array import array
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from magicpyden.constants import MAX_PAGE_LIMIT
+
+MISSING_CODE = -1
+FLOAT_TYPE = "d"
+
+NumericColumns = Dict[str, Tuple[str, str]]
+Row = Mapping[str, Any]
+
+PRICE = "price"
+SELLER = "seller"
+
+
+class StringTable:
+    def __init__(self) -> None:
+        """Initialize table assigning a small integer code to every distinct string."""
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """
+        Count distinct strings.
+
+        :return: Number of distinct strings
+        """
+        return len(self.strings)
+
+    def code(self, string: Any) -> int:
+        """
+        Get code of string, registering it on first sight.
+
+        :param string: String to encode, None is encoded as ``MISSING_CODE``
+        :return: Code of string
+        """
+        if string is None:
+            return MISSING_CODE
+        code = self._codes.get(string)
+        if code is None:
+            code = len(self.strings)
+            self._codes[string] = code
+            self.strings.append(string)
+        return code
+
+    def intern(self, string: str) -> str:
+        """
+        Get the table's copy of string, registering it on first sight.
+
+        :param string: String to intern
+        :return: Equal string shared by every caller
+        """
+        return self.strings[self.code(string)]
+
+
+class ColumnarTable:
+    numeric_columns: ClassVar[NumericColumns] = {}
+    coded_columns: ClassVar[Dict[str, str]] = {}
+    string_columns: ClassVar[Dict[str, str]] = {}
+
+    def __init__(self, strings: Optional[StringTable] = None) -> None:
+        """
+        Initialize empty table built from decoded JSON rows, without models.
+
+        Numeric columns are packed arrays, repeated strings (addresses, types,
+        sources) are stored as codes into a string table.
+
+        :param strings: String table, may be shared between tables
+        """
+        self.strings = strings or StringTable()
+        self.columns: Dict[str, Any] = {}
+        for name, (_, typecode) in self.numeric_columns.items():
+            self.columns[name] = array(typecode)
+        for coded_name in self.coded_columns:
+            self.columns[coded_name] = array("i")
+        for string_name in self.string_columns:
+            self.columns[string_name] = []
+
+    def __len__(self) -> int:
+        """
+        Count rows.
+
+        :return: Number of rows
+        """
+        return len(next(iter(self.columns.values()), ()))
+
+    def extend(self, rows: Iterable[Row]) -> None:
+        """
+        Append decoded JSON rows.
+
+        :param rows: Rows as returned by the API
+        """
+        rows = list(rows)
+        self._extend_numeric(rows)
+        self._extend_coded(rows)
+        self._extend_strings(rows)
+
+    def decode(self, name: str) -> List[Any]:
+        """
+        Convert coded column back to strings.
+
+        :param name: Name of coded column
+        :return: Column values
+        """
+        strings = self.strings.strings
+        return [
+            None if code == MISSING_CODE else strings[code]
+            for code in self.columns[name]
+        ]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Expose columns as NumPy arrays. Requires ``numpy``.
+
+        Numeric and coded columns are copied in one block each, so the table can
+        keep growing afterwards.
+
+        :return: Arrays by column name, coded columns hold string table codes
+        """
+        import numpy  # noqa: WPS433
+
+        arrays: Dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                arrays[name] = numpy.frombuffer(column, dtype=column.typecode).copy()
+            else:
+                arrays[name] = numpy.array(column, dtype=object)
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """
+        Convert table to Arrow with dictionary coded columns. Requires ``pyarrow``.
+
+        :return: Arrow table
+        """
+        import pyarrow  # noqa: WPS433
+
+        dictionary = pyarrow.array(self.strings.strings, type=pyarrow.string())
+        arrays = {}
+        for name, column in self.columns.items():
+            if name in self.coded_columns:
+                codes = pyarrow.array(
+                    [None if code == MISSING_CODE else code for code in column],
+                    type=pyarrow.int32(),
+                )
+                arrays[name] = pyarrow.DictionaryArray.from_arrays(codes, dictionary)
+            else:
+                arrays[name] = pyarrow.array(column)
+        return pyarrow.table(arrays)
+
+    def _extend_numeric(self, rows: List[Row]) -> None:
+        for name, (key, typecode) in self.numeric_columns.items():
+            missing = math.nan if typecode == FLOAT_TYPE else 0
+            self.columns[name].extend(
+                missing if row.get(key) is None else row[key] for row in rows
+            )
+
+    def _extend_coded(self, rows: List[Row]) -> None:
+        code = self.strings.code
+        for name, key in self.coded_columns.items():
+            codes = (code(row.get(key)) for row in rows)
+            self.columns[name].extend(codes)
+
+    def _extend_strings(self, rows: List[Row]) -> None:
+        for name, key in self.string_columns.items():
+            self.columns[name].extend(row.get(key) for row in rows)
+
+
+TableT = TypeVar("TableT", bound=ColumnarTable)
+
+
+class ActivityTable(ColumnarTable):
+    numeric_columns = {
+        PRICE: (PRICE, FLOAT_TYPE),
+        "slot": ("slot", "q"),
+        "block_time": ("blockTime", "q"),
+    }
+    coded_columns = {
+        "type": "type",
+        "source": "source",
+        "collection": "collection",
+        "token_mint": "tokenMint",
+        "buyer": "buyer",
+        SELLER: SELLER,
+    }
+    string_columns = {"signature": "signature"}
+
+
+class ListingTable(ColumnarTable):
+    numeric_columns = {
+        PRICE: (PRICE, FLOAT_TYPE),
+        "token_size": ("tokenSize", "q"),
+    }
+    coded_columns = {
+        SELLER: SELLER,
+        "auction_house": "auctionHouse",
+        "token_mint": "tokenMint",
+    }
+    string_columns = {
+        "token_address": "tokenAddress",
+        "pda_address": "pdaAddress",
+    }
+
+
+async def build_table(table: TableT, rows: AsyncIterator[Row]) -> TableT:
+    """
+    Append streamed rows to table.
+
+    Rows are appended a page at a time, column by column.
+
+    :param table: Table to fill
+    :param rows: Decoded JSON rows, e.g. from paginated fetchers
+    :return: Filled table
+    """
+    pending: List[Row] = []
+    async for row in rows:
+        pending.append(row)
+        if len(pending) == MAX_PAGE_LIMIT:
+            table.extend(pending)
+            pending = []
+    table.extend(pending)
+    return table
@@ -0,0 +1,220 @@
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from magicpyden.columnar import StringTable
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+ADDRESS_SIZE = 32
+BASE58 = len(BASE58_ALPHABET)
+
+SYMBOL_FIELDS = frozenset(("collection", "collection_symbol"))
+REPEATED_ADDRESS_FIELDS = frozenset(
+    (
+        "auction_house",
+        "buyer",
+        "seller",
+        "buyer_referral",
+        "seller_referral",
+        "owner",
+        "update_authority",
+        "buyer_escrow",
+    )
+)
+UNIQUE_ADDRESS_FIELDS = frozenset(
+    ("token_mint", "token_address", "pda_address", "mint_address", "delegate")
+)
+
+_BASE58_DIGITS = {char: digit for digit, char in enumerate(BASE58_ALPHABET)}
+
+
+def b58decode(encoded: str) -> bytes:
+    """
+    Decode base58 string.
+
+    :param encoded: Base58 string
+    :return: Decoded bytes
+    :raises ValueError: If string has characters outside the alphabet
+    """
+    number = 0
+    for char in encoded:
+        digit = _BASE58_DIGITS.get(char)
+        if digit is None:
+            raise ValueError(f"invalid base58 character {char!r}")
+        number = number * BASE58 + digit
+    leading_zeros = len(encoded) - len(encoded.lstrip(BASE58_ALPHABET[0]))
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return bytes(leading_zeros) + body
+
+
+def b58encode(decoded: bytes) -> str:
+    """
+    Encode bytes as base58.
+
+    :param decoded: Bytes to encode
+    :return: Base58 string
+    """
+    number = int.from_bytes(decoded, "big")
+    chars: List[str] = []
+    while number:
+        number, digit = divmod(number, BASE58)
+        chars.append(BASE58_ALPHABET[digit])
+    leading_zeros = len(decoded) - len(decoded.lstrip(b"\0"))
+    return BASE58_ALPHABET[0] * leading_zeros + "".join(reversed(chars))
+
+
+class Address(bytes):  # noqa: WPS600
+    """Solana address stored as its 32 decoded bytes. ``str()`` gives base58."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_base58(cls, encoded: str) -> "Address":
+        """
+        Decode base58 address.
+
+        :param encoded: Base58 address
+        :return: Address
+        :raises ValueError: If string is not a 32 byte base58 value
+        """
+        decoded = b58decode(encoded)
+        if len(decoded) != ADDRESS_SIZE:
+            raise ValueError(f"{encoded!r} is not a {ADDRESS_SIZE} byte address")
+        return cls(decoded)
+
+    def __str__(self) -> str:
+        """
+        Encode address as base58.
+
+        :return: Base58 address
+        """
+        return b58encode(self)
+
+    def __repr__(self) -> str:
+        """
+        Represent address.
+
+        :return: Constructor-like representation
+        """
+        return f"Address('{self}')"
+
+
+class ActivityType(str, Enum):  # noqa: WPS600
+    listed = "list"
+    delisted = "delist"
+    buy_now = "buyNow"
+    bid = "bid"
+    cancel_bid = "cancelBid"
+
+    def __str__(self) -> str:
+        """
+        Use value as string.
+
+        :return: Activity type as sent by the API
+        """
+        return self.value
+
+
+class ActivitySource(str, Enum):  # noqa: WPS600
+    magiceden = "magiceden"
+    magiceden_v2 = "magiceden_v2"
+    tensor = "tensor"
+
+    def __str__(self) -> str:
+        """
+        Use value as string.
+
+        :return: Activity source as sent by the API
+        """
+        return self.value
+
+
+_ACTIVITY_TYPES = MappingProxyType({member.value: member for member in ActivityType})
+_ACTIVITY_SOURCES = MappingProxyType(
+    {member.value: member for member in ActivitySource}
+)
+
+FieldConverter = Callable[[Any], Any]
+FieldPlan = List[Tuple[str, FieldConverter]]
+
+
+class CompactMode:
+    def __init__(
+        self, strings: Optional[StringTable] = None, decode_addresses: bool = False
+    ) -> None:
+        """
+        Initialize compaction of parsed models, shared by every request of a client.
+
+        Repeated strings (collections, auction houses, wallets) are interned
+        through one string table, activity types and sources become enums.
+        The table lives as long as the client, so use one per job.
+
+        :param strings: String table, a new one by default
+        :param decode_addresses: Store addresses as 32 byte ``Address`` values
+        """
+        self.strings = strings or StringTable()
+        self.decode_addresses = decode_addresses
+        self._addresses: Dict[str, Any] = {}
+        self._plans: Dict[Type[BaseModel], FieldPlan] = {}
+
+    def apply(self, parsed: Any) -> Any:
+        """
+        Compact parsed models in place.
+
+        :param parsed: Model or list of models
+        :return: The same model or list
+        """
+        models = parsed if isinstance(parsed, list) else [parsed]
+        for model in models:
+            if isinstance(model, BaseModel):
+                self._compact(model)
+        return parsed
+
+    def _compact(self, model: BaseModel) -> None:
+        plan = self._plans.get(type(model))
+        if plan is None:
+            plan = self._plan(type(model))
+            self._plans[type(model)] = plan
+        field_values = model.__dict__
+        for name, convert in plan:
+            field_value = field_values[name]
+            if isinstance(field_value, str):
+                field_values[name] = convert(field_value)
+
+    def _plan(self, model: Type[BaseModel]) -> FieldPlan:
+        intern = self.strings.intern
+        repeated_address = self._shared_address if self.decode_addresses else intern
+        converters: Dict[str, FieldConverter] = {
+            "type": self._activity_type,
+            "source": self._activity_source,
+            **dict.fromkeys(SYMBOL_FIELDS, intern),
+            **dict.fromkeys(REPEATED_ADDRESS_FIELDS, repeated_address),
+        }
+        if self.decode_addresses:
+            converters.update(dict.fromkeys(UNIQUE_ADDRESS_FIELDS, self._address))
+        return [
+            (name, converter)
+            for name, converter in converters.items()
+            if name in model.__fields__
+        ]
+
+    def _activity_type(self, activity_type: str) -> Any:
+        return _ACTIVITY_TYPES.get(activity_type) or self.strings.intern(activity_type)
+
+    def _activity_source(self, source: str) -> Any:
+        return _ACTIVITY_SOURCES.get(source) or self.strings.intern(source)
+
+    def _shared_address(self, encoded: str) -> Any:
+        address = self._addresses.get(encoded)
+        if address is None:
+            address = self._address(encoded)
+            self._addresses[encoded] = address
+        return address
+
+    def _address(self, encoded: str) -> Any:
+        try:
+            return Address.from_base58(encoded)
+        except ValueError:
+            return self.strings.intern(encoded)
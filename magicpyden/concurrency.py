@@ -0,0 +1,211 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Mapping, Optional
+
+from magicpyden.constants import (
+    ADAPTIVE_DECREASE_FACTOR,
+    ADAPTIVE_INITIAL_LIMIT,
+    ADAPTIVE_LATENCY_SMOOTHING,
+    ADAPTIVE_LATENCY_TOLERANCE,
+    ADAPTIVE_MAX_LIMIT,
+    ADAPTIVE_MIN_LIMIT,
+    ADAPTIVE_RECENT_LATENCY_SMOOTHING,
+)
+from magicpyden.endpoint import EndPoint
+from magicpyden.hooks import RequestEvent, RequestHook
+from magicpyden.resilience import is_upstream_failure
+
+EndpointOptions = Mapping[EndPoint, Mapping[str, Any]]
+
+
+def is_overload(event: RequestEvent) -> bool:
+    """
+    Determine if a response signals an overloaded upstream.
+
+    :param event: Response event
+    :return: True for throttled, server error, connection and timeout errors,
+        like failures counted by the circuit breaker
+    """
+    return event.error is not None and is_upstream_failure(event.error)
+
+
+class AimdLimit:
+    def __init__(  # noqa: WPS211
+        self,
+        initial_limit: int = ADAPTIVE_INITIAL_LIMIT,
+        min_limit: int = ADAPTIVE_MIN_LIMIT,
+        max_limit: int = ADAPTIVE_MAX_LIMIT,
+        decrease_factor: float = ADAPTIVE_DECREASE_FACTOR,
+        latency_tolerance: float = ADAPTIVE_LATENCY_TOLERANCE,
+    ) -> None:
+        """
+        Initialize limit of requests in flight adjusted by AIMD.
+
+        The limit follows additive increase, multiplicative decrease.
+
+        Every healthy response raises the limit by ``1 / limit``, about one
+        slot per round of requests. An overload, or recent latency above
+        ``latency_tolerance`` times the long-term latency, cuts it by
+        ``decrease_factor``, at most once per long-term latency.
+
+        :param initial_limit: Requests in flight allowed at first
+        :param min_limit: Lowest limit
+        :param max_limit: Highest limit
+        :param decrease_factor: Factor applied to the limit on overload
+        :param latency_tolerance: Ratio of recent to long-term latency seen as
+            a spike
+        :raises ValueError: If limits are not ordered or below 1
+        """
+        if min_limit < 1 or initial_limit < min_limit or max_limit < initial_limit:
+            raise ValueError("limits must satisfy 1 <= min <= initial <= max")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self._recent_latency: Optional[float] = None
+        self._limit = float(initial_limit)
+        self._decreased_at: float = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def limit(self) -> int:
+        """
+        Current number of requests allowed in flight.
+
+        :return: Limit
+        """
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request may be sent.
+
+        :raises asyncio.CancelledError: If cancelled while waiting, the slot
+            is handed over or given back
+        """
+        if not self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free slot of a finished request."""
+        self.in_flight -= 1
+        self._wake()
+
+    def observe(self, latency: float, overloaded: bool) -> None:
+        """
+        Adjust limit from the outcome of a request.
+
+        :param latency: Network time of request
+        :param overloaded: Request was throttled or failed upstream
+        """
+        if overloaded:
+            self._decrease()
+            return
+        if self.latency is None or self._recent_latency is None:
+            self.latency = latency
+            self._recent_latency = latency
+        else:
+            self.latency += (latency - self.latency) * ADAPTIVE_LATENCY_SMOOTHING
+            self._recent_latency += (
+                latency - self._recent_latency
+            ) * ADAPTIVE_RECENT_LATENCY_SMOOTHING
+        if self._recent_latency > self.latency * self.latency_tolerance:
+            self._decrease()
+            return
+        self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+        self._wake()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._decreased_at < (self.latency or 0):
+            return
+        self._decreased_at = now
+        self._limit = max(self._limit * self.decrease_factor, self.min_limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class AdaptiveConcurrency(RequestHook):
+    def __init__(
+        self,
+        endpoint_options: Optional[EndpointOptions] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Initialize per-endpoint concurrency limits adapting to observed responses.
+
+        :param endpoint_options: Arguments of ``AimdLimit`` for given endpoints,
+            merged with the common ones
+        :param options: Arguments of ``AimdLimit`` common to every endpoint
+        """
+        self.endpoint_options = dict(endpoint_options or {})
+        self.options = options
+        self._limiters: Dict[EndPoint, AimdLimit] = {}
+
+    def limiter(self, endpoint: EndPoint) -> AimdLimit:
+        """
+        Get limit of endpoint, creating it on first use.
+
+        :param endpoint: Targeted endpoint
+        :return: Concurrency limit
+        """
+        limiter = self._limiters.get(endpoint)
+        if limiter is None:
+            limiter = AimdLimit(
+                **{**self.options, **self.endpoint_options.get(endpoint, {})}
+            )
+            self._limiters[endpoint] = limiter
+        return limiter
+
+    @property
+    def limits(self) -> Dict[EndPoint, int]:
+        """
+        Current limit of every endpoint requested so far.
+
+        :return: Requests allowed in flight by endpoint
+        """
+        return {endpoint: limiter.limit for endpoint, limiter in self._limiters.items()}
+
+    @asynccontextmanager
+    async def slot(self, endpoint: EndPoint) -> AsyncIterator[None]:
+        """
+        Hold a slot of endpoint while sending one request.
+
+        :param endpoint: Targeted endpoint
+        :yield: Nothing, once the request may be sent
+        """
+        limiter = self.limiter(endpoint)
+        await limiter.acquire()
+        try:
+            yield
+        finally:
+            limiter.release()
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Adjust limit of endpoint from response.
+
+        :param event: Endpoint, attempt, status, body size and network time
+        """
+        self.limiter(event.endpoint).observe(event.network_time, is_overload(event))
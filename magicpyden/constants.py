@@ -1 +1,74 @@
 LAMPORTS_PER_SOL = 1000000000
+
+MAX_PAGE_LIMIT = 500
+MAX_COLLECTION_LISTINGS_LIMIT = 20
+DEFAULT_PREFETCH = 3
+
+DEFAULT_RATE_LIMIT = 2.0
+DEFAULT_BURST = 10
+RATE_LIMIT_FLOOR = 0.1
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+RATE_LIMIT_RECOVERY_STEP = 0.05
+
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30.0
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 50
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_TOTAL_TIMEOUT = 60.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+DEFAULT_CACHE_SIZE = 10000
+SQLITE_CACHE_TIMEOUT = 30.0
+
+DEFAULT_BATCH_CONCURRENCY = 16
+
+DEFAULT_SYNC_PAGE_SIZE = 100
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+MEDIAN_QUANTILE = 0.5
+TAIL_QUANTILE = 0.99
+
+WATCHER_MIN_INTERVAL = 1.0
+WATCHER_MAX_INTERVAL = 60.0
+WATCHER_BACKOFF_FACTOR = 1.5
+
+SALE_ACTIVITY_TYPES = ("buyNow",)
+
+DEFAULT_CRAWL_CONCURRENCY = 8
+
+BULK_CONCURRENCY_SHARE = 0.5
+BULK_RATE_SHARE = 0.5
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30.0
+HEDGE_QUANTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+
+STREAM_CHUNK_SIZE = 65536
+
+ADAPTIVE_INITIAL_LIMIT = 4
+ADAPTIVE_MIN_LIMIT = 1
+ADAPTIVE_MAX_LIMIT = 64
+ADAPTIVE_DECREASE_FACTOR = 0.5
+ADAPTIVE_LATENCY_TOLERANCE = 2.0
+ADAPTIVE_LATENCY_SMOOTHING = 0.05
+ADAPTIVE_RECENT_LATENCY_SMOOTHING = 0.5
@@ -0,0 +1,322 @@
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, TextIO, Union
+
+from magicpyden.api import BASE_URL, MagicEdenApi
+from magicpyden.batch import fetch_many
+from magicpyden.constants import (
+    DEFAULT_BURST,
+    DEFAULT_CRAWL_CONCURRENCY,
+    DEFAULT_RATE_LIMIT,
+    MAX_PAGE_LIMIT,
+)
+from magicpyden.ratelimit import RateLimiter
+
+SHARD_PATTERN = "shard-*.ndjson"
+SYMBOL_FIELD = "symbol"
+JSON_FIELDS = ("stats", "listings")
+
+_RATE, _TOKENS, _UPDATED_AT, _PAUSED_UNTIL = range(4)
+
+_worker: Dict[str, Any] = {}
+
+
+class SharedRateLimiter(RateLimiter):
+    """Token bucket kept in shared memory, one budget for every worker process."""
+
+    def __init__(
+        self, rate: float = DEFAULT_RATE_LIMIT, burst: int = DEFAULT_BURST
+    ) -> None:
+        """
+        Initialize token bucket to hand to worker processes when they start.
+
+        :param rate: Sustained requests per second of all processes together
+        :param burst: Maximum number of requests sent back to back
+        """
+        self._state = multiprocessing.Array("d", 4)
+        super().__init__(rate, burst)
+
+    @property
+    def rate(self) -> float:
+        """
+        Current requests per second of all processes together.
+
+        :return: Requests per second
+        """
+        return self._state[_RATE]
+
+    @rate.setter
+    def rate(self, new_rate: float) -> None:
+        self._state[_RATE] = new_rate
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold back every request of every process for the given number of seconds.
+
+        :param delay: Seconds to wait before the next request
+        """
+        with self._state.get_lock():
+            super().pause(delay)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slow down every process after the server rejected a request.
+
+        :param retry_after: Seconds the server asked to wait
+        """
+        with self._state.get_lock():
+            super().throttle(retry_after)
+
+    def update(self, headers: Any) -> None:
+        """
+        Adjust pace of every process from rate-limit headers.
+
+        :param headers: Response headers
+        """
+        with self._state.get_lock():
+            super().update(headers)
+
+    @property
+    def _tokens(self) -> float:
+        return self._state[_TOKENS]
+
+    @_tokens.setter
+    def _tokens(self, tokens: float) -> None:
+        self._state[_TOKENS] = tokens
+
+    @property
+    def _updated_at(self) -> float:
+        return self._state[_UPDATED_AT]
+
+    @_updated_at.setter
+    def _updated_at(self, updated_at: float) -> None:
+        self._state[_UPDATED_AT] = updated_at
+
+    @property
+    def _paused_until(self) -> float:
+        return self._state[_PAUSED_UNTIL]
+
+    @_paused_until.setter
+    def _paused_until(self, paused_until: float) -> None:
+        self._state[_PAUSED_UNTIL] = paused_until
+
+    def _reserve(self) -> float:
+        with self._state.get_lock():
+            return super()._reserve()
+
+
+class CrawlOptions(NamedTuple):
+    base_url: str = BASE_URL
+    concurrency: int = DEFAULT_CRAWL_CONCURRENCY
+    trusted: bool = False
+
+
+class ShardResult(NamedTuple):
+    shard: int
+    written: int
+    failed: List[str]
+
+
+def read_checkpoint(path: Path) -> Set[str]:
+    """
+    Find collections already written to a shard file.
+
+    A partly written last line, left by an interrupted crawl, is truncated.
+
+    :param path: Path of NDJSON shard file
+    :return: Collection symbols
+    """
+    symbols: Set[str] = set()
+    complete = 0
+    with path.open("rb+") as shard_file:
+        for line in shard_file:
+            if not line.endswith(b"\n"):
+                break
+            symbols.add(json.loads(line)[SYMBOL_FIELD])
+            complete += len(line)
+        shard_file.truncate(complete)
+    return symbols
+
+
+async def list_collections(
+    options: CrawlOptions, rate_limiter: RateLimiter
+) -> List[str]:
+    """
+    Retrieve symbols of every collection.
+
+    :param options: Crawl options
+    :param rate_limiter: Rate limiter of the listing requests
+    :return: Collection symbols
+    """
+    async with MagicEdenApi(
+        base_url=options.base_url, rate_limiter=rate_limiter, trusted=options.trusted
+    ) as api:
+        return [
+            collection.symbol
+            async for collection in api.iter_collections(limit=MAX_PAGE_LIMIT)
+        ]
+
+
+async def crawl_collection(api: MagicEdenApi, symbol: str) -> str:
+    """
+    Snapshot stats and listings of one collection.
+
+    :param api: Magic Eden API object
+    :param symbol: Collection symbol
+    :return: NDJSON line
+    """
+    stats = await api.get_collection_stats(symbol)
+    listings = [
+        listing.dict() async for listing in api.iter_collection_listings(symbol)
+    ]
+    record = {SYMBOL_FIELD: symbol, "stats": stats.dict(), "listings": listings}
+    line = json.dumps(record, default=str)
+    return f"{line}\n"
+
+
+def crawl_shard(
+    shard: int, symbols: List[str], path: Path, options: CrawlOptions
+) -> ShardResult:
+    """
+    Crawl collections of one shard with its own event loop and session.
+
+    :param shard: Index of shard
+    :param symbols: Collection symbols of shard
+    :param path: Path of NDJSON shard file, appended to
+    :param options: Crawl options
+    :return: Number of written and symbols of failed collections
+    """
+    return asyncio.run(_crawl_shard(shard, symbols, path, options))
+
+
+async def _crawl_shard(
+    shard: int, symbols: List[str], path: Path, options: CrawlOptions
+) -> ShardResult:
+    async with MagicEdenApi(
+        base_url=options.base_url,
+        rate_limiter=_worker.get("rate_limiter"),
+        trusted=options.trusted,
+    ) as api:
+        with path.open("a") as shard_file:
+            failed = await _write_records(api, symbols, shard_file, options.concurrency)
+    return ShardResult(shard, len(symbols) - len(failed), failed)
+
+
+async def _write_records(
+    api: MagicEdenApi, symbols: List[str], shard_file: TextIO, concurrency: int
+) -> List[str]:
+    failed: List[str] = []
+    crawled = fetch_many(partial(crawl_collection, api), symbols, concurrency)
+    async for outcome in crawled:
+        if outcome.ok:
+            shard_file.write(outcome.value)
+            shard_file.flush()
+        else:
+            failed.append(outcome.key)
+    return failed
+
+
+def _init_worker(rate_limiter: SharedRateLimiter) -> None:
+    _worker["rate_limiter"] = rate_limiter
+
+
+def crawl(  # noqa: WPS211
+    output_dir: Union[str, Path],
+    workers: Optional[int] = None,
+    rate: float = DEFAULT_RATE_LIMIT,
+    burst: int = DEFAULT_BURST,
+    options: Optional[CrawlOptions] = None,
+) -> List[ShardResult]:
+    """
+    Snapshot stats and listings of every collection across worker processes.
+
+    Collections already present in the output directory are skipped, so an
+    interrupted crawl resumes where it stopped.
+
+    :param output_dir: Directory of NDJSON shard files
+    :param workers: Number of worker processes, one per core by default
+    :param rate: Requests per second shared by every worker
+    :param burst: Maximum number of requests sent back to back
+    :param options: Crawl options of every worker, defaults of
+        ``CrawlOptions`` if missing
+    :return: Result of every shard
+    """
+    options = options or CrawlOptions()
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    symbols = asyncio.run(list_collections(options, RateLimiter(rate, burst)))
+    return _crawl_shards(
+        _skip_crawled(symbols, output),
+        output,
+        workers or multiprocessing.cpu_count(),
+        SharedRateLimiter(rate, burst),
+        options,
+    )
+
+
+def _crawl_shards(
+    symbols: List[str],
+    output: Path,
+    workers: int,
+    rate_limiter: SharedRateLimiter,
+    options: CrawlOptions,
+) -> List[ShardResult]:
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(rate_limiter,)
+    ) as pool:
+        futures = [
+            pool.submit(
+                crawl_shard,
+                shard,
+                symbols[shard::workers],
+                output / f"shard-{shard}.ndjson",
+                options,
+            )
+            for shard in range(workers)
+        ]
+        return [future.result() for future in futures]
+
+
+def _skip_crawled(symbols: List[str], output: Path) -> List[str]:
+    done: Set[str] = set()
+    for path in output.glob(SHARD_PATTERN):
+        done |= read_checkpoint(path)
+    return [symbol for symbol in dict.fromkeys(symbols) if symbol not in done]
+
+
+def export_parquet(output_dir: Union[str, Path], path: Union[str, Path]) -> int:
+    """
+    Convert NDJSON shard files into one Parquet file. Requires ``pyarrow``.
+
+    Stats and listings are kept as JSON strings since their fields vary.
+
+    :param output_dir: Directory of NDJSON shard files
+    :param path: Path of Parquet file
+    :return: Number of collections written
+    """
+    from pyarrow import Table, parquet, schema, string  # noqa: WPS433
+
+    record_schema = schema([(name, string()) for name in (SYMBOL_FIELD, *JSON_FIELDS)])
+    count = 0
+    with parquet.ParquetWriter(str(path), record_schema) as writer:
+        for shard_path in sorted(Path(output_dir).glob(SHARD_PATTERN)):
+            rows = _read_parquet_rows(shard_path)
+            writer.write_table(Table.from_pylist(rows, schema=record_schema))
+            count += len(rows)
+    return count
+
+
+def _read_parquet_rows(path: Path) -> List[Dict[str, str]]:
+    with path.open() as shard_file:
+        return [_parquet_row(line) for line in shard_file]
+
+
+def _parquet_row(line: str) -> Dict[str, str]:
+    record = json.loads(line)
+    row = {name: json.dumps(record[name]) for name in JSON_FIELDS}
+    row[SYMBOL_FIELD] = record[SYMBOL_FIELD]
+    return row
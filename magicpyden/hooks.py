@@ -0,0 +1,260 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, NamedTuple, Optional, Sequence
+
+from magicpyden.constants import LATENCY_BUCKETS, MEDIAN_QUANTILE, TAIL_QUANTILE
+from magicpyden.endpoint import EndPoint
+
+
+class RequestEvent(NamedTuple):
+    endpoint: EndPoint
+    attempt: int = 0
+    status: Optional[int] = None
+    size: int = 0
+    network_time: float = 0
+    parse_time: float = 0
+    error: Optional[BaseException] = None
+
+
+class RequestHook:
+    """Observer of requests sent by ``MagicEdenApi``. Override any event."""
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """
+        Handle request about to be sent.
+
+        :param event: Endpoint and attempt
+        """
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Handle response received, successful or not.
+
+        :param event: Endpoint, attempt, status, body size and network time
+        """
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """
+        Handle failed request about to be retried.
+
+        :param event: Endpoint, failed attempt, status and error
+        """
+
+    def on_parse_done(self, event: RequestEvent) -> None:
+        """
+        Handle response body decoded and built into models.
+
+        :param event: Endpoint, body size and parse time
+        """
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """
+        Initialize histogram of durations.
+
+        :param buckets: Sorted upper bounds of buckets in seconds
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0 for _ in range(len(self.buckets) + 1)]
+        self.count = 0
+        self.total: float = 0
+
+    def observe(self, duration: float) -> None:
+        """
+        Record duration.
+
+        :param duration: Duration in seconds
+        """
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    def quantile(self, share: float) -> float:
+        """
+        Estimate quantile as the upper bound of the bucket holding it.
+
+        :param share: Quantile between 0 and 1, e.g. 0.99
+        :return: Duration in seconds, infinite if it exceeds every bucket
+        """
+        rank = share * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return (
+                    self.buckets[index] if index < len(self.buckets) else float("inf")
+                )
+        return 0
+
+    @property
+    def mean(self) -> float:
+        """
+        Average duration.
+
+        :return: Duration in seconds
+        """
+        return self.total / self.count if self.count else 0
+
+
+class EndpointMetrics:  # noqa: WPS230
+    def __init__(self) -> None:
+        """Initialize counters and histograms of one endpoint."""
+        self.requests = 0
+        self.responses = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.statuses: DefaultDict[int, int] = defaultdict(int)
+        self.network_time = LatencyHistogram()
+        self.parse_time = LatencyHistogram()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize counters and latency percentiles.
+
+        :return: Metrics by name
+        """
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "statuses": dict(self.statuses),
+            "network_p50": self.network_time.quantile(MEDIAN_QUANTILE),
+            "network_p99": self.network_time.quantile(TAIL_QUANTILE),
+            "parse_p50": self.parse_time.quantile(MEDIAN_QUANTILE),
+            "parse_p99": self.parse_time.quantile(TAIL_QUANTILE),
+        }
+
+
+class MetricsCollector(RequestHook):
+    def __init__(self) -> None:
+        """Initialize in-process collector of per-endpoint metrics."""
+        self.endpoints: DefaultDict[EndPoint, EndpointMetrics] = defaultdict(
+            EndpointMetrics
+        )
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """
+        Count request.
+
+        :param event: Endpoint and attempt
+        """
+        self.endpoints[event.endpoint].requests += 1
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Count response and record its network time.
+
+        :param event: Endpoint, attempt, status, body size and network time
+        """
+        metrics = self.endpoints[event.endpoint]
+        metrics.responses += 1
+        metrics.bytes_received += event.size
+        if event.status is not None:
+            metrics.statuses[event.status] += 1
+        if event.error is not None:
+            metrics.errors += 1
+        metrics.network_time.observe(event.network_time)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """
+        Count retry.
+
+        :param event: Endpoint, failed attempt, status and error
+        """
+        self.endpoints[event.endpoint].retries += 1
+
+    def on_parse_done(self, event: RequestEvent) -> None:
+        """
+        Record parse time.
+
+        :param event: Endpoint, body size and parse time
+        """
+        self.endpoints[event.endpoint].parse_time.observe(event.parse_time)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize metrics of every endpoint.
+
+        :return: Metrics by endpoint name
+        """
+        return {
+            endpoint.name: metrics.summary()
+            for endpoint, metrics in self.endpoints.items()
+        }
+
+
+class PrometheusHook(RequestHook):
+    def __init__(self, registry: Any = None, prefix: str = "magicpyden") -> None:
+        """
+        Export metrics with ``prometheus_client``, which must be installed.
+
+        :param registry: Collector registry, the default registry if omitted
+        :param prefix: Prefix of metric names
+        """
+        from prometheus_client import REGISTRY, Counter, Histogram  # noqa: WPS433
+
+        registry = registry or REGISTRY
+        labels: List[str] = ["endpoint"]
+        self.requests = Counter(
+            f"{prefix}_requests", "Requests sent", labels, registry=registry
+        )
+        self.responses = Counter(
+            f"{prefix}_responses",
+            "Responses received",
+            [*labels, "status"],
+            registry=registry,
+        )
+        self.retries = Counter(
+            f"{prefix}_retries", "Requests retried", labels, registry=registry
+        )
+        self.network_time = Histogram(
+            f"{prefix}_network_seconds",
+            "Network time of requests",
+            labels,
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.parse_time = Histogram(
+            f"{prefix}_parse_seconds",
+            "Decode and model building time of responses",
+            labels,
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """
+        Count request.
+
+        :param event: Endpoint and attempt
+        """
+        self.requests.labels(event.endpoint.name).inc()
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Count response and record its network time.
+
+        :param event: Endpoint, attempt, status, body size and network time
+        """
+        self.responses.labels(event.endpoint.name, str(event.status)).inc()
+        self.network_time.labels(event.endpoint.name).observe(event.network_time)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """
+        Count retry.
+
+        :param event: Endpoint, failed attempt, status and error
+        """
+        self.retries.labels(event.endpoint.name).inc()
+
+    def on_parse_done(self, event: RequestEvent) -> None:
+        """
+        Record parse time.
+
+        :param event: Endpoint, body size and parse time
+        """
+        self.parse_time.labels(event.endpoint.name).observe(event.parse_time)
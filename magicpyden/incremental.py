@@ -0,0 +1,222 @@
+import sqlite3
+from itertools import count
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+from pydantic import BaseModel
+
+from magicpyden.api import MagicEdenApi
+from magicpyden.constants import DEFAULT_SYNC_PAGE_SIZE
+from magicpyden.schema import (
+    CollectionActivityItem,
+    TokenActivityItem,
+    WalletActivityItem,
+)
+
+ActivityFetcher = Callable[..., Awaitable[List[Any]]]
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    mark TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+)
+"""
+
+
+class HighWaterMark(BaseModel):
+    slot: int
+    block_time: int
+    signatures: List[str]
+
+    def has_seen(self, activity: Any) -> bool:
+        """
+        Determine if activity was already synced.
+
+        :param activity: Activity item
+        :return: True if activity is not newer than the mark
+        """
+        if activity.slot == self.slot:
+            return activity.signature in self.signatures
+        return activity.slot < self.slot
+
+    def advance(self, activities: List[Any]) -> "HighWaterMark":
+        """
+        Move mark to newest of new activities.
+
+        :param activities: New activities
+        :return: Updated mark
+        """
+        newest = max(activities, key=lambda activity: activity.slot)
+        signatures = [
+            activity.signature
+            for activity in activities
+            if activity.slot == newest.slot
+        ]
+        if newest.slot == self.slot:
+            signatures.extend(self.signatures)
+        return HighWaterMark(
+            slot=newest.slot, block_time=newest.block_time, signatures=signatures
+        )
+
+
+def collect_new(
+    page: List[Any],
+    mark: Optional[HighWaterMark],
+    signatures: Set[str],
+    new_activities: List[Any],
+) -> bool:
+    """
+    Append activities of page newer than mark, skipping duplicates.
+
+    :param page: Activities, newest first
+    :param mark: High-water mark of last sync
+    :param signatures: Signatures collected so far
+    :param new_activities: New activities collected so far
+    :return: True if page reached already synced activity
+    """
+    for activity in page:
+        if mark is not None and activity.slot < mark.slot:
+            return True
+        if _is_new(activity, mark, signatures):
+            signatures.add(activity.signature)
+            new_activities.append(activity)
+    return False
+
+
+def _is_new(activity: Any, mark: Optional[HighWaterMark], signatures: Set[str]) -> bool:
+    seen = mark is not None and mark.has_seen(activity)
+    return not seen and activity.signature not in signatures
+
+
+class WatermarkStore:
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Initialize SQLite store of high-water marks.
+
+        :param path: Path of SQLite database file
+        """
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute(_CREATE_TABLE)
+
+    def get(self, kind: str, key: str) -> Optional[HighWaterMark]:
+        """
+        Retrieve high-water mark.
+
+        :param kind: Kind of synced resource, e.g. ``collection``
+        :param key: Collection symbol, wallet or mint address
+        :return: High-water mark, if resource was synced before
+        """
+        row = self._connection.execute(
+            "SELECT mark FROM watermarks WHERE kind = ? AND key = ?", (kind, key)
+        ).fetchone()
+        return None if row is None else HighWaterMark.parse_raw(row[0])
+
+    def set(self, kind: str, key: str, mark: HighWaterMark) -> None:  # noqa: WPS125
+        """
+        Persist high-water mark.
+
+        :param kind: Kind of synced resource, e.g. ``collection``
+        :param key: Collection symbol, wallet or mint address
+        :param mark: High-water mark
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+            (kind, key, mark.json()),
+        )
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._connection.close()
+
+
+class ActivitySync:
+    def __init__(
+        self,
+        api: MagicEdenApi,
+        store: Optional[WatermarkStore] = None,
+        page_size: int = DEFAULT_SYNC_PAGE_SIZE,
+    ) -> None:
+        """
+        Initialize incremental activity sync.
+
+        :param api: Magic Eden API object
+        :param store: Store of high-water marks, in-memory by default
+        :param page_size: The number of activities requested per page
+        """
+        self.api = api
+        self.store = store or WatermarkStore()
+        self.page_size = page_size
+
+    async def sync_collection(
+        self, collection_name: str, backfill: bool = False
+    ) -> List[CollectionActivityItem]:
+        """
+        Retrieve collection activities newer than the last sync.
+
+        :param collection_name: Name of NFT collection
+        :param backfill: Fetch the whole history on first sync instead of one page
+        :return: New activities, newest first
+        """
+        return await self._sync(
+            "collection",
+            collection_name,
+            self.api.get_collection_activities,
+            backfill,
+        )
+
+    async def sync_wallet(
+        self, wallet_address: str, backfill: bool = False
+    ) -> List[WalletActivityItem]:
+        """
+        Retrieve wallet activities newer than the last sync.
+
+        :param wallet_address: Solana wallet address
+        :param backfill: Fetch the whole history on first sync instead of one page
+        :return: New activities, newest first
+        """
+        return await self._sync(
+            "wallet", wallet_address, self.api.get_wallet_activities, backfill
+        )
+
+    async def sync_token(
+        self, token_mint: str, backfill: bool = False
+    ) -> List[TokenActivityItem]:
+        """
+        Retrieve token activities newer than the last sync.
+
+        :param token_mint: Mint address of token/NFT
+        :param backfill: Fetch the whole history on first sync instead of one page
+        :return: New activities, newest first
+        """
+        return await self._sync(
+            "token", token_mint, self.api.get_token_activities, backfill
+        )
+
+    async def _sync(
+        self, kind: str, key: str, fetch_page: ActivityFetcher, backfill: bool
+    ) -> List[Any]:
+        mark = self.store.get(kind, key)
+        new_activities = await self._fetch_new(
+            key, fetch_page, mark, follow_pages=mark is not None or backfill
+        )
+        if new_activities:
+            base = mark or HighWaterMark(slot=-1, block_time=0, signatures=[])
+            self.store.set(kind, key, base.advance(new_activities))
+        return new_activities
+
+    async def _fetch_new(
+        self,
+        key: str,
+        fetch_page: ActivityFetcher,
+        mark: Optional[HighWaterMark],
+        follow_pages: bool,
+    ) -> List[Any]:
+        new_activities: List[Any] = []
+        signatures: Set[str] = set()
+        for offset in count(0, self.page_size):
+            page = await fetch_page(key, offset=offset, limit=self.page_size)
+            reached_mark = collect_new(page, mark, signatures, new_activities)
+            if reached_mark or len(page) < self.page_size or not follow_pages:
+                break
+        return new_activities
@@ -0,0 +1,225 @@
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Type, Union
+
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from magicpyden.parsing import construct_model, parse_model
+
+JsonObject = Mapping[str, Any]
+
+_MISSING = object()
+
+
+def _is_model_field(field: ModelField) -> bool:
+    return isinstance(field.type_, type) and issubclass(field.type_, BaseModel)
+
+
+def _is_lazy_model(field: ModelField, raw: Any) -> bool:
+    if not isinstance(raw, Mapping):
+        return False
+    return field.shape == SHAPE_SINGLETON and _is_model_field(field)
+
+
+def _is_lazy_list(field: ModelField, raw: Any) -> bool:
+    if not isinstance(raw, list):
+        return False
+    return field.shape == SHAPE_LIST and _is_model_field(field)
+
+
+class LazyModel:
+    """
+    Model built field by field from decoded JSON on first access.
+
+    Attributes read like the model's; ``to_model`` builds the full model.
+    Nested models and lists of models are lazy too.
+    """
+
+    __slots__ = ("_json", "_model", "_trusted", "_built")
+
+    def __init__(
+        self, model: Type[BaseModel], json_data: JsonObject, trusted: bool
+    ) -> None:
+        """
+        Wrap decoded JSON object.
+
+        :param model: Model class
+        :param json_data: Decoded JSON object
+        :param trusted: Build fields without validation
+        """
+        self._model = model
+        self._json = json_data
+        self._trusted = trusted
+        self._built: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Build field on first access.
+
+        :param name: Field name
+        :return: Field value
+        :raises AttributeError: If model has no such field
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        field = self._model.__fields__.get(name)
+        if field is None:
+            model_name = self._model.__name__
+            raise AttributeError(f"{model_name} has no field {name!r}")
+        if name not in self._built:
+            self._built[name] = self._build(field)
+        return self._built[name]
+
+    def __repr__(self) -> str:
+        """
+        Represent lazy model without building it.
+
+        :return: Model name and number of built fields
+        """
+        model_name = self._model.__name__
+        built = len(self._built)
+        return f"<lazy {model_name}: {built} fields built>"
+
+    def to_model(self) -> BaseModel:
+        """
+        Build the complete model.
+
+        :return: Model instance
+        """
+        return parse_model(self._model, self._json, trusted=self._trusted)
+
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:  # noqa: WPS125, A003
+        """
+        Convert complete model to dict.
+
+        :param kwargs: Arguments of ``BaseModel.dict``
+        :return: Field values by name
+        """
+        return self.to_model().dict(**kwargs)
+
+    def json(self, **kwargs: Any) -> str:
+        """
+        Convert complete model to JSON.
+
+        :param kwargs: Arguments of ``BaseModel.json``
+        :return: JSON string
+        """
+        return self.to_model().json(**kwargs)
+
+    def _build(self, field: ModelField) -> Any:
+        raw = self._json.get(field.name, _MISSING)
+        raw = self._json.get(field.alias, raw)
+        if raw is _MISSING:
+            return self._build_missing(field)
+        if _is_lazy_model(field, raw):
+            return LazyModel(field.type_, raw, self._trusted)
+        if _is_lazy_list(field, raw):
+            return LazyList(field.type_, raw, self._trusted)
+        return self._build_scalar(field, raw)
+
+    def _build_missing(self, field: ModelField) -> Any:
+        if field.required:
+            raise ValidationError(
+                [ErrorWrapper(MissingError(), field.alias)], self._model
+            )
+        return field.get_default()
+
+    def _build_scalar(self, field: ModelField, raw: Any) -> Any:
+        if self._trusted:
+            return raw
+        location = field.alias
+        field_value, errors = field.validate(raw, {}, loc=location, cls=self._model)
+        if errors:
+            raise ValidationError([errors], self._model)
+        return field_value
+
+
+class LazyList(Sequence):
+    """List of models built from decoded JSON objects on first access."""
+
+    def __init__(
+        self, model: Type[BaseModel], rows: List[JsonObject], trusted: bool
+    ) -> None:
+        """
+        Wrap decoded JSON array.
+
+        :param model: Model class of items
+        :param rows: Decoded JSON objects
+        :param trusted: Build fields without validation
+        """
+        self.model = model
+        self.trusted = trusted
+        self._rows = rows
+        self._models: Dict[int, LazyModel] = {}
+
+    def __len__(self) -> int:
+        """
+        Count items.
+
+        :return: Number of items
+        """
+        return len(self._rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore
+        """
+        Get lazy item, or lazy list of items for a slice.
+
+        :param index: Position or slice
+        :return: Lazy model or lazy list
+        """
+        if isinstance(index, slice):
+            return LazyList(self.model, self._rows[index], self.trusted)
+        index = range(len(self._rows))[index]
+        lazy_model = self._models.get(index)
+        if lazy_model is None:
+            lazy_model = LazyModel(self.model, self._rows[index], self.trusted)
+            self._models[index] = lazy_model
+        return lazy_model
+
+    def __iter__(self) -> Iterator[LazyModel]:
+        """
+        Iterate over lazy items.
+
+        :return: Iterator of lazy models
+        """
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self) -> str:
+        """
+        Represent lazy list without building items.
+
+        :return: Model name and length
+        """
+        model_name = self.model.__name__
+        size = len(self)
+        return f"<lazy list of {size} {model_name}>"
+
+    def to_models(self) -> List[BaseModel]:
+        """
+        Build every model.
+
+        :return: Model instances
+        """
+        if self.trusted:
+            return [construct_model(self.model, row) for row in self._rows]
+        return [self.model.parse_obj(row) for row in self._rows]
+
+
+def parse_lazy(model: Type[BaseModel], json_data: Any, trusted: bool = False) -> Any:
+    """
+    Wrap decoded JSON in lazy models, falling back to eager parsing.
+
+    :param model: Model class, root models return their root value
+    :param json_data: Decoded JSON data
+    :param trusted: Build fields without validation
+    :return: Lazy model, lazy list of models or eagerly parsed value
+    """
+    if model.__custom_root_type__:
+        root = model.__fields__["__root__"]
+        if _is_model_field(root) and root.shape == SHAPE_LIST:
+            if isinstance(json_data, list):
+                return LazyList(root.type_, json_data, trusted)
+    elif isinstance(json_data, Mapping):
+        return LazyModel(model, json_data, trusted)
+    return parse_model(model, json_data, trusted=trusted)
@@ -0,0 +1,85 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, List, TypeVar
+
+from magicpyden.resilience import cancel_all
+
+ItemT = TypeVar("ItemT")
+
+PageFetcher = Callable[..., Awaitable[List[ItemT]]]
+PendingPages = Deque["asyncio.Future[List[Any]]"]
+
+
+async def paginate(
+    fetch_page: PageFetcher,
+    offset: int,
+    limit: int,
+    prefetch: int,
+) -> AsyncIterator[ItemT]:
+    """
+    Stream items across offset/limit pages.
+
+    The first page is requested alone, so a short result costs one request.
+    After every full page the window of pages requested ahead of the one being
+    consumed doubles, up to ``prefetch``. Iteration stops on the first page
+    shorter than ``limit``.
+
+    :param fetch_page: Coroutine function accepting ``offset`` and ``limit``
+    :param offset: The number of items to skip
+    :param limit: The number of items to request per page
+    :param prefetch: The most pages kept in flight
+    :yield: Items of every page in order
+    :raises ValueError: If ``limit`` or ``prefetch`` is not positive
+    """
+    if limit < 1 or prefetch < 1:
+        raise ValueError("limit and prefetch must be positive")
+
+    pending: PendingPages = deque()
+    next_offset = offset
+    window = 1
+    try:  # noqa: WPS501
+        while window:
+            next_offset = _prefetch(pending, fetch_page, next_offset, limit, window)
+            page = await pending.popleft()
+            for item in page:  # noqa: WPS110
+                yield item
+            window = _next_window(window, prefetch, len(page) >= limit)
+    finally:
+        await cancel_all(list(pending))
+
+
+def _next_window(window: int, prefetch: int, full_page: bool) -> int:
+    """
+    Size the window of pages requested ahead after a page is received.
+
+    :param window: Current number of pages kept in flight
+    :param prefetch: The most pages kept in flight
+    :param full_page: The page was full, so more may follow
+    :return: Doubled window up to ``prefetch``, 0 once the last page arrived
+    """
+    if not full_page:
+        return 0
+    return min(window * 2, prefetch)
+
+
+def _prefetch(
+    pending: PendingPages,
+    fetch_page: PageFetcher,
+    offset: int,
+    limit: int,
+    prefetch: int,
+) -> int:
+    """
+    Request pages until ``prefetch`` of them are in flight.
+
+    :param pending: Requested pages, oldest first
+    :param fetch_page: Coroutine function accepting ``offset`` and ``limit``
+    :param offset: Offset of the next page to request
+    :param limit: The number of items to request per page
+    :param prefetch: The number of pages kept in flight
+    :return: Offset of the page following the requested ones
+    """
+    while len(pending) < prefetch:
+        pending.append(asyncio.ensure_future(fetch_page(offset=offset, limit=limit)))
+        offset += limit
+    return offset
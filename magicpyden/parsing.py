@@ -0,0 +1,119 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+JsonLoads = Callable[[bytes], Any]
+
+Converter = Optional[Callable[[Any], Any]]
+NamedConverter = Tuple[str, Callable[[Any], Any]]
+
+_MISSING = object()
+
+
+def _find_json_loads() -> JsonLoads:
+    try:
+        from orjson import loads  # noqa: WPS433
+    except ImportError:
+        return json.loads
+    return loads
+
+
+default_json_loads = _find_json_loads()
+
+
+def parse_model(model: Type[BaseModel], json_data: Any, trusted: bool = False) -> Any:
+    """
+    Build model from decoded JSON data.
+
+    :param model: Model class, root models return their root value
+    :param json_data: Decoded JSON data
+    :param trusted: Skip validation and build models directly from data
+    :return: Model instance or root value
+    """
+    if trusted:
+        return construct_model(model, json_data)
+    parsed: Any = model.parse_obj(json_data)
+    if model.__custom_root_type__:
+        return parsed.__root__
+    return parsed
+
+
+def construct_model(model: Type[BaseModel], json_data: Any) -> Any:
+    """
+    Build model recursively from trusted data without validation.
+
+    Aliases are mapped and missing optional fields get their default, but
+    values are neither validated nor coerced.
+
+    :param model: Model class, root models return their root value
+    :param json_data: Decoded JSON data
+    :return: Model instance or root value
+    """
+    if model.__custom_root_type__:
+        convert = _field_converter(model.__fields__["__root__"])
+        return json_data if convert is None else convert(json_data)
+    return _constructor(model)(json_data)
+
+
+class _ModelPlan:
+    __slots__ = ("model", "defaults", "keys", "converters")
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        fields = model.__fields__.values()
+        self.model = model
+        self.defaults = {field.name: field.get_default() for field in fields}
+        self.keys = [(field.name, field.name) for field in fields]
+        self.keys.extend(
+            (field.name, field.alias) for field in fields if field.alias != field.name
+        )
+        self.converters: List[NamedConverter] = []
+        for field in fields:
+            convert = _field_converter(field)
+            if convert is not None:
+                self.converters.append((field.name, convert))
+
+    def construct(self, json_data: Any) -> Any:
+        field_values = self.defaults.copy()
+        fields_set = set()
+        for name, key in self.keys:
+            field_value = json_data.get(key, _MISSING)
+            if field_value is not _MISSING:
+                field_values[name] = field_value
+                fields_set.add(name)
+        if self.converters:
+            self._convert(field_values, fields_set)
+        return self._new_model(field_values, fields_set)
+
+    def _convert(self, field_values: Dict[str, Any], fields_set: Set[str]) -> None:
+        for name, convert in self.converters:
+            field_value = field_values[name]
+            if name in fields_set and field_value is not None:
+                field_values[name] = convert(field_value)
+
+    def _new_model(self, field_values: Dict[str, Any], fields_set: Set[str]) -> Any:
+        instance = self.model.__new__(self.model)  # noqa: WPS609
+        object.__setattr__(instance, "__dict__", field_values)  # noqa: WPS609
+        object.__setattr__(instance, "__fields_set__", fields_set)  # noqa: WPS609
+        return instance
+
+
+@lru_cache(maxsize=None)
+def _constructor(model: Type[ModelT]) -> Callable[[Any], ModelT]:
+    return _ModelPlan(model).construct
+
+
+def _field_converter(field: ModelField) -> Converter:
+    if not isinstance(field.type_, type) or not issubclass(field.type_, BaseModel):
+        return None
+
+    construct = _constructor(field.type_)
+    if field.shape == SHAPE_SINGLETON:
+        return construct
+    if field.shape == SHAPE_LIST:
+        return lambda items: [construct(item) for item in items]  # noqa: WPS110
+    return None
@@ -0,0 +1,141 @@
+import asyncio
+from collections import Counter
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from aiohttp import ClientResponseError
+from pydantic import BaseModel
+
+from magicpyden.constants import LAMPORTS_PER_SOL
+from magicpyden.schema import CollectionStats, EscrowBalance, TokenMetadata
+
+TokensFetch = Callable[[str], Awaitable[List[TokenMetadata]]]
+EscrowFetch = Callable[[str], Awaitable[EscrowBalance]]
+StatsFetch = Callable[[str], Awaitable[CollectionStats]]
+
+
+class CollectionHolding(BaseModel):
+    collection: str
+    count: int
+    floor_price: Optional[float]
+    value: float  # noqa: WPS110
+
+
+class WalletPortfolio(BaseModel):
+    wallet: str
+    holdings: List[CollectionHolding]
+    unvalued: int
+    escrow_balance: float
+    tokens_value: float
+    total_value: float
+
+
+def to_sol(lamports: Optional[float]) -> Optional[float]:
+    """
+    Convert lamports to SOL.
+
+    :param lamports: Amount in lamports
+    :return: Amount in SOL
+    """
+    return None if lamports is None else lamports / LAMPORTS_PER_SOL
+
+
+def value_holdings(
+    counts: Dict[str, int], stats: Iterable[Optional[CollectionStats]]
+) -> List[CollectionHolding]:
+    """
+    Value token counts of collections at their floor price.
+
+    :param counts: Number of tokens by collection
+    :param stats: Stats of the collections, in the same order, None if unknown
+    :return: Valued holdings, most valuable first, without unknown floor prices
+    """
+    holdings = []
+    for (name, count), collection_stats in zip(counts.items(), stats):
+        if collection_stats is None:
+            continue
+        floor_price = to_sol(collection_stats.floor_price)
+        if floor_price is not None:
+            holdings.append(
+                CollectionHolding(
+                    collection=name,
+                    count=count,
+                    floor_price=floor_price,
+                    value=floor_price * count,
+                )
+            )
+    holdings.sort(key=lambda holding: holding.value, reverse=True)
+    return holdings
+
+
+class PortfolioValuer:
+    def __init__(
+        self,
+        fetch_tokens: TokensFetch,
+        fetch_escrow: EscrowFetch,
+        fetch_stats: StatsFetch,
+    ) -> None:
+        """
+        Initialize valuation of wallets at collection floor prices.
+
+        Stats of every collection are fetched once and shared by all wallets
+        valued with this object. Failed fetches are retried by the next wallet.
+
+        :param fetch_tokens: Coroutine function fetching every token of a wallet
+        :param fetch_escrow: Coroutine function fetching escrow balance of a wallet
+        :param fetch_stats: Coroutine function fetching stats of a collection
+        """
+        self._fetch_tokens = fetch_tokens
+        self._fetch_escrow = fetch_escrow
+        self._fetch_stats = fetch_stats
+        self._stats: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def value(self, wallet: str) -> WalletPortfolio:  # noqa: WPS110
+        """
+        Value tokens of wallet at floor price and add its escrow balance.
+
+        Tokens without collection, or of unknown collections or floor prices,
+        are counted as unvalued.
+
+        :param wallet: Solana wallet address
+        :return: Holdings per collection and totals in SOL
+        """
+        tokens, escrow = await asyncio.gather(
+            self._fetch_tokens(wallet), self._fetch_escrow(wallet)
+        )
+        counts = Counter(
+            token.collection for token in tokens if token.collection is not None
+        )
+        holdings = value_holdings(
+            counts, await asyncio.gather(*(self._get_stats(name) for name in counts))
+        )
+        tokens_value = sum(holding.value for holding in holdings)
+        return WalletPortfolio(
+            wallet=wallet,
+            holdings=holdings,
+            unvalued=len(tokens) - sum(holding.count for holding in holdings),
+            escrow_balance=escrow.balance,
+            tokens_value=tokens_value,
+            total_value=tokens_value + escrow.balance,
+        )
+
+    async def _get_stats(self, collection: str) -> Optional[CollectionStats]:
+        future = self._stats.get(collection)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_stats_or_none(collection))
+            future.add_done_callback(partial(self._forget_failure, collection))
+            self._stats[collection] = future
+        return await asyncio.shield(future)
+
+    async def _fetch_stats_or_none(self, collection: str) -> Optional[CollectionStats]:
+        try:
+            return await self._fetch_stats(collection)
+        except ClientResponseError as error:
+            if error.status == HTTPStatus.NOT_FOUND:
+                return None
+            raise
+
+    def _forget_failure(self, collection: str, future: "asyncio.Future[Any]") -> None:
+        if future.cancelled() or future.exception() is not None:
+            self._stats.pop(collection, None)
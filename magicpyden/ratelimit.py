@@ -0,0 +1,136 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+from magicpyden.constants import (
+    DEFAULT_BURST,
+    DEFAULT_RATE_LIMIT,
+    RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_FLOOR,
+    RATE_LIMIT_RECOVERY_STEP,
+)
+
+EPOCH_THRESHOLD = 1e9
+
+
+def parse_retry_after(header_value: Optional[str]) -> Optional[float]:
+    """
+    Convert a ``Retry-After`` header into seconds to wait.
+
+    :param header_value: Delay in seconds or an HTTP date
+    :return: Seconds to wait, if the header could be parsed
+    """
+    if not header_value:
+        return None
+    try:
+        return max(float(header_value), 0)
+    except ValueError:
+        return _seconds_until(header_value)
+
+
+def _seconds_until(http_date: str) -> Optional[float]:
+    try:
+        retry_at = parsedate_to_datetime(http_date)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+def parse_reset(header_value: Optional[str]) -> Optional[float]:
+    """
+    Convert a rate-limit reset header into seconds to wait.
+
+    :param header_value: Seconds until reset or a unix timestamp
+    :return: Seconds to wait, if the header could be parsed
+    """
+    try:
+        reset = float(header_value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+    if reset > EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0)
+
+
+class RateLimiter:
+    def __init__(
+        self, rate: float = DEFAULT_RATE_LIMIT, burst: int = DEFAULT_BURST
+    ) -> None:
+        """
+        Initialize token bucket shared by every request of one or more clients.
+
+        :param rate: Sustained requests per second
+        :param burst: Maximum number of requests sent back to back
+        :raises ValueError: If rate or burst is not positive
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate and burst must be positive")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until: float = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                delay = self._reserve()
+                if delay <= 0:
+                    return
+                await asyncio.sleep(delay)
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold back every request for the given number of seconds.
+
+        :param delay: Seconds to wait before the next request
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slow down after the server rejected a request for exceeding its limit.
+
+        :param retry_after: Seconds the server asked to wait
+        """
+        self.rate = max(self.rate * RATE_LIMIT_DECREASE_FACTOR, RATE_LIMIT_FLOOR)
+        self._tokens = min(self._tokens, 0)
+        if retry_after is not None:
+            self.pause(retry_after)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Adjust pace from rate-limit headers of a successful response.
+
+        :param headers: Response headers
+        """
+        self.rate = min(
+            self.rate + self.max_rate * RATE_LIMIT_RECOVERY_STEP, self.max_rate
+        )
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None or remaining.strip() != "0":
+            return
+        reset = parse_reset(headers.get("X-RateLimit-Reset"))
+        self.pause(1 / self.rate if reset is None else reset)
+
+    def _reserve(self) -> float:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._tokens + elapsed * self.rate, self.burst)
+
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
@@ -0,0 +1,238 @@
+import asyncio
+import time
+from collections import defaultdict
+from enum import Enum
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Optional
+
+from aiohttp import ClientResponseError
+
+from magicpyden.constants import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_QUANTILE,
+)
+from magicpyden.endpoint import EndPoint
+from magicpyden.hooks import LatencyHistogram, RequestEvent, RequestHook
+
+
+def is_retryable(status: int) -> bool:
+    """
+    Determine if a failed request may succeed when sent again.
+
+    :param status: HTTP status of failed response
+    :return: True for throttled and server error responses
+    """
+    throttled = status == HTTPStatus.TOO_MANY_REQUESTS
+    return throttled or status >= HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    Determine if a failed request indicates an unhealthy upstream.
+
+    :param error: Error raised by request
+    :return: True for throttled, server error, connection and timeout errors
+    """
+    if isinstance(error, ClientResponseError):
+        return is_retryable(error.status)
+    return True
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, endpoint: EndPoint) -> None:
+        """
+        Initialize error raised instead of sending requests to unhealthy endpoint.
+
+        :param endpoint: Endpoint whose circuit is open
+        """
+        super().__init__(f"circuit of {endpoint.name} is open")
+        self.endpoint = endpoint
+
+
+class CircuitState(str, Enum):  # noqa: WPS600
+    closed = "closed"
+    open = "open"  # noqa: WPS125
+    half_open = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """
+        Initialize per-endpoint circuit breaker.
+
+        After ``failure_threshold`` consecutive failures an endpoint is open and
+        requests fail fast. After ``reset_timeout`` seconds one probe request is
+        let through, closing the circuit again if it succeeds.
+
+        :param failure_threshold: Consecutive failures opening the circuit
+        :param reset_timeout: Seconds before probing an open endpoint
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: DefaultDict[EndPoint, int] = defaultdict(int)
+        self._opened_at: Dict[EndPoint, float] = {}
+        self._probed_at: Dict[EndPoint, float] = {}
+
+    def state(self, endpoint: EndPoint) -> CircuitState:
+        """
+        Get state of endpoint circuit.
+
+        :param endpoint: Targeted endpoint
+        :return: Circuit state
+        """
+        opened_at = self._opened_at.get(endpoint)
+        if opened_at is None:
+            return CircuitState.closed
+        if time.monotonic() - opened_at < self.reset_timeout:
+            return CircuitState.open
+        return CircuitState.half_open
+
+    def allow(self, endpoint: EndPoint) -> bool:
+        """
+        Determine if a request may be sent, reserving the probe when half open.
+
+        A probe without outcome, e.g. a cancelled one, is given up after
+        ``reset_timeout`` seconds.
+
+        :param endpoint: Targeted endpoint
+        :return: True if request may be sent
+        """
+        state = self.state(endpoint)
+        if state == CircuitState.closed:
+            return True
+        if state == CircuitState.open:
+            return False
+        now = time.monotonic()
+        probed_at = self._probed_at.get(endpoint, -self.reset_timeout)
+        if now - probed_at < self.reset_timeout:
+            return False
+        self._probed_at[endpoint] = now
+        return True
+
+    def record_success(self, endpoint: EndPoint) -> None:
+        """
+        Close circuit after a successful request.
+
+        :param endpoint: Targeted endpoint
+        """
+        self._failures[endpoint] = 0
+        self._opened_at.pop(endpoint, None)
+        self._probed_at.pop(endpoint, None)
+
+    def record_failure(self, endpoint: EndPoint) -> None:
+        """
+        Count failed request, opening circuit at the threshold or a failed probe.
+
+        :param endpoint: Targeted endpoint
+        """
+        self._failures[endpoint] += 1
+        probed = self._probed_at.pop(endpoint, None) is not None
+        if probed or self._failures[endpoint] >= self.failure_threshold:
+            self._opened_at[endpoint] = time.monotonic()
+
+
+class HedgingPolicy(RequestHook):
+    def __init__(
+        self, quantile: float = HEDGE_QUANTILE, min_samples: int = HEDGE_MIN_SAMPLES
+    ) -> None:
+        """
+        Initialize hedging of requests slower than usual for their endpoint.
+
+        A duplicate request is sent once a request takes longer than the
+        observed ``quantile`` of its endpoint's network time.
+
+        :param quantile: Quantile of network time after which to hedge
+        :param min_samples: Responses observed before hedging an endpoint
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.hedged = 0
+        self.latencies: DefaultDict[EndPoint, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+
+    def on_response(self, event: RequestEvent) -> None:
+        """
+        Record network time of successful response.
+
+        :param event: Endpoint, attempt, status, body size and network time
+        """
+        if event.error is None:
+            self.latencies[event.endpoint].observe(event.network_time)
+
+    def delay(self, endpoint: EndPoint) -> Optional[float]:
+        """
+        Get time after which a request of endpoint is hedged.
+
+        :param endpoint: Targeted endpoint
+        :return: Seconds, None until enough responses were observed
+        """
+        latencies = self.latencies[endpoint]
+        if latencies.count < self.min_samples:
+            return None
+        delay = latencies.quantile(self.quantile)
+        return None if delay == float("inf") else delay
+
+    async def send(
+        self, endpoint: EndPoint, request: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Send request, sending a duplicate if it is slower than usual.
+
+        :param endpoint: Targeted endpoint
+        :param request: Sends the request once per call
+        :return: Result of the first successful request
+        """
+        delay = self.delay(endpoint)
+        if delay is None:
+            return await request()
+        tasks: List["asyncio.Future[Any]"] = [asyncio.ensure_future(request())]
+        try:  # noqa: WPS501
+            return await self._race(tasks, delay, request)
+        finally:
+            await cancel_all(tasks)
+
+    async def _race(
+        self,
+        tasks: List["asyncio.Future[Any]"],
+        delay: float,
+        request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            self.hedged += 1
+            tasks.append(asyncio.ensure_future(request()))
+        return await first_successful(tasks)
+
+
+async def first_successful(tasks: List["asyncio.Future[Any]"]) -> Any:
+    """
+    Wait for the first task to succeed, or re-raise the first task's error.
+
+    :param tasks: Tasks running the same request
+    :return: Result of the first successful task
+    """
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task.result()
+    return tasks[0].result()
+
+
+async def cancel_all(tasks: List["asyncio.Future[Any]"]) -> None:
+    """
+    Cancel tasks and wait for them to finish.
+
+    :param tasks: Tasks, some possibly done
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
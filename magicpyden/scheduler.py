@@ -0,0 +1,248 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Mapping, Optional
+
+from magicpyden.constants import (
+    BULK_CONCURRENCY_SHARE,
+    BULK_RATE_SHARE,
+    DEFAULT_CONNECTION_LIMIT,
+)
+from magicpyden.ratelimit import RateLimiter
+
+Waiters = Deque["asyncio.Future[None]"]
+
+
+class Priority(IntEnum):
+    """Request class, lower values are served first."""
+
+    high = 0
+    normal = 1
+    bulk = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "magicpyden_priority", default=Priority.normal
+)
+
+
+def current_priority() -> Priority:
+    """
+    Get priority of requests sent from the current context.
+
+    :return: Priority, normal by default
+    """
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """
+    Send requests of the enclosed block, and tasks it starts, with priority.
+
+    :param priority: Priority of requests
+    :yield: Nothing
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class PrioritySemaphore:
+    def __init__(
+        self, slots: int, limits: Optional[Mapping[Priority, int]] = None
+    ) -> None:
+        """
+        Initialize semaphore handing free slots to the most urgent waiter.
+
+        :param slots: Number of slots
+        :param limits: Maximum number of slots held by each priority
+        """
+        self.slots = slots
+        self.limits = dict(limits or {})
+        self.active = dict.fromkeys(Priority, 0)
+        self.waiters: Dict[Priority, Waiters] = {
+            priority: deque() for priority in Priority
+        }
+
+    async def acquire(self, priority: Priority) -> None:
+        """
+        Wait for a slot.
+
+        :param priority: Priority of caller
+        :raises asyncio.CancelledError: If cancelled while waiting, the slot
+            is handed over or given back
+        """
+        ahead = any(self.waiters[other] for other in Priority if other <= priority)
+        if not ahead and self._has_room(priority):
+            self.active[priority] += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                self.release(priority)
+            elif waiter in self.waiters[priority]:
+                self.waiters[priority].remove(waiter)
+            raise
+
+    def release(self, priority: Priority) -> None:
+        """
+        Free slot and hand it to the most urgent waiter allowed to take it.
+
+        :param priority: Priority of the releasing caller
+        """
+        self.active[priority] -= 1
+        for waiting_priority in Priority:
+            queue = self.waiters[waiting_priority]
+            while queue and self._has_room(waiting_priority):
+                waiter = queue.popleft()
+                if not waiter.done():
+                    self.active[waiting_priority] += 1
+                    waiter.set_result(None)
+
+    def waiting(self, priority: Priority) -> int:
+        """
+        Count callers of priority waiting for a slot.
+
+        :param priority: Priority of callers
+        :return: Number of waiters
+        """
+        return len(self.waiters[priority])
+
+    def _has_room(self, priority: Priority) -> bool:
+        limit = self.limits.get(priority, self.slots)
+        in_use = sum(self.active.values())
+        return in_use < self.slots and self.active[priority] < limit
+
+
+class PriorityStats:
+    def __init__(self) -> None:
+        """Initialize wait statistics of one priority."""
+        self.served = 0
+        self.total_wait: float = 0
+        self.max_wait: float = 0
+
+    def observe(self, wait: float) -> None:
+        """
+        Record time a request waited before being sent.
+
+        :param wait: Seconds waited
+        """
+        self.served += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    @property
+    def mean_wait(self) -> float:
+        """
+        Average wait.
+
+        :return: Seconds
+        """
+        return self.total_wait / self.served if self.served else 0
+
+
+class PriorityScheduler:
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONNECTION_LIMIT,
+        limits: Optional[Mapping[Priority, int]] = None,
+        rate_shares: Optional[Mapping[Priority, float]] = None,
+    ) -> None:
+        """
+        Initialize scheduler ordering requests by priority.
+
+        Free slots and rate-limit tokens go to the most urgent waiting request.
+        By default, bulk requests may use half the slots and half the rate, so
+        urgent ones always find room.
+
+        :param concurrency: Maximum number of requests in flight
+        :param limits: Maximum number of requests in flight per priority
+        :param rate_shares: Share of the rate limit each priority may use
+        :raises ValueError: If ``concurrency`` is not positive
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        bulk_limit = max(int(concurrency * BULK_CONCURRENCY_SHARE), 1)
+        self.limits = {Priority.bulk: bulk_limit, **(limits or {})}
+        self.rate_shares = {Priority.bulk: BULK_RATE_SHARE, **(rate_shares or {})}
+        self.stats = {priority: PriorityStats() for priority in Priority}
+        self._slots = PrioritySemaphore(concurrency, self.limits)
+        self._turn = PrioritySemaphore(1)
+        self._class_limiters: Dict[Priority, RateLimiter] = {}
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority, rate_limiter: RateLimiter
+    ) -> AsyncIterator[None]:
+        """
+        Hold a slot and a rate-limit token while sending one request.
+
+        :param priority: Priority of request
+        :param rate_limiter: Rate limiter shared by every priority
+        :yield: Nothing, once the request may be sent
+        """
+        started = time.monotonic()
+        async with self._held_slot(priority):
+            await self._take_token(priority, rate_limiter)
+            self.stats[priority].observe(time.monotonic() - started)
+            yield
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize queue depth and waits of every priority.
+
+        :return: Statistics by priority name
+        """
+        return {
+            priority.name: {
+                "waiting": self._slots.waiting(priority) + self._turn.waiting(priority),
+                "active": self._slots.active[priority],
+                "served": stats.served,
+                "mean_wait": stats.mean_wait,
+                "max_wait": stats.max_wait,
+            }
+            for priority, stats in self.stats.items()
+        }
+
+    @asynccontextmanager
+    async def _held_slot(self, priority: Priority) -> AsyncIterator[None]:
+        await self._slots.acquire(priority)
+        try:
+            yield
+        finally:
+            self._slots.release(priority)
+
+    async def _take_token(self, priority: Priority, rate_limiter: RateLimiter) -> None:
+        class_limiter = self._get_class_limiter(priority, rate_limiter)
+        if class_limiter is not None:
+            await class_limiter.acquire()
+        await self._turn.acquire(priority)
+        try:  # noqa: WPS501
+            await rate_limiter.acquire()
+        finally:
+            self._turn.release(priority)
+
+    def _get_class_limiter(
+        self, priority: Priority, rate_limiter: RateLimiter
+    ) -> Optional[RateLimiter]:
+        share = self.rate_shares.get(priority, 1)
+        if share >= 1:
+            return None
+        class_limiter = self._class_limiters.get(priority)
+        if class_limiter is None:
+            class_limiter = RateLimiter(
+                rate=rate_limiter.max_rate * share,
+                burst=max(int(rate_limiter.burst * share), 1),
+            )
+            self._class_limiters[priority] = class_limiter
+        return class_limiter
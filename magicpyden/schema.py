@@ -175,6 +175,8 @@ class CollectionListingItem(CamelModel):
     auction_house: str
     token_size: int
     token_address: str
+    token_mint: Optional[str]
+    price: Optional[float]
 
 
 class CollectionListings(BaseModel):
@@ -185,6 +187,7 @@ class CollectionActivityItem(CamelModel):  # noqa: WPS215
     seller: Optional[str]
     price: Optional[float]
     collection: str
+    token_mint: Optional[str]
     buyer_referral: str
     signature: str
     type: str
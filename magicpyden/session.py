@@ -0,0 +1,77 @@
+from importlib.util import find_spec
+from typing import Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from pydantic import BaseModel
+
+from magicpyden.constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
+)
+
+
+def default_accept_encoding() -> str:
+    """
+    List content codings the session can decode.
+
+    :return: ``Accept-Encoding`` header value, with brotli when installed
+    """
+    codings = ["gzip", "deflate"]
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        codings.append("br")
+    return ", ".join(codings)
+
+
+class SessionConfig(BaseModel):
+    limit: int = DEFAULT_CONNECTION_LIMIT
+    limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    ttl_dns_cache: Optional[int] = DEFAULT_DNS_CACHE_TTL
+    total_timeout: Optional[float] = DEFAULT_TOTAL_TIMEOUT
+    connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT
+    read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT
+    accept_encoding: str = default_accept_encoding()
+
+    def create_connector(self) -> TCPConnector:
+        """
+        Build connection pool from settings.
+
+        :return: TCP connector
+        """
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.ttl_dns_cache != 0,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+    def create_timeout(self) -> ClientTimeout:
+        """
+        Build request timeouts from settings.
+
+        :return: Client timeout
+        """
+        return ClientTimeout(
+            total=self.total_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+    def create_session(self) -> ClientSession:
+        """
+        Create session using settings. Must be called inside a running loop.
+
+        :return: Client session
+        """
+        return ClientSession(
+            connector=self.create_connector(),
+            timeout=self.create_timeout(),
+            headers={"Accept-Encoding": self.accept_encoding},
+            raise_for_status=True,
+        )
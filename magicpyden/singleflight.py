@@ -0,0 +1,44 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+class SingleFlight(Generic[ResultT]):
+    def __init__(self) -> None:
+        """Initialize registry of in-flight calls."""
+        self._calls: Dict[Hashable, "asyncio.Future[ResultT]"] = {}
+
+    def __len__(self) -> int:
+        """
+        Count calls currently in flight.
+
+        :return: Number of in-flight calls
+        """
+        return len(self._calls)
+
+    async def share(
+        self, key: Hashable, call: Callable[[], Awaitable[ResultT]]
+    ) -> ResultT:
+        """
+        Run call unless an identical one is in flight, then share its outcome.
+
+        Results and errors are handed to every waiter and forgotten as soon as
+        the call completes. A cancelled waiter does not cancel the shared call.
+
+        :param key: Identity of call
+        :param call: Coroutine function performing the call
+        :return: Result of call
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[ResultT]") -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]  # noqa: WPS420
+        if not future.cancelled():
+            future.exception()
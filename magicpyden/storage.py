@@ -0,0 +1,232 @@
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from magicpyden.constants import SALE_ACTIVITY_TYPES
+
+ActivityRow = Dict[str, Any]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    signature TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    source TEXT,
+    collection TEXT,
+    token_mint TEXT,
+    buyer TEXT,
+    seller TEXT,
+    price REAL,
+    slot INTEGER NOT NULL,
+    block_time INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS activities_collection ON activities (collection, block_time);
+CREATE INDEX IF NOT EXISTS activities_token_mint ON activities (token_mint, block_time);
+CREATE INDEX IF NOT EXISTS activities_buyer ON activities (buyer);
+CREATE INDEX IF NOT EXISTS activities_seller ON activities (seller);
+CREATE INDEX IF NOT EXISTS activities_block_time ON activities (block_time);
+CREATE TEMP TABLE IF NOT EXISTS sale_types (type TEXT PRIMARY KEY);
+"""
+
+INSERT_SALE_TYPE = "INSERT OR IGNORE INTO sale_types VALUES (?)"
+
+INSERT_ACTIVITY = """
+INSERT OR IGNORE INTO activities VALUES (
+    :signature, :type, :source, :collection, :token_mint,
+    :buyer, :seller, :price, :slot, :block_time
+)
+"""
+
+COUNT_ACTIVITIES = "SELECT COUNT(*) FROM activities"
+
+VOLUME_PER_DAY = """
+SELECT date(block_time, 'unixepoch'), SUM(price), COUNT(*)
+FROM activities
+WHERE collection = ? AND block_time >= ?
+    AND type IN (SELECT type FROM sale_types)
+GROUP BY 1
+ORDER BY 1
+"""
+
+LAST_SALE = """
+SELECT signature, token_mint, collection, buyer, seller, price, block_time
+FROM activities
+WHERE token_mint = ? AND type IN (SELECT type FROM sale_types)
+ORDER BY block_time DESC
+LIMIT 1
+"""
+
+LAST_SALES = """
+SELECT signature, token_mint, collection, buyer, seller, price, block_time
+FROM activities
+WHERE collection = ? AND type IN (SELECT type FROM sale_types)
+    AND block_time = (
+        SELECT MAX(block_time) FROM activities AS latest
+        WHERE latest.token_mint = activities.token_mint
+            AND latest.type IN (SELECT type FROM sale_types)
+    )
+ORDER BY block_time DESC
+"""
+
+WALLET_SALES = """
+SELECT
+    SUM(CASE WHEN buyer = :wallet THEN price ELSE 0 END),
+    SUM(CASE WHEN seller = :wallet THEN price ELSE 0 END)
+FROM activities
+WHERE (buyer = :wallet OR seller = :wallet)
+    AND type IN (SELECT type FROM sale_types)
+GROUP BY token_mint
+"""
+
+
+class DailyVolume(BaseModel):
+    day: str
+    volume: float
+    sales: int
+
+
+class Sale(BaseModel):
+    signature: str
+    token_mint: str
+    collection: Optional[str]
+    buyer: Optional[str]
+    seller: Optional[str]
+    price: float
+    block_time: int
+
+
+class WalletPnl(BaseModel):
+    wallet: str
+    spent: float
+    received: float
+    realized: float
+
+
+def _text(field_value: Any) -> Optional[str]:
+    if field_value is None or isinstance(field_value, str):
+        return field_value
+    return str(field_value)
+
+
+def to_row(activity: Any) -> ActivityRow:
+    """
+    Flatten collection, wallet or token activity item into a table row.
+
+    :param activity: Activity item
+    :return: Values by column name
+    """
+    collection = getattr(activity, "collection", None) or getattr(
+        activity, "collection_symbol", None
+    )
+    return {
+        "signature": activity.signature,
+        "type": activity.type,
+        "source": activity.source,
+        "collection": collection,
+        "token_mint": _text(getattr(activity, "token_mint", None)),
+        "buyer": _text(activity.buyer),
+        "seller": _text(activity.seller),
+        "price": activity.price,
+        "slot": activity.slot,
+        "block_time": activity.block_time,
+    }
+
+
+class ActivityStore:
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Initialize local SQLite store of activities, de-duplicated by signature.
+
+        :param path: Path of SQLite database file
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+        with self._connection:
+            self._connection.executemany(
+                INSERT_SALE_TYPE, [(sale_type,) for sale_type in SALE_ACTIVITY_TYPES]
+            )
+
+    def __len__(self) -> int:
+        """
+        Count stored activities.
+
+        :return: Number of activities
+        """
+        cursor = self._connection.execute(COUNT_ACTIVITIES)
+        return cursor.fetchone()[0]
+
+    def add(self, activities: Iterable[Any]) -> int:
+        """
+        Store activities, ignoring already stored signatures.
+
+        :param activities: Collection, wallet or token activity items
+        :return: Number of new activities
+        """
+        with self._connection:
+            cursor = self._connection.executemany(
+                INSERT_ACTIVITY, map(to_row, activities)
+            )
+        return cursor.rowcount
+
+    def volume_per_day(
+        self, collection: str, since: Optional[int] = None
+    ) -> List[DailyVolume]:
+        """
+        Sum sales of collection per UTC day.
+
+        :param collection: Name of NFT collection
+        :param since: Unix time of first sale to include
+        :return: Volume and sale count per day, oldest first
+        """
+        rows = self._connection.execute(VOLUME_PER_DAY, (collection, since or 0))
+        return [
+            DailyVolume(day=day, volume=volume, sales=sales)
+            for day, volume, sales in rows
+        ]
+
+    def last_sale(self, token_mint: str) -> Optional[Sale]:
+        """
+        Find latest sale of token.
+
+        :param token_mint: Mint address of token/NFT
+        :return: Sale, if token was ever sold
+        """
+        sales = self._sales(LAST_SALE, token_mint)
+        return sales[0] if sales else None
+
+    def last_sales(self, collection: str) -> List[Sale]:
+        """
+        Find latest sale of every token of collection.
+
+        :param collection: Name of NFT collection
+        :return: Latest sale per mint, most recent first
+        """
+        return self._sales(LAST_SALES, collection)
+
+    def wallet_pnl(self, wallet: str) -> WalletPnl:
+        """
+        Compute realized profit of wallet from stored sales.
+
+        Realized profit only counts tokens the wallet both bought and sold.
+
+        :param wallet: Solana wallet address
+        :return: Spent, received and realized amounts
+        """
+        rows = self._connection.execute(WALLET_SALES, {"wallet": wallet}).fetchall()
+        realized = sum(
+            received - spent for spent, received in rows if spent and received
+        )
+        return WalletPnl(
+            wallet=wallet,
+            spent=sum(spent for spent, _ in rows),
+            received=sum(received for _, received in rows),
+            realized=realized,
+        )
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._connection.close()
+
+    def _sales(self, query: str, key: str) -> List[Sale]:
+        rows = self._connection.execute(query, (key,))
+        return [Sale(**dict(zip(Sale.__fields__, row))) for row in rows]
@@ -0,0 +1,140 @@
+import codecs
+import json
+import re
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_START = 0
+_FIRST_ITEM = 1
+_NEXT_ITEM = 2
+_AFTER_ITEM = 3
+_DONE = 4
+
+
+class JsonArrayParser:
+    def __init__(self) -> None:
+        """
+        Initialize incremental parser of a top-level JSON array.
+
+        Only the undecoded tail of the data fed so far is kept, so memory is
+        bounded by the largest item rather than the whole array.
+        """
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._state = _START
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Decode every array item completed by chunk.
+
+        :param chunk: Next bytes of the JSON document
+        :return: Decoded items, in order
+        :raises ValueError: If data is not a JSON array
+
+        # noqa: DAR402 ValueError
+        """
+        self._buffer += self._utf8.decode(chunk)
+        decoded: List[Any] = []
+        position = self._parse(decoded)
+        self._buffer = self._buffer[position:]
+        return decoded
+
+    def close(self) -> None:
+        """
+        Check that the array is complete.
+
+        :raises ValueError: If the array is truncated or invalid
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._parse([])
+        if self._state != _DONE:
+            raise ValueError("incomplete JSON array")
+
+    def _parse(self, decoded: List[Any]) -> int:  # noqa: C901, WPS231
+        buffer = self._buffer
+        position = 0
+        while True:  # noqa: WPS457
+            position = _WHITESPACE.match(buffer, position).end()  # type: ignore
+            if position == len(buffer):
+                return position
+            char = buffer[position]
+            if self._state == _DONE:
+                raise ValueError("unexpected data after JSON array")
+            if self._state == _START:
+                if char != "[":
+                    raise ValueError("response body is not a JSON array")
+                self._state = _FIRST_ITEM
+                position += 1
+            elif self._state == _AFTER_ITEM:
+                if char not in ",]":
+                    raise ValueError(f"unexpected {char!r} between array items")
+                self._state = _NEXT_ITEM if char == "," else _DONE
+                position += 1
+            elif self._state == _FIRST_ITEM and char == "]":
+                self._state = _DONE
+                position += 1
+            else:
+                try:
+                    json_data, end = self._decode(buffer, position)
+                except json.JSONDecodeError:
+                    return position
+                # A number at the end of the buffer may continue in the next chunk
+                if end == len(buffer):
+                    return position
+                decoded.append(json_data)
+                self._state = _AFTER_ITEM
+                position = end
+
+
+class StreamProgress:
+    def __init__(self) -> None:
+        """
+        Initialize progress of a streamed response.
+
+        Time spent building items, and while they are handed to the consumer,
+        is excluded from the network time.
+        """
+        self.size = 0
+        self.parse_time: float = 0
+        self._started = time.perf_counter()
+        self._paused: float = 0
+
+    def network_time(self) -> float:
+        """
+        Measure time spent on the request so far, excluding consumer time.
+
+        :return: Seconds
+        """
+        return time.perf_counter() - self._started - self._paused
+
+    @contextmanager
+    def pause(self) -> Iterator[None]:
+        """
+        Exclude time spent inside the block from the network time.
+
+        :yield: Nothing
+        """
+        paused = time.perf_counter()
+        try:  # noqa: WPS501
+            yield
+        finally:
+            self._paused += time.perf_counter() - paused
+
+    @contextmanager
+    def parsing(self) -> Iterator[None]:
+        """
+        Count time spent inside the block as parse time, not network time.
+
+        :yield: Nothing
+        """
+        started = time.perf_counter()
+        try:  # noqa: WPS501
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.parse_time += elapsed
+            self._paused += elapsed
@@ -0,0 +1,155 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial, wraps
+from typing import Any, Callable, Coroutine, Dict, Iterable, Optional, TypeVar
+
+from magicpyden.api import MagicEdenApi
+from magicpyden.batch import BatchResult, collect, fetch_many
+from magicpyden.constants import DEFAULT_BATCH_CONCURRENCY
+
+T = TypeVar("T")  # noqa: WPS111
+
+AsyncMethod = Callable[..., Coroutine[Any, Any, T]]
+
+
+def _blocking(method: AsyncMethod[T]) -> Callable[..., T]:
+    @wraps(method)
+    def call(self: Any, *args: Any, **kwargs: Any) -> T:  # noqa: WPS430
+        return self.run(method(self.api, *args, **kwargs))
+
+    return call
+
+
+ClientT = TypeVar("ClientT", bound=type)
+
+
+def _with_blocking_getters(cls: ClientT) -> ClientT:
+    for name, method in inspect.getmembers(MagicEdenApi, inspect.iscoroutinefunction):
+        if name.startswith("get_"):
+            setattr(cls, name, _blocking(method))
+    return cls
+
+
+@_with_blocking_getters
+class MagicEdenSyncClient:
+    """
+    Blocking facade of ``MagicEdenApi`` for synchronous code.
+
+    Every ``get_*`` coroutine method of ``MagicEdenApi`` has a blocking
+    counterpart of the same name. They are generated when the class is defined,
+    so type checkers see them through ``__getattr__`` as callables returning
+    ``Any``.
+
+    One background thread runs an event loop and a long-lived session, so calls
+    from any thread share keep-alive connections, cache and rate limiter.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, **api_options: Any) -> None:
+        """
+        Start event loop thread and open session.
+
+        :param timeout: Seconds to wait for every call, unlimited by default
+        :param api_options: Keyword arguments of ``MagicEdenApi``
+        """
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="magicpyden", daemon=True
+        )
+        self._thread.start()
+        self.api: MagicEdenApi = self.run(self._open(api_options))
+
+    def __enter__(self) -> "MagicEdenSyncClient":
+        """
+        Enter context.
+
+        :return: MagicEden sync client instance
+        """
+        return self
+
+    def __exit__(self, *err) -> None:
+        """
+        Close client on exit.
+
+        :param err: Error args
+        """
+        self.close()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """
+        Declare the generated blocking methods to type checkers.
+
+        Only reached for attributes missing from the class, as generated methods
+        are set on it.
+
+        :param name: Name of attribute, e.g. ``"get_collection_stats"``
+        :raises AttributeError: Always
+        """
+        class_name = type(self).__name__
+        raise AttributeError(f"{class_name!r} object has no attribute {name!r}")
+
+    @property
+    def closed(self) -> bool:
+        """
+        Determine if client was closed.
+
+        :return: True once the event loop thread stopped
+        """
+        return not self._thread.is_alive()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run coroutine on the event loop thread and wait for its result.
+
+        :param coroutine: Coroutine, e.g. ``client.api.get_collection_stats(name)``
+        :return: Result of coroutine
+        :raises RuntimeError: If client is closed or called from its event loop
+        :raises FutureTimeoutError: If the call took longer than ``timeout``
+        """
+        if self.closed:
+            coroutine.close()
+            raise RuntimeError("client is closed")
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("blocking call from the client event loop")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def batch(
+        self,
+        method: str,
+        keys: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        **kwargs: Any,
+    ) -> Dict[str, BatchResult]:
+        """
+        Call ``get_*`` method for many keys concurrently on the event loop.
+
+        :param method: Name of method, e.g. ``"get_wallet_tokens"``
+        :param keys: First argument of every call, duplicates fetched once
+        :param concurrency: Maximum number of requests in flight
+        :param kwargs: Remaining arguments of every call
+        :return: Results with value or error by key
+        """
+        fetch = partial(getattr(self.api, method), **kwargs)
+        return self.run(collect(fetch_many(fetch, keys, concurrency)))
+
+    def close(self) -> None:
+        """Close session and stop event loop thread."""
+        if self.closed:
+            return
+        try:  # noqa: WPS501
+            self.run(self.api.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    async def _open(self, api_options: Dict[str, Any]) -> MagicEdenApi:
+        return await MagicEdenApi(**api_options).__aenter__()  # noqa: WPS609
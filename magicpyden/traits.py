@@ -0,0 +1,237 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from magicpyden.columnar import StringTable
+from magicpyden.schema import CollectionListingItem
+
+TraitKey = Tuple[str, str]
+TraitFilter = Mapping[str, Union[str, Iterable[str]]]
+
+CODE_TYPE = "i"
+COUNT_TYPE = "q"
+
+
+def _listing_price(listing: CollectionListingItem) -> float:
+    return float("inf") if listing.price is None else listing.price
+
+
+class TraitIndex:
+    def __init__(self) -> None:
+        """
+        Initialize index of the traits of a collection's tokens.
+
+        Every distinct trait type and value pair gets a code, with the number of
+        tokens having it in a packed array and the set of those tokens in an
+        inverted index.
+        """
+        self.mints: List[str] = []
+        self.trait_types = StringTable()
+        self.traits: List[TraitKey] = []
+        self.counts = array(COUNT_TYPE)
+        self._trait_type_codes = array(CODE_TYPE)
+        self._trait_codes: Dict[TraitKey, int] = {}
+        self._holders: List[Set[int]] = []
+        self._rows: Dict[str, int] = {}
+        self._token_traits: List["array[int]"] = []
+        self._scores: Optional[Any] = None
+
+    def __len__(self) -> int:
+        """
+        Count indexed tokens.
+
+        :return: Number of tokens
+        """
+        return len(self.mints)
+
+    def add(self, tokens: Iterable[Any]) -> int:
+        """
+        Index token metadata, replacing the traits of tokens indexed before.
+
+        :param tokens: Token metadata, plain or lazy models
+        :return: Number of tokens not indexed before
+        """
+        added = 0
+        for token in tokens:
+            row = self._rows.get(token.mint_address)
+            if row is None:
+                row = len(self.mints)
+                self._rows[token.mint_address] = row
+                self.mints.append(token.mint_address)
+                self._token_traits.append(array(CODE_TYPE))
+                added += 1
+            else:
+                self._remove_traits(row)
+
+            codes = array(
+                CODE_TYPE,
+                sorted(
+                    {
+                        self._trait_code(attribute.trait_type, attribute.value)
+                        for attribute in token.attributes
+                    }
+                ),
+            )
+            for code in codes:
+                self.counts[code] += 1
+                self._holders[code].add(row)
+            self._token_traits[row] = codes
+        self._scores = None
+        return added
+
+    def mints_with(self, trait_type: str, trait_value: str) -> Set[str]:
+        """
+        Find tokens having a trait.
+
+        :param trait_type: Trait type, e.g. "Background"
+        :param trait_value: Trait value
+        :return: Mint addresses
+        """
+        code = self._trait_codes.get((trait_type, trait_value))
+        if code is None:
+            return set()
+        return {self.mints[row] for row in self._holders[code]}
+
+    def select(self, traits: TraitFilter) -> List[str]:
+        """
+        Find tokens matching every trait type of the filter.
+
+        :param traits: Accepted value, or values, by trait type
+        :return: Mint addresses, in indexing order
+        """
+        rows: Optional[Set[int]] = None
+        for trait_type, trait_values in traits.items():
+            matched = self._rows_with(trait_type, trait_values)
+            rows = matched if rows is None else rows & matched
+        if rows is None:
+            return list(self.mints)
+        return [self.mints[row] for row in sorted(rows)]
+
+    def listings_with(
+        self, listings: Iterable[CollectionListingItem], traits: TraitFilter
+    ) -> List[CollectionListingItem]:
+        """
+        Keep priced listings of tokens matching the filter.
+
+        :param listings: Listings, e.g. from ``get_collection_listings``
+        :param traits: Accepted value, or values, by trait type
+        :return: Matching listings, cheapest first
+        """
+        mints = set(self.select(traits))
+        matched = [
+            listing
+            for listing in listings
+            if listing.token_mint in mints and listing.price is not None
+        ]
+        matched.sort(key=_listing_price)
+        return matched
+
+    def frequencies(self) -> Dict[TraitKey, float]:
+        """
+        Compute share of tokens having each trait.
+
+        :return: Share by trait type and value
+        """
+        total = len(self.mints)
+        return {
+            trait: count / total
+            for trait, count in zip(self.traits, self.counts)
+            if count
+        }
+
+    def rarity_scores(self) -> Any:
+        """
+        Score rarity of every token at once. Requires ``numpy``.
+
+        A token scores the sum, over every trait type, of the inverse share of
+        tokens with its value. Lacking a trait type counts as a value of its own.
+
+        :return: NumPy array of scores aligned with ``mints``, higher is rarer
+        """
+        import numpy  # noqa: WPS433
+
+        if self._scores is not None:
+            return self._scores
+        if not self.mints:
+            self._scores = numpy.zeros(0)
+            return self._scores
+
+        counts = numpy.frombuffer(self.counts, dtype=numpy.int64)
+        trait_types = numpy.frombuffer(self._trait_type_codes, dtype=numpy.intc)
+        missing_weights = self._missing_weights(counts, trait_types)
+        trait_weights = _inverse_shares(len(self.mints), counts)
+        trait_weights -= missing_weights[trait_types]
+        scores = self._sum_per_token(trait_weights).astype(float)
+        scores += missing_weights.sum()
+        self._scores = scores
+        return scores
+
+    def rarest(self, count: int) -> List[Tuple[str, float]]:
+        """
+        Rank rarest tokens. Requires ``numpy``.
+
+        :param count: Number of tokens to return
+        :return: Mint addresses and rarity scores, rarest first
+        """
+        scores = self.rarity_scores()
+        ranked = (-scores).argsort(kind="stable")[:count]
+        return [(self.mints[row], float(scores[row])) for row in ranked]
+
+    def _rows_with(
+        self, trait_type: str, trait_values: Union[str, Iterable[str]]
+    ) -> Set[int]:
+        if isinstance(trait_values, str):
+            trait_values = [trait_values]
+        rows: Set[int] = set()
+        for trait_value in trait_values:
+            code = self._trait_codes.get((trait_type, trait_value))
+            if code is not None:
+                rows |= self._holders[code]
+        return rows
+
+    def _missing_weights(self, counts: Any, trait_types: Any) -> Any:
+        import numpy  # noqa: WPS433
+
+        total = len(self.mints)
+        missing = total - numpy.bincount(
+            trait_types, weights=counts, minlength=len(self.trait_types)
+        )
+        return _inverse_shares(total, missing)
+
+    def _sum_per_token(self, trait_weights: Any) -> Any:
+        import numpy  # noqa: WPS433
+
+        total = len(self.mints)
+        codes = numpy.frombuffer(self._flat_codes(), dtype=numpy.intc)
+        sizes = numpy.fromiter(map(len, self._token_traits), numpy.intp, total)
+        rows = numpy.repeat(numpy.arange(total), sizes)
+        return numpy.bincount(rows, weights=trait_weights[codes], minlength=total)
+
+    def _flat_codes(self) -> "array[int]":
+        flat = array(CODE_TYPE)
+        for token_codes in self._token_traits:
+            flat.extend(token_codes)
+        return flat
+
+    def _trait_code(self, trait_type: str, trait_value: str) -> int:
+        trait = (trait_type, trait_value)
+        code = self._trait_codes.get(trait)
+        if code is None:
+            code = len(self.traits)
+            self._trait_codes[trait] = code
+            self.traits.append(trait)
+            self.counts.append(0)
+            self._trait_type_codes.append(self.trait_types.code(trait_type))
+            self._holders.append(set())
+        return code
+
+    def _remove_traits(self, row: int) -> None:
+        for code in self._token_traits[row]:
+            self.counts[code] -= 1
+            self._holders[code].discard(row)
+
+
+def _inverse_shares(total: int, counts: Any) -> Any:
+    import numpy  # noqa: WPS433
+
+    shares = numpy.zeros(len(counts))
+    return numpy.divide(total, counts, out=shares, where=counts > 0)
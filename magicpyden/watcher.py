@@ -0,0 +1,301 @@
+import asyncio
+import heapq
+import time
+from bisect import bisect_left, insort
+from enum import Enum
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from magicpyden.api import REQUEST_ERRORS, MagicEdenApi
+from magicpyden.constants import (
+    MAX_COLLECTION_LISTINGS_LIMIT,
+    WATCHER_BACKOFF_FACTOR,
+    WATCHER_MAX_INTERVAL,
+    WATCHER_MIN_INTERVAL,
+)
+from magicpyden.endpoint import EndPoint
+from magicpyden.parsing import parse_model
+from magicpyden.resilience import CircuitOpenError
+from magicpyden.schema import CollectionListingItem
+
+UNPRICED = float("inf")
+
+REFRESH_ERRORS = (*REQUEST_ERRORS, CircuitOpenError)
+
+
+class ListingChange(str, Enum):  # noqa: WPS600
+    added = "add"
+    removed = "remove"
+    price_changed = "price_change"
+
+
+class ListingEvent(NamedTuple):
+    change: ListingChange
+    collection: str
+    listing: CollectionListingItem
+    previous_price: Optional[float] = None
+
+
+def listing_key(row: Mapping[str, Any]) -> str:
+    """
+    Identify listing row.
+
+    :param row: Decoded listing
+    :return: Token address, or PDA address if missing
+    """
+    return row.get("tokenAddress") or row["pdaAddress"]
+
+
+def listing_price(row: Mapping[str, Any]) -> float:
+    """
+    Get sortable price of listing row.
+
+    :param row: Decoded listing
+    :return: Price, infinite when unpriced
+    """
+    price = row.get("price")
+    return UNPRICED if price is None else price
+
+
+class OrderBook:
+    def __init__(self, collection: str, trusted: bool = False) -> None:
+        """
+        Initialize listings of one collection indexed by key and sorted by price.
+
+        :param collection: Name of NFT collection
+        :param trusted: Build listing models without validation
+        """
+        self.collection = collection
+        self.trusted = trusted
+        self._rows: Dict[str, Mapping[str, Any]] = {}
+        self._listings: Dict[str, CollectionListingItem] = {}
+        self._prices: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        """
+        Count listings.
+
+        :return: Number of listings
+        """
+        return len(self._listings)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Determine if token is listed.
+
+        :param key: Token address
+        :return: True if listed
+        """
+        return key in self._listings
+
+    @property
+    def floor(self) -> Optional[CollectionListingItem]:
+        """
+        Cheapest listing.
+
+        :return: Listing, if any
+        """
+        if not self._prices:
+            return None
+        return self._listings[self._prices[0][1]]
+
+    def top(self, count: int) -> List[CollectionListingItem]:
+        """
+        Cheapest listings.
+
+        :param count: Number of listings
+        :return: Listings sorted by price
+        """
+        return [self._listings[key] for _, key in self._prices[:count]]
+
+    def apply(self, rows: Iterable[Mapping[str, Any]]) -> List[ListingEvent]:
+        """
+        Replace book with snapshot, building models only for changed rows.
+
+        :param rows: Decoded listings of the whole snapshot
+        :return: Add, remove and price-change events
+        """
+        snapshot = {listing_key(row): row for row in rows}
+        events = self._remove_missing(snapshot.keys())
+        for key, row in snapshot.items():
+            event = self._update(key, row)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _update(self, key: str, row: Mapping[str, Any]) -> Optional[ListingEvent]:
+        previous = self._rows.get(key)
+        if previous == row:
+            return None
+        if previous is None:
+            listing = self._add(key, row)
+            return ListingEvent(ListingChange.added, self.collection, listing)
+        self._remove(key)
+        listing = self._add(key, row)
+        if listing_price(previous) == listing_price(row):
+            return None
+        return ListingEvent(
+            ListingChange.price_changed,
+            self.collection,
+            listing,
+            previous.get("price"),
+        )
+
+    def _remove_missing(self, keys: AbstractSet[str]) -> List[ListingEvent]:
+        events = []
+        for key in self._rows.keys() - keys:
+            listing = self._remove(key)
+            events.append(ListingEvent(ListingChange.removed, self.collection, listing))
+        return events
+
+    def _add(self, key: str, row: Mapping[str, Any]) -> CollectionListingItem:
+        listing = parse_model(CollectionListingItem, row, trusted=self.trusted)
+        self._rows[key] = row
+        self._listings[key] = listing
+        insort(self._prices, (listing_price(row), key))
+        return listing
+
+    def _remove(self, key: str) -> CollectionListingItem:
+        row = self._rows.pop(key)
+        entry = (listing_price(row), key)
+        del self._prices[bisect_left(self._prices, entry)]  # noqa: WPS420
+        return self._listings.pop(key)
+
+
+class CollectionWatcher:
+    def __init__(  # noqa: WPS211
+        self,
+        api: MagicEdenApi,
+        collections: Iterable[str],
+        min_interval: float = WATCHER_MIN_INTERVAL,
+        max_interval: float = WATCHER_MAX_INTERVAL,
+        max_pages: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize watcher of collection listings.
+
+        :param api: Magic Eden API object
+        :param collections: Names of NFT collections to watch
+        :param min_interval: Seconds between refreshes of an active collection
+        :param max_interval: Seconds between refreshes of an idle collection
+        :param max_pages: Number of listing pages tracked per collection, all
+            by default. Listings past the last page are treated as removed
+        """
+        self.api = api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_pages = max_pages
+        self.books = {
+            name: OrderBook(name, trusted=api.trusted) for name in collections
+        }
+        self.intervals = {name: min_interval for name in self.books}
+        self._errors: Dict[str, Exception] = {}
+
+    def floor(self, collection: str) -> Optional[CollectionListingItem]:
+        """
+        Cheapest listing of collection.
+
+        :param collection: Name of NFT collection
+        :return: Listing, if any
+        """
+        return self.books[collection].floor
+
+    def top(self, collection: str, count: int) -> List[CollectionListingItem]:
+        """
+        Cheapest listings of collection.
+
+        :param collection: Name of NFT collection
+        :param count: Number of listings
+        :return: Listings sorted by price
+        """
+        return self.books[collection].top(count)
+
+    def last_error(self, collection: str) -> Optional[Exception]:
+        """
+        Error of the last refresh of collection by ``watch``.
+
+        :param collection: Name of NFT collection
+        :return: Error, None if the last refresh succeeded
+        """
+        return self._errors.get(collection)
+
+    async def refresh(self, collection: str) -> List[ListingEvent]:
+        """
+        Fetch listings of collection and diff them against the book.
+
+        Refreshes speed up when a collection changes and slow down when idle.
+
+        :param collection: Name of NFT collection
+        :return: Add, remove and price-change events
+        """
+        rows = await self._fetch_rows(collection)
+        events = self.books[collection].apply(rows)
+        self._adapt_interval(collection, speed_up=bool(events))
+        return events
+
+    async def watch(self) -> AsyncIterator[ListingEvent]:
+        """
+        Refresh every collection when due and stream its changes.
+
+        A collection failing to refresh is kept, its last error stored in
+        ``last_error``, and retried after a longer interval.
+
+        :yield: Add, remove and price-change events
+        """
+        schedule = [(time.monotonic(), name) for name in self.books]
+        heapq.heapify(schedule)
+        while schedule:
+            due, collection = heapq.heappop(schedule)
+            await asyncio.sleep(max(due - time.monotonic(), 0))
+            for event in await self._refresh_or_back_off(collection):
+                yield event
+            heapq.heappush(
+                schedule, (time.monotonic() + self.intervals[collection], collection)
+            )
+
+    async def _refresh_or_back_off(self, collection: str) -> List[ListingEvent]:
+        try:
+            events = await self.refresh(collection)
+        except REFRESH_ERRORS as error:
+            self._errors[collection] = error
+            self._adapt_interval(collection, speed_up=False)
+            return []
+        self._errors.pop(collection, None)
+        return events
+
+    def _adapt_interval(self, collection: str, speed_up: bool) -> None:
+        interval = self.intervals[collection]
+        if speed_up:
+            interval /= WATCHER_BACKOFF_FACTOR
+        else:
+            interval *= WATCHER_BACKOFF_FACTOR
+        self.intervals[collection] = min(
+            max(interval, self.min_interval), self.max_interval
+        )
+
+    async def _fetch_rows(self, collection: str) -> List[Mapping[str, Any]]:
+        rows: List[Mapping[str, Any]] = []
+        pages = 0
+        while self.max_pages is None or pages < self.max_pages:
+            body = await self.api.get_raw(
+                EndPoint.collection_listings,
+                collection,
+                offset=len(rows),
+                limit=MAX_COLLECTION_LISTINGS_LIMIT,
+            )
+            page = self.api.json_loads(body)
+            rows.extend(page)
+            pages += 1
+            if len(page) < MAX_COLLECTION_LISTINGS_LIMIT:
+                break
+        return rows
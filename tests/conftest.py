@@ -0,0 +1,61 @@
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pytest_asyncio import fixture
+
+from magicpyden import MagicEdenApi
+
+
+class FakeMagicEden:
+    """Local stand-in for the Magic Eden API serving canned payloads."""
+
+    def __init__(self) -> None:
+        self.base_url = ""
+        self.payloads: Dict[str, Any] = {}
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.failures: Deque[Tuple[int, Dict[str, str]]] = deque()
+        self.etags: Dict[str, str] = {}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        route = request.match_info["route"]
+        query = dict(request.query)
+        self.requests.append((route, query))
+
+        if self.failures:
+            status, headers = self.failures.popleft()
+            return web.json_response({}, status=status, headers=headers)
+
+        if route not in self.payloads:
+            return web.json_response({}, status=404)
+
+        etag = self.etags.get(route)
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        headers = {} if etag is None else {"ETag": etag}
+        payload = self.payloads[route]
+        if isinstance(payload, list) and "offset" in query:
+            offset = int(query["offset"])
+            payload = payload[offset : offset + int(query["limit"])]
+        return web.json_response(payload, headers=headers)
+
+
+@fixture
+async def fake_magic_eden():
+    fake = FakeMagicEden()
+    app = web.Application()
+    app.router.add_get("/v2/{route:.*}", fake.handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    fake.base_url = str(server.make_url("/v2"))
+    yield fake
+    await server.close()
+
+
+@fixture
+async def offline_api(fake_magic_eden: FakeMagicEden):
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url) as api:
+        yield api
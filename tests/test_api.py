@@ -1,5 +1,4 @@
 import asyncio
-from asyncio import sleep
 
 import pytest
 from pytest_asyncio import fixture
@@ -27,7 +26,6 @@ async def test_get_token_metadata(fixture_api: MagicEdenApi):
 
     assert isinstance(token_metadata, TokenMetadata)
     assert token_metadata.mint_address == token_mint
-    await sleep(1)
 
 
 async def test_get_token_listings(fixture_api: MagicEdenApi):
@@ -37,7 +35,6 @@ async def test_get_token_listings(fixture_api: MagicEdenApi):
         token_listings = await api.get_token_listings(token_mint=token_mint)
 
     assert isinstance(token_listings, list)
-    await sleep(1)
 
 
 async def test_get_token_offers_received(fixture_api: MagicEdenApi):
@@ -49,7 +46,6 @@ async def test_get_token_offers_received(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(token_offers_received, list)
-    await sleep(1)
 
 
 async def test_get_token_activities(fixture_api: MagicEdenApi):
@@ -59,7 +55,6 @@ async def test_get_token_activities(fixture_api: MagicEdenApi):
         token_activities = await api.get_token_activities(token_mint=token_mint)
 
     assert isinstance(token_activities, list)
-    await sleep(1)
 
 
 async def test_get_wallet_tokens(fixture_api: MagicEdenApi):
@@ -69,7 +64,6 @@ async def test_get_wallet_tokens(fixture_api: MagicEdenApi):
         owned_tokens = await api.get_wallet_tokens(wallet_address=wallet_address)
 
     assert isinstance(owned_tokens, list)
-    await sleep(1)
 
 
 async def test_get_wallet_activities(fixture_api: MagicEdenApi):
@@ -81,7 +75,6 @@ async def test_get_wallet_activities(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(wallet_activities, list)
-    await sleep(1)
 
 
 async def test_get_wallet_offers_made(fixture_api: MagicEdenApi):
@@ -93,7 +86,6 @@ async def test_get_wallet_offers_made(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(wallet_offers_made, list)
-    await sleep(1)
 
 
 async def test_get_wallet_offers_received(fixture_api: MagicEdenApi):
@@ -105,7 +97,6 @@ async def test_get_wallet_offers_received(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(wallet_offers_received, list)
-    await sleep(1)
 
 
 async def test_get_wallet_escrow_balance(fixture_api: MagicEdenApi):
@@ -117,7 +108,6 @@ async def test_get_wallet_escrow_balance(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(wallet_ecsrow, EscrowBalance)
-    await sleep(1)
 
 
 async def test_get_collections(fixture_api: MagicEdenApi):
@@ -131,7 +121,6 @@ async def test_get_collections(fixture_api: MagicEdenApi):
         assert isinstance(collections, list)
         assert isinstance(collections_with_offset, list)
         assert collections != collections_with_offset
-    await sleep(1)
 
 
 async def test_get_collection_listings(fixture_api: MagicEdenApi):
@@ -141,7 +130,6 @@ async def test_get_collection_listings(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(collection_listings, list)
-    await sleep(1)
 
 
 async def test_get_collection_activities(fixture_api: MagicEdenApi):
@@ -151,7 +139,6 @@ async def test_get_collection_activities(fixture_api: MagicEdenApi):
         )
 
     assert isinstance(collection_activities, list)
-    await sleep(1)
 
 
 async def test_get_collection_stats(fixture_api: MagicEdenApi):
@@ -159,7 +146,6 @@ async def test_get_collection_stats(fixture_api: MagicEdenApi):
         collection_stats = await api.get_collection_stats(collection_name="degods")
 
     assert isinstance(collection_stats, CollectionStats)
-    await sleep(1)
 
 
 async def test_get_launchpad_collections(fixture_api: MagicEdenApi):
@@ -167,4 +153,3 @@ async def test_get_launchpad_collections(fixture_api: MagicEdenApi):
         launchpad_collections = await api.get_launchpad_collections()
 
     assert isinstance(launchpad_collections, list)
-    await sleep(1)
@@ -0,0 +1,38 @@
+import asyncio
+
+from magicpyden.batch import fetch_many
+from magicpyden.schema import CollectionStats
+
+
+async def test_get_many_collection_stats_reports_errors_per_key(
+    fake_magic_eden, offline_api
+):
+    for name in ("degods", "y00ts"):
+        fake_magic_eden.payloads[f"collections/{name}/stats"] = {"symbol": name}
+
+    results = await offline_api.get_many_collection_stats(
+        ["degods", "missing", "y00ts", "degods"], concurrency=2
+    )
+
+    assert set(results) == {"degods", "missing", "y00ts"}
+    assert isinstance(results["degods"].value, CollectionStats)
+    assert results["y00ts"].ok
+    assert not results["missing"].ok
+    assert len(fake_magic_eden.requests) == 3
+
+
+async def test_fetch_many_bounds_concurrency_and_streams_completions():
+    in_flight, peak = 0, 0
+
+    async def fetch(key: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * int(key))
+        in_flight -= 1
+        return int(key) * 2
+
+    results = [result async for result in fetch_many(fetch, map(str, range(20)), 4)]
+
+    assert peak == 4
+    assert sorted(result.value for result in results) == list(range(0, 40, 2))
@@ -0,0 +1,124 @@
+import time
+
+from benchmarks.payloads import TOKEN_METADATA
+from magicpyden import MagicEdenApi
+from magicpyden.cache import (
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+    ValidatorStore,
+    make_cache_key,
+)
+from magicpyden.endpoint import EndPoint
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=60)
+    cache.get("a")
+    cache.set("c", b"3", ttl=60)
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache()
+    cache.set("a", b"1", ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_is_shared_between_connections(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    writer, reader = SQLiteCache(path, max_size=2), SQLiteCache(path)
+
+    for key in ("a", "b", "c"):
+        writer.set(key, key.encode(), ttl=60)
+
+    assert reader.get("a") is None
+    assert reader.get("c") == b"c"
+    writer.close()
+    reader.close()
+
+
+def test_cache_key_ignores_parameter_order():
+    first = make_cache_key(EndPoint.collections, (), {"offset": 0, "limit": 10})
+    second = make_cache_key(EndPoint.collections, (), {"limit": 10, "offset": 0})
+
+    assert first == second
+
+
+async def test_api_serves_cached_responses(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    fake_magic_eden.payloads["collections/degods/activities"] = []
+    cache = ResponseCache()
+
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url, cache=cache) as api:
+        for _ in range(3):
+            stats = await api.get_collection_stats(collection_name="degods")
+            await api.get_collection_activities(collection_name="degods")
+
+    assert stats.symbol == "degods"
+    assert len(fake_magic_eden.requests) == 4
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+async def test_api_cache_honours_endpoint_ttls(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    cache = ResponseCache(ttls={EndPoint.collection_stats: 0})
+
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url, cache=cache) as api:
+        await api.get_collection_stats(collection_name="degods")
+        await api.get_collection_stats(collection_name="degods")
+
+    assert len(fake_magic_eden.requests) == 2
+    assert cache.hit_ratio == 0
+
+
+async def test_api_revalidates_with_etag(fake_magic_eden):
+    route = "tokens/mint"
+    fake_magic_eden.payloads[route] = TOKEN_METADATA
+    fake_magic_eden.etags[route] = '"v1"'
+    validators = ValidatorStore()
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, validators=validators
+    ) as api:
+        first = await api.get_token_metadata("mint")
+        second = await api.get_token_metadata("mint")
+        assert validators.revalidated == 1
+        assert second is first
+
+        fake_magic_eden.payloads[route] = {**TOKEN_METADATA, "name": "renamed"}
+        fake_magic_eden.etags[route] = '"v2"'
+        third = await api.get_token_metadata("mint")
+
+    assert third.name == "renamed"
+    assert validators.get(make_cache_key(EndPoint.token_metadata, ("mint",), {}))
+
+
+def test_validator_store_builds_conditional_headers():
+    validators = ValidatorStore(max_size=1)
+    validators.set("a", {"ETag": '"v1"', "Last-Modified": "yesterday"}, b"{}")
+    validators.set("b", {}, b"{}")
+
+    assert validators.get("a").headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "yesterday",
+    }
+    assert validators.get("b") is None
+    validators.set("c", {"ETag": '"v1"'}, b"{}")
+    assert validators.get("a") is None
+
+
+def test_expired_entries_stay_available_as_stale():
+    cache = ResponseCache(ttls={EndPoint.collection_stats: 0.01})
+    cache.set(EndPoint.collection_stats, "a", b"1")
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == b"1"
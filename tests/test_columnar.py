@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+from benchmarks.payloads import make_payload
+from magicpyden.columnar import ActivityTable, ListingTable, StringTable
+from magicpyden.endpoint import EndPoint
+
+
+def test_activity_table_interns_repeated_strings():
+    table = ActivityTable()
+    rows = make_payload(EndPoint.collection_activities, size=10)
+    rows[0]["price"] = None
+    rows[1]["buyer"] = None
+
+    table.extend(rows)
+
+    assert len(table) == 10
+    assert len(table.strings) == 6
+    assert math.isnan(table.columns["price"][0])
+    assert table.decode("buyer")[:2] == [rows[0]["buyer"], None]
+    assert table.columns["signature"] == [row["signature"] for row in rows]
+
+
+def test_tables_share_string_table():
+    strings = StringTable()
+    activities, listings = ActivityTable(strings), ListingTable(strings)
+
+    activities.extend(make_payload(EndPoint.collection_activities, size=2))
+    listings.extend(make_payload(EndPoint.collection_listings, size=2))
+
+    assert activities.decode("token_mint") == listings.decode("token_mint")
+
+
+def test_to_numpy_copies_packed_columns():
+    numpy = pytest.importorskip("numpy")
+    table = ActivityTable()
+    table.extend(make_payload(EndPoint.collection_activities, size=5))
+
+    arrays = table.to_numpy()
+
+    assert arrays["slot"].dtype == numpy.int64
+    assert arrays["price"].sum() == pytest.approx(325.5 * 5)
+    table.extend(make_payload(EndPoint.collection_activities, size=1))
+    assert len(arrays["block_time"]) == 5
+
+
+async def test_collection_activity_table_spans_pages(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads["collections/degods/activities"] = make_payload(
+        EndPoint.collection_activities, size=25
+    )
+
+    table = await offline_api.get_collection_activity_table("degods", limit=10)
+
+    assert len(table) == 25
+    assert list(table.columns["slot"]) == sorted(table.columns["slot"], reverse=True)
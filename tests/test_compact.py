@@ -0,0 +1,65 @@
+import pytest
+
+from benchmarks.payloads import ACTIVITY, MINT, TOKEN_LISTING, WALLET
+from magicpyden import MagicEdenApi
+from magicpyden.compact import (
+    ActivitySource,
+    ActivityType,
+    Address,
+    CompactMode,
+    b58decode,
+    b58encode,
+)
+from magicpyden.parsing import parse_model
+from magicpyden.schema import CollectionActivities, TokenListingItem
+from magicpyden.storage import ActivityStore
+
+
+def test_base58_round_trip():
+    assert b58encode(b58decode("1112")) == "1112"
+    assert b58decode("1112") == b"\0\0\0\1"
+    assert str(Address.from_base58(MINT)) == MINT
+    with pytest.raises(ValueError):
+        Address.from_base58("0OIl")
+    with pytest.raises(ValueError):
+        Address.from_base58("abc")
+
+
+def test_compact_mode_interns_repeated_strings():
+    rows = [dict(ACTIVITY, source="unknown") for _ in range(3)]
+    models = parse_model(CollectionActivities, rows)
+
+    CompactMode().apply(models)
+
+    assert models[0].type is ActivityType.buy_now
+    assert models[0].type == "buyNow"
+    assert models[1].source is models[2].source
+    assert models[1].seller is models[2].seller
+    assert models[1].token_mint == MINT
+
+
+def test_compact_mode_decodes_addresses():
+    compact = CompactMode(decode_addresses=True)
+    first, second = (
+        compact.apply(TokenListingItem.parse_obj(TOKEN_LISTING)) for _ in range(2)
+    )
+
+    assert isinstance(first.token_mint, Address)
+    assert str(first.seller) == WALLET
+    assert first.seller is second.seller
+    assert first.token_mint is not second.token_mint
+
+
+async def test_api_applies_compact_mode(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/activities"] = [ACTIVITY]
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url,
+        compact=CompactMode(decode_addresses=True),
+    ) as api:
+        activities = await api.get_collection_activities("degods")
+
+    assert activities[0].source is ActivitySource.magiceden_v2
+    store = ActivityStore()
+    store.add(activities)
+    assert store.last_sale(MINT).seller == str(activities[0].seller)
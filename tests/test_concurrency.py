@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientResponseError
+
+from benchmarks.mock_server import MockMagicEden
+from magicpyden import MagicEdenApi
+from magicpyden.concurrency import AdaptiveConcurrency, AimdLimit, is_overload
+from magicpyden.endpoint import EndPoint
+from magicpyden.hooks import RequestEvent
+from magicpyden.ratelimit import RateLimiter
+
+
+def test_limit_grows_additively_while_healthy():
+    limit = AimdLimit(initial_limit=4)
+    for _ in range(4):
+        limit.observe(0.1, overloaded=False)
+
+    assert limit.limit == 4
+    limit.observe(0.1, overloaded=False)
+    assert limit.limit == 5
+
+
+def test_limit_is_cut_once_per_latency_window():
+    limit = AimdLimit(initial_limit=16, min_limit=2)
+    limit.observe(60, overloaded=False)
+    limit.observe(60, overloaded=True)
+    limit.observe(60, overloaded=True)
+
+    assert limit.limit == 8
+
+    limit.latency = 0
+    for _ in range(5):
+        limit.observe(0, overloaded=True)
+    assert limit.limit == 2
+
+
+def test_latency_spike_cuts_limit():
+    limit = AimdLimit(initial_limit=10, latency_tolerance=2)
+    limit.observe(0.1, overloaded=False)
+    limit.observe(0.25, overloaded=False)
+    assert limit.limit == 10
+
+    limit.observe(1, overloaded=False)
+    assert limit.limit == 5
+
+
+async def test_acquire_waits_for_a_free_slot():
+    limit = AimdLimit(initial_limit=1, max_limit=2)
+    await limit.acquire()
+    waiter = asyncio.ensure_future(limit.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limit.observe(0, overloaded=False)
+    await asyncio.sleep(0)
+    assert waiter.done()
+    assert limit.in_flight == 2
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        AimdLimit(initial_limit=10, max_limit=5)
+
+
+def failed(status):
+    error = ClientResponseError(None, (), status=status)
+    return RequestEvent(EndPoint.collection_stats, status=status, error=error)
+
+
+def test_overload_signals():
+    endpoint = EndPoint.collection_stats
+
+    assert is_overload(failed(503))
+    assert is_overload(failed(429))
+    assert is_overload(RequestEvent(endpoint, error=asyncio.TimeoutError()))
+    assert not is_overload(failed(404))
+    assert not is_overload(RequestEvent(endpoint, status=200))
+
+
+def test_endpoint_options_override_common_ones():
+    concurrency = AdaptiveConcurrency(
+        {EndPoint.wallet_tokens: {"initial_limit": 2, "max_limit": 2}},
+        initial_limit=8,
+    )
+
+    assert concurrency.limiter(EndPoint.wallet_tokens).max_limit == 2
+    assert concurrency.limits == {EndPoint.wallet_tokens: 2}
+    assert concurrency.limiter(EndPoint.collection_stats).limit == 8
+
+
+async def test_api_adapts_limit_to_upstream_health():
+    server = MockMagicEden()
+    await server.start()
+    concurrency = AdaptiveConcurrency(initial_limit=2)
+    try:
+        async with MagicEdenApi(
+            base_url=server.base_url,
+            max_retries=0,
+            rate_limiter=RateLimiter(rate=1000, burst=1000),
+            concurrency=concurrency,
+        ) as api:
+            await asyncio.gather(
+                *(
+                    api.get_raw(EndPoint.collection_stats, str(index))
+                    for index in range(40)
+                )
+            )
+            healthy_limit = concurrency.limits[EndPoint.collection_stats]
+
+            server.error_rate = 1
+            with pytest.raises(ClientResponseError):
+                await api.get_raw(EndPoint.collection_stats, "degods")
+    finally:
+        await server.close()
+
+    assert healthy_limit > 2
+    assert concurrency.limits[EndPoint.collection_stats] == healthy_limit // 2
+    assert concurrency.limiter(EndPoint.collection_stats).in_flight == 0
@@ -0,0 +1,95 @@
+import asyncio
+from functools import partial
+import json
+import multiprocessing
+
+from benchmarks.payloads import COLLECTION, COLLECTION_LISTING
+from magicpyden.__main__ import create_parser
+from magicpyden.crawler import (
+    CrawlOptions,
+    SharedRateLimiter,
+    crawl,
+    read_checkpoint,
+)
+
+SYMBOLS = ["a", "b", "c", "d", "e"]
+
+
+def in_thread(function, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, partial(function, *args, **kwargs))
+
+
+def _spend(rate_limiter, count):
+    for _ in range(count):
+        asyncio.run(rate_limiter.acquire())
+
+
+def test_shared_rate_limiter_spends_one_budget():
+    rate_limiter = SharedRateLimiter(rate=0.1, burst=10)
+    worker = multiprocessing.get_context("fork").Process(
+        target=_spend, args=(rate_limiter, 4)
+    )
+    worker.start()
+    worker.join()
+
+    assert rate_limiter._tokens < 7  # noqa: WPS437
+    rate_limiter.throttle()
+    assert rate_limiter.rate == 0.1
+
+
+def test_read_checkpoint_truncates_partial_line(tmp_path):
+    path = tmp_path / "shard-0.ndjson"
+    path.write_text('{"symbol": "a"}\n{"symbol": "b"}\n{"symb')
+
+    assert read_checkpoint(path) == {"a", "b"}
+    assert path.read_text() == '{"symbol": "a"}\n{"symbol": "b"}\n'
+
+
+async def test_crawl_shards_and_resumes(fake_magic_eden, tmp_path):
+    fake_magic_eden.payloads["collections"] = [
+        {**COLLECTION, "symbol": symbol} for symbol in SYMBOLS
+    ]
+    for symbol in SYMBOLS:
+        fake_magic_eden.payloads[f"collections/{symbol}/stats"] = {"symbol": symbol}
+        fake_magic_eden.payloads[f"collections/{symbol}/listings"] = [
+            COLLECTION_LISTING
+        ] * (25 if symbol == "a" else 3)
+    del fake_magic_eden.payloads["collections/e/stats"]  # noqa: WPS420
+    options = CrawlOptions(base_url=fake_magic_eden.base_url)
+
+    results = await in_thread(
+        crawl, tmp_path, workers=2, rate=1000, burst=1000, options=options
+    )
+    assert sum(shard.written for shard in results) == 4
+    assert [symbol for shard in results for symbol in shard.failed] == ["e"]
+
+    fake_magic_eden.payloads["collections/e/stats"] = {"symbol": "e"}
+    fake_magic_eden.requests.clear()
+    results = await in_thread(
+        crawl, tmp_path, workers=3, rate=1000, burst=1000, options=options
+    )
+    assert sum(shard.written for shard in results) == 1
+    assert {route for route, _ in fake_magic_eden.requests} == {
+        "collections",
+        "collections/e/stats",
+        "collections/e/listings",
+    }
+
+    records = [
+        json.loads(line)
+        for path in tmp_path.glob("shard-*.ndjson")
+        for line in path.read_text().splitlines()
+    ]
+    assert sorted(record["symbol"] for record in records) == SYMBOLS
+    assert {len(record["listings"]) for record in records} == {25, 3}
+
+
+def test_crawl_command_arguments():
+    arguments = create_parser().parse_args(["crawl", "out", "--workers", "4"])
+
+    assert (arguments.command, arguments.output, arguments.workers) == (
+        "crawl",
+        "out",
+        4,
+    )
@@ -0,0 +1,34 @@
+import json
+
+from magicpyden import MagicEdenApi
+from magicpyden.endpoint import EndPoint
+from magicpyden.schema import CollectionStats
+
+
+async def test_get_raw_returns_undecoded_body(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads["collections/degods/activities"] = [{"signature": "a"}]
+
+    body = await offline_api.get_raw(
+        EndPoint.collection_activities, "degods", offset=0, limit=100
+    )
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == [{"signature": "a"}]
+    assert fake_magic_eden.requests[0][1] == {"offset": "0", "limit": "100"}
+
+
+async def test_pluggable_json_loads_decodes_bytes(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    decoded = []
+
+    def json_loads(body: bytes):
+        decoded.append(body)
+        return json.loads(body)
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, json_loads=json_loads
+    ) as api:
+        stats = await api.get_collection_stats("degods")
+
+    assert isinstance(stats, CollectionStats)
+    assert isinstance(decoded[0], bytes)
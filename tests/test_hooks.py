@@ -0,0 +1,84 @@
+import pytest
+
+from magicpyden import MagicEdenApi
+from magicpyden.endpoint import EndPoint
+from magicpyden.hooks import (
+    LatencyHistogram,
+    MetricsCollector,
+    PrometheusHook,
+    RequestEvent,
+    RequestHook,
+)
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, event):
+        self.events.append(("start", event))
+
+    def on_response(self, event):
+        self.events.append(("response", event))
+
+    def on_retry(self, event):
+        self.events.append(("retry", event))
+
+    def on_parse_done(self, event):
+        self.events.append(("parse", event))
+
+
+async def test_hooks_receive_request_lifecycle(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    fake_magic_eden.failures.append((503, {"Retry-After": "0"}))
+    hook, metrics = RecordingHook(), MetricsCollector()
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, hooks=[hook, metrics]
+    ) as api:
+        await api.get_collection_stats("degods")
+
+    assert [name for name, _ in hook.events] == [
+        "start",
+        "response",
+        "retry",
+        "start",
+        "response",
+        "parse",
+    ]
+    response = hook.events[4][1]
+    assert response.endpoint is EndPoint.collection_stats
+    assert response.status == 200
+    assert response.size > 0
+    assert response.network_time > 0
+
+    summary = metrics.summary()["collection_stats"]
+    assert summary["requests"] == 2
+    assert summary["retries"] == 1
+    assert summary["errors"] == 1
+    assert summary["statuses"] == {503: 1, 200: 1}
+
+
+def test_latency_histogram_quantiles():
+    histogram = LatencyHistogram(buckets=(0.01, 0.1, 1))
+    for duration in [0.005] * 98 + [0.5, 5]:
+        histogram.observe(duration)
+
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.99) == 1
+    assert histogram.quantile(1) == float("inf")
+    assert histogram.mean == pytest.approx(0.0599)
+
+
+def test_prometheus_hook_exports_metrics():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    hook = PrometheusHook(registry=registry)
+    hook.on_response(RequestEvent(EndPoint.collections, status=200, network_time=0.1))
+
+    assert (
+        registry.get_sample_value(
+            "magicpyden_responses_total", {"endpoint": "collections", "status": "200"}
+        )
+        == 1
+    )
@@ -0,0 +1,68 @@
+from benchmarks.payloads import make_payload
+from magicpyden.endpoint import EndPoint
+from magicpyden.incremental import ActivitySync, HighWaterMark, WatermarkStore
+from magicpyden.schema import CollectionActivityItem
+
+ROUTE = "collections/degods/activities"
+
+
+def history(size: int):
+    return make_payload(EndPoint.collection_activities, size=size)
+
+
+async def test_sync_emits_only_new_activities(fake_magic_eden, offline_api):
+    rows = history(30)
+    fake_magic_eden.payloads[ROUTE] = rows[10:]
+    sync = ActivitySync(offline_api, page_size=5)
+
+    first = await sync.sync_collection("degods")
+    assert [item.signature for item in first] == [
+        row["signature"] for row in rows[10:15]
+    ]
+
+    fake_magic_eden.payloads[ROUTE] = rows
+    fake_magic_eden.requests.clear()
+    second = await sync.sync_collection("degods")
+
+    assert [item.signature for item in second] == [
+        row["signature"] for row in rows[:10]
+    ]
+    assert len(fake_magic_eden.requests) == 3
+
+    fake_magic_eden.requests.clear()
+    assert await sync.sync_collection("degods") == []
+    assert len(fake_magic_eden.requests) == 1
+
+
+async def test_backfill_fetches_whole_history(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads[ROUTE] = history(12)
+    sync = ActivitySync(offline_api, page_size=5)
+
+    activities = await sync.sync_collection("degods", backfill=True)
+
+    assert len(activities) == 12
+
+
+def test_mark_keeps_signatures_of_shared_slot():
+    mark = HighWaterMark(slot=10, block_time=100, signatures=["a"])
+    newer = mark.advance([_activity("b", 10)])
+
+    assert newer.signatures == ["b", "a"]
+    assert newer.has_seen(_activity("a", 10))
+    assert not newer.has_seen(_activity("c", 10))
+    assert newer.has_seen(_activity("d", 9))
+
+
+def test_watermark_store_persists_marks(tmp_path):
+    path = str(tmp_path / "marks.sqlite")
+    mark = HighWaterMark(slot=10, block_time=100, signatures=["a"])
+    WatermarkStore(path).set("wallet", "abc", mark)
+
+    assert WatermarkStore(path).get("wallet", "abc") == mark
+    assert WatermarkStore(path).get("wallet", "xyz") is None
+
+
+def _activity(signature: str, slot: int):
+    return CollectionActivityItem.construct(
+        signature=signature, slot=slot, block_time=slot * 10
+    )
@@ -0,0 +1,68 @@
+import pytest
+from pydantic import ValidationError
+
+from benchmarks.payloads import ACTIVITY, TOKEN_METADATA
+from magicpyden import MagicEdenApi
+from magicpyden.compact import CompactMode
+from magicpyden.lazy import LazyList, LazyModel, parse_lazy
+from magicpyden.schema import (
+    CollectionActivities,
+    CollectionStats,
+    TokenMetadata,
+    Tokens,
+)
+
+
+def test_lazy_list_builds_rows_on_access():
+    rows = [dict(ACTIVITY, price=index) for index in range(3)]
+    activities = parse_lazy(CollectionActivities, rows)
+
+    assert isinstance(activities, LazyList)
+    assert len(activities) == 3
+    assert activities[1] is activities[1]
+    assert [activity.price for activity in activities] == [0, 1, 2]
+    assert activities[1:][0].price == 1
+    assert activities.to_models()[2].block_time == ACTIVITY["blockTime"]
+
+
+def test_lazy_model_validates_only_accessed_fields():
+    metadata = parse_lazy(TokenMetadata, dict(TOKEN_METADATA, supply="many"))
+
+    assert metadata.mint_address == TOKEN_METADATA["mintAddress"]
+    assert metadata.properties.creators[1].share == 100
+    assert isinstance(metadata.properties, LazyModel)
+    with pytest.raises(ValidationError):
+        metadata.supply
+    with pytest.raises(AttributeError):
+        metadata.unknown
+
+
+def test_lazy_model_reports_missing_and_default_fields():
+    stats = parse_lazy(CollectionStats, {"floorPrice": "12"})
+
+    assert stats.floor_price == 12.0
+    assert stats.listed_count is None
+    with pytest.raises(ValidationError):
+        stats.symbol
+
+
+def test_trusted_lazy_model_skips_validation():
+    tokens = parse_lazy(Tokens, [dict(TOKEN_METADATA, supply="many")], trusted=True)
+
+    assert tokens[0].supply == "many"
+    assert tokens[0].to_model().supply == "many"
+
+
+async def test_api_returns_lazy_results(fake_magic_eden):
+    fake_magic_eden.payloads["wallets/wallet/tokens"] = [TOKEN_METADATA]
+
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url, lazy=True) as api:
+        tokens = await api.get_wallet_tokens("wallet")
+
+    assert tokens[0].name == TOKEN_METADATA["name"]
+    assert tokens[0].dict() == TokenMetadata.parse_obj(TOKEN_METADATA).dict()
+
+
+def test_api_rejects_lazy_compact_mode():
+    with pytest.raises(ValueError):
+        MagicEdenApi(lazy=True, compact=CompactMode())
@@ -0,0 +1,49 @@
+import pytest
+from aiohttp import ClientResponseError
+from pytest_asyncio import fixture
+
+from benchmarks.bench_api import METHODS
+from benchmarks.mock_server import MockMagicEden, replay_session
+from benchmarks.payloads import make_payload
+from magicpyden import MagicEdenApi
+from magicpyden.endpoint import EndPoint
+
+
+@fixture
+async def mock_server():
+    server = MockMagicEden(history_size=50)
+    await server.start()
+    yield server
+    await server.close()
+
+
+@pytest.mark.parametrize("call", METHODS, ids=lambda call: call.__name__)
+async def test_every_get_method_parses_recorded_payloads(mock_server, call):
+    async with MagicEdenApi(base_url=mock_server.base_url) as api:
+        parsed = await call(api, "degods")
+
+    assert parsed
+
+
+async def test_replay_session_answers_without_network():
+    payload = make_payload(EndPoint.collection_activities, size=3)
+    session = replay_session(payload)
+
+    async with MagicEdenApi(base_url="http://unreachable", session=session) as api:
+        parsed = await api.get_collection_activities("degods")
+
+    assert [item.price for item in parsed] == [row["price"] for row in payload]
+    assert not session.closed
+
+
+async def test_mock_server_injects_failures():
+    server = MockMagicEden(error_rate=1)
+    await server.start()
+    try:
+        async with MagicEdenApi(base_url=server.base_url, max_retries=0) as api:
+            with pytest.raises(ClientResponseError):
+                await api.get_collection_stats("degods")
+    finally:
+        await server.close()
+
+    assert server.counters["errors"] == 1
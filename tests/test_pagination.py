@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from magicpyden import MagicEdenApi
+from magicpyden.pagination import paginate
+from magicpyden.schema import CollectionActivityItem
+
+
+def make_activity(index: int) -> dict:
+    return {
+        "signature": f"sig{index}",
+        "type": "buyNow",
+        "source": "magiceden_v2",
+        "collection": "degods",
+        "buyerReferral": "",
+        "sellerReferral": "",
+        "slot": 1000 - index,
+        "blockTime": 2000 - index,
+        "price": 1.5,
+    }
+
+
+async def test_iter_collection_activities(fake_magic_eden, offline_api: MagicEdenApi):
+    fake_magic_eden.payloads["collections/degods/activities"] = [
+        make_activity(index) for index in range(45)
+    ]
+
+    activities = [
+        activity
+        async for activity in offline_api.iter_collection_activities(
+            collection_name="degods", limit=10
+        )
+    ]
+
+    assert all(isinstance(item, CollectionActivityItem) for item in activities)
+    assert [item.signature for item in activities] == [
+        f"sig{index}" for index in range(45)
+    ]
+
+
+async def test_paginate_bounds_prefetch_window():
+    in_flight, peak = 0, 0
+
+    async def fetch_page(offset: int, limit: int):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return list(range(offset, min(offset + limit, 95)))
+
+    items = [item async for item in paginate(fetch_page, 0, 10, prefetch=3)]
+
+    assert items == list(range(95))
+    assert peak == 3
+
+
+async def test_paginate_cancels_prefetched_pages_on_break():
+    started = []
+
+    async def fetch_page(offset: int, limit: int):
+        started.append(offset)
+        await asyncio.sleep(0 if offset < 10 else 10)
+        return list(range(offset, offset + limit))
+
+    pages = paginate(fetch_page, 0, 5, prefetch=4)
+    async for item in pages:
+        if item == 7:
+            break
+    await pages.aclose()
+
+    assert started == [0, 5, 10]
+
+
+async def test_paginate_grows_window_after_full_pages():
+    started = []
+
+    async def fetch_page(offset: int, limit: int):
+        started.append(offset)
+        return list(range(offset, min(offset + limit, 25)))
+
+    short = [item async for item in paginate(fetch_page, 0, 30, prefetch=3)]
+    assert short == list(range(25))
+    assert started == [0]
+
+    started.clear()
+    items = [item async for item in paginate(fetch_page, 0, 5, prefetch=3)]
+    assert items == list(range(25))
+    assert started == [0, 5, 10, 15, 20, 25]
+
+
+async def test_paginate_rejects_empty_window():
+    with pytest.raises(ValueError):
+        await paginate(None, 0, 0, prefetch=1).__anext__()
@@ -0,0 +1,58 @@
+import pytest
+
+from benchmarks.payloads import make_payload
+from magicpyden import MagicEdenApi
+from magicpyden.endpoint import EndPoint
+from magicpyden.parsing import construct_model, parse_model
+from magicpyden.schema import (
+    CollectionActivities,
+    CollectionStats,
+    EscrowBalance,
+    Properties,
+    TokenMetadata,
+    Tokens,
+    WalletOffersMade,
+)
+
+
+@pytest.mark.parametrize(
+    "endpoint, model",
+    [
+        (EndPoint.collection_activities, CollectionActivities),
+        (EndPoint.wallet_tokens, Tokens),
+        (EndPoint.wallet_offers_made, WalletOffersMade),
+        (EndPoint.collection_stats, CollectionStats),
+        (EndPoint.wallet_escrow_balance, EscrowBalance),
+    ],
+)
+def test_trusted_parsing_matches_validated_parsing(endpoint, model):
+    payload = make_payload(endpoint, size=3)
+
+    assert parse_model(model, payload, trusted=True) == parse_model(model, payload)
+
+
+def test_construct_maps_aliases_and_nested_models():
+    token = construct_model(TokenMetadata, make_payload(EndPoint.token_metadata))
+
+    assert isinstance(token, TokenMetadata)
+    assert token.mint_address == make_payload(EndPoint.token_metadata)["mintAddress"]
+    assert isinstance(token.properties, Properties)
+    assert token.attributes[0].trait_type == "background"
+
+
+def test_construct_fills_optional_defaults():
+    stats = construct_model(CollectionStats, {"symbol": "degods"})
+
+    assert stats.floor_price is None
+    assert stats.__fields_set__ == {"symbol"}
+
+
+async def test_trusted_api_returns_models(fake_magic_eden):
+    fake_magic_eden.payloads["wallets/abc/tokens"] = make_payload(
+        EndPoint.wallet_tokens, size=2
+    )
+
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url, trusted=True) as api:
+        tokens = await api.get_wallet_tokens("abc")
+
+    assert [token.name for token in tokens] == ["DeGod #4201"] * 2
@@ -0,0 +1,82 @@
+import pytest
+from aiohttp import ClientResponseError
+
+from benchmarks.payloads import TOKEN_METADATA
+from magicpyden import MagicEdenApi
+from magicpyden.portfolio import PortfolioValuer
+from magicpyden.ratelimit import RateLimiter
+from magicpyden.schema import CollectionStats, EscrowBalance, TokenMetadata
+
+LAMPORTS = 1000000000
+
+
+def token(collection):
+    return dict(TOKEN_METADATA, collection=collection)
+
+
+async def test_wallet_portfolio_shares_collection_stats(fake_magic_eden):
+    payloads = fake_magic_eden.payloads
+    payloads["wallets/w1/tokens"] = [token("degods"), token("degods"), token(None)]
+    payloads["wallets/w2/tokens"] = [token("degods"), token("y00ts"), token("gone")]
+    payloads["wallets/w1/escrow_balance"] = {"balance": 1.5}
+    payloads["wallets/w2/escrow_balance"] = {"balance": 0}
+    payloads["collections/degods/stats"] = {
+        "symbol": "degods",
+        "floorPrice": 300 * LAMPORTS,
+    }
+    payloads["collections/y00ts/stats"] = {"symbol": "y00ts", "floorPrice": LAMPORTS}
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url,
+        rate_limiter=RateLimiter(rate=1000, burst=1000),
+        max_retries=0,
+    ) as api:
+        results = await api.get_wallet_portfolio(["w1", "w2", "w3"])
+
+    first = results["w1"].value
+    assert first.total_value == 601.5
+    assert first.unvalued == 1
+    assert [(holding.collection, holding.count) for holding in first.holdings] == [
+        ("degods", 2)
+    ]
+    second = results["w2"].value
+    assert second.tokens_value == 301
+    assert [holding.collection for holding in second.holdings] == ["degods", "y00ts"]
+    assert second.unvalued == 1
+    assert not results["w3"].ok
+
+    stats_requests = [
+        route for route, _ in fake_magic_eden.requests if route.endswith("/stats")
+    ]
+    assert sorted(stats_requests) == [
+        "collections/degods/stats",
+        "collections/gone/stats",
+        "collections/y00ts/stats",
+    ]
+    token_queries = [
+        query for route, query in fake_magic_eden.requests if route.endswith("/tokens")
+    ]
+    assert all(query["ListedOnly"] == "false" for query in token_queries)
+    assert len(token_queries) == 3
+
+
+async def test_failed_stats_are_raised_and_fetched_again():
+    statuses = [503, 404]
+
+    async def fetch_tokens(wallet):
+        return [TokenMetadata.parse_obj(token("degods"))]
+
+    async def fetch_escrow(wallet):
+        return EscrowBalance(balance=0)
+
+    async def fetch_stats(collection):
+        if statuses:
+            raise ClientResponseError(None, (), status=statuses.pop(0))
+        return CollectionStats(symbol=collection, floorPrice=LAMPORTS)
+
+    valuer = PortfolioValuer(fetch_tokens, fetch_escrow, fetch_stats)
+
+    with pytest.raises(ClientResponseError):
+        await valuer.value("w1")
+    assert (await valuer.value("w1")).unvalued == 1
+    assert (await valuer.value("w1")).unvalued == 1
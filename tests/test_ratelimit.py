@@ -0,0 +1,76 @@
+import time
+
+import pytest
+from aiohttp import ClientResponseError
+
+from magicpyden import MagicEdenApi
+from magicpyden.ratelimit import RateLimiter, parse_reset, parse_retry_after
+from magicpyden.schema import CollectionStats
+
+STATS = {"symbol": "degods", "floorPrice": 100}
+
+
+async def test_rate_limiter_allows_burst_then_paces():
+    limiter = RateLimiter(rate=20, burst=3)
+
+    started = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_rate_limiter_adapts_to_throttling():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    limiter.throttle()
+    assert limiter.rate == 5
+
+    limiter.update({})
+    assert 5 < limiter.rate <= 10
+
+
+def test_rate_limiter_pauses_on_exhausted_budget():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+
+    assert limiter._reserve() > 1.5
+
+
+def test_parse_rate_limit_headers():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_reset(None) is None
+    assert 9 < parse_reset(str(time.time() + 10)) <= 10
+
+
+async def test_request_retries_throttled_responses(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads["collections/degods/stats"] = STATS
+    fake_magic_eden.failures.extend(
+        [(429, {"Retry-After": "0"}), (503, {})]  # noqa: WPS432
+    )
+
+    stats = await offline_api.get_collection_stats(collection_name="degods")
+
+    assert isinstance(stats, CollectionStats)
+    assert len(fake_magic_eden.requests) == 3
+    assert offline_api.rate_limiter.rate < offline_api.rate_limiter.max_rate
+
+
+async def test_request_gives_up_after_max_retries(fake_magic_eden):
+    fake_magic_eden.failures.extend([(500, {})] * 2)
+
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url, max_retries=1) as api:
+        with pytest.raises(ClientResponseError):
+            await api.get_collection_stats(collection_name="degods")
+
+    assert len(fake_magic_eden.requests) == 2
+
+
+async def test_request_does_not_retry_client_errors(fake_magic_eden, offline_api):
+    with pytest.raises(ClientResponseError):
+        await offline_api.get_collection_stats(collection_name="missing")
+
+    assert len(fake_magic_eden.requests) == 1
@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.mock_server import MockMagicEden
+from magicpyden import MagicEdenApi
+from magicpyden.cache import ResponseCache
+from magicpyden.concurrency import AdaptiveConcurrency
+from magicpyden.endpoint import EndPoint
+from magicpyden.ratelimit import RateLimiter
+from magicpyden.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    HedgingPolicy,
+    first_successful,
+)
+
+
+async def test_circuit_opens_after_consecutive_failures(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    fake_magic_eden.failures.extend([(503, {})] * 2)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, max_retries=0, circuit_breaker=breaker
+    ) as api:
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await api.get_collection_stats("degods")
+        with pytest.raises(CircuitOpenError):
+            await api.get_collection_stats("degods")
+
+    assert breaker.state(EndPoint.collection_stats) == CircuitState.open
+    assert len(fake_magic_eden.requests) == 2
+
+
+async def test_client_errors_do_not_open_circuit(fake_magic_eden):
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, circuit_breaker=breaker
+    ) as api:
+        with pytest.raises(Exception):
+            await api.get_collection_stats("missing")
+
+    assert breaker.state(EndPoint.collection_stats) == CircuitState.closed
+
+
+async def test_open_circuit_serves_stale_cached_body(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    cache = ResponseCache(ttls={EndPoint.collection_stats: 0.01})
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url,
+        max_retries=0,
+        cache=cache,
+        circuit_breaker=breaker,
+    ) as api:
+        await api.get_collection_stats("degods")
+        await asyncio.sleep(0.02)
+        fake_magic_eden.failures.append((503, {}))
+        with pytest.raises(Exception):
+            await api.get_collection_stats("degods")
+        stats = await api.get_collection_stats("degods")
+
+    assert stats.symbol == "degods"
+    assert len(fake_magic_eden.requests) == 2
+
+
+def test_half_open_circuit_lets_one_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    endpoint = EndPoint.collection_stats
+    breaker.record_failure(endpoint)
+    assert not breaker.allow(endpoint)
+    time.sleep(0.02)
+
+    assert breaker.state(endpoint) == CircuitState.half_open
+    assert breaker.allow(endpoint)
+    assert not breaker.allow(endpoint)
+
+    breaker.record_success(endpoint)
+    assert breaker.state(endpoint) == CircuitState.closed
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0)
+    endpoint = EndPoint.collection_stats
+    for _ in range(5):
+        breaker.record_failure(endpoint)
+    breaker.allow(endpoint)
+    breaker.record_success(endpoint)
+    breaker.record_failure(endpoint)
+
+    assert breaker.state(endpoint) == CircuitState.closed
+
+    breaker.reset_timeout = 60
+    for _ in range(4):
+        breaker.record_failure(endpoint)
+    assert breaker.state(endpoint) == CircuitState.open
+
+
+async def test_first_successful_skips_failed_tasks():
+    async def fail():
+        raise ValueError("failed")
+
+    async def succeed():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    tasks = [asyncio.ensure_future(fail()), asyncio.ensure_future(succeed())]
+    assert await first_successful(tasks) == "done"
+
+    with pytest.raises(ValueError):
+        await first_successful([asyncio.ensure_future(fail())])
+
+
+@pytest.mark.parametrize(
+    "concurrency",
+    [None, AdaptiveConcurrency(initial_limit=1, max_limit=1)],
+    ids=["unlimited", "single_slot"],
+)
+async def test_hedging_cuts_tail_latency(concurrency):
+    server = MockMagicEden(latency=0.005, seed=1)
+    await server.start()
+    hedging = HedgingPolicy(quantile=0.5, min_samples=5)
+    try:
+        async with MagicEdenApi(
+            base_url=server.base_url,
+            hedging=hedging,
+            rate_limiter=RateLimiter(rate=1000, burst=1000),
+            concurrency=concurrency,
+        ) as api:
+            for _ in range(hedging.min_samples):
+                await api.get_raw(EndPoint.collection_stats, "degods")
+            server.tail_rate, server.tail_latency = 0.2, 0.3
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            for _ in range(10):
+                await api.get_raw(EndPoint.collection_stats, "degods")
+            elapsed = loop.time() - started
+    finally:
+        await server.close()
+
+    assert hedging.hedged > 0
+    assert elapsed < server.tail_latency
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from magicpyden import MagicEdenApi
+from magicpyden.ratelimit import RateLimiter
+from magicpyden.scheduler import (
+    Priority,
+    PriorityScheduler,
+    PrioritySemaphore,
+    current_priority,
+)
+
+
+async def test_semaphore_serves_most_urgent_waiter_first():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire(Priority.normal)
+    order = []
+
+    async def wait(priority):
+        await semaphore.acquire(priority)
+        order.append(priority)
+        semaphore.release(priority)
+
+    tasks = [asyncio.ensure_future(wait(priority)) for priority in reversed(Priority)]
+    await asyncio.sleep(0)
+    semaphore.release(Priority.normal)
+    await asyncio.gather(*tasks)
+
+    assert order == [Priority.high, Priority.normal, Priority.bulk]
+
+
+async def test_semaphore_forgets_cancelled_waiters():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire(Priority.bulk)
+    waiter = asyncio.ensure_future(semaphore.acquire(Priority.bulk))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    semaphore.release(Priority.bulk)
+
+    assert not semaphore.waiters[Priority.bulk]
+    assert sum(semaphore.active.values()) == 0
+
+
+async def test_bulk_requests_leave_room_for_urgent_ones():
+    scheduler = PriorityScheduler(concurrency=2)
+    rate_limiter = RateLimiter(rate=1000, burst=1000)
+
+    async with scheduler.slot(Priority.bulk, rate_limiter):
+        blocked = asyncio.ensure_future(
+            scheduler.slot(Priority.bulk, rate_limiter).__aenter__()
+        )
+        await asyncio.sleep(0)
+        async with scheduler.slot(Priority.high, rate_limiter):
+            summary = scheduler.summary()
+        blocked.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+
+    assert summary["bulk"]["waiting"] == 1
+    assert summary["high"]["active"] == 1
+    assert scheduler.summary()["high"]["served"] == 1
+
+
+async def test_api_sends_urgent_requests_ahead_of_backfill(fake_magic_eden):
+    for name in ["urgent", *(f"bulk{index}" for index in range(6))]:
+        fake_magic_eden.payloads[f"collections/{name}/stats"] = {"symbol": name}
+
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, rate_limiter=RateLimiter(rate=40, burst=1)
+    ) as api:
+
+        async def backfill(index):
+            with api.priority(Priority.bulk):
+                assert current_priority() is Priority.bulk
+                await api.get_collection_stats(f"bulk{index}")
+
+        tasks = [asyncio.ensure_future(backfill(index)) for index in range(6)]
+        await asyncio.sleep(0.01)
+        with api.priority(Priority.high):
+            await api.get_collection_stats("urgent")
+        await asyncio.gather(*tasks)
+        summary = api.scheduler.summary()
+
+    routes = [route for route, _ in fake_magic_eden.requests]
+    assert routes.index("collections/urgent/stats") < 3
+    assert summary["bulk"]["served"] == 6
+    assert summary["high"]["served"] == 1
+    assert current_priority() is Priority.normal
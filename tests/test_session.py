@@ -0,0 +1,55 @@
+from aiohttp import ClientSession
+
+from magicpyden import MagicEdenApi
+from magicpyden.schema import CollectionStats
+from magicpyden.session import SessionConfig
+
+
+def test_api_defers_session_creation_until_used():
+    api = MagicEdenApi()
+
+    assert api._session is None
+
+
+async def test_session_config_tunes_pool_and_timeouts():
+    config = SessionConfig(limit_per_host=8, keepalive_timeout=5, total_timeout=3)
+
+    session = config.create_session()
+    try:
+        assert session.connector.limit_per_host == 8
+        assert session.timeout.total == 3
+    finally:
+        await session.close()
+
+
+async def test_shared_session_is_left_open(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+
+    async with ClientSession() as session:
+        for _ in range(2):
+            async with MagicEdenApi(
+                base_url=fake_magic_eden.base_url, session=session
+            ) as api:
+                stats = await api.get_collection_stats(collection_name="degods")
+            assert isinstance(stats, CollectionStats)
+            assert not session.closed
+
+
+async def test_owned_session_is_recreated_after_exit(fake_magic_eden):
+    api = MagicEdenApi(base_url=fake_magic_eden.base_url)
+
+    async with api:
+        first_session = api._session
+    async with api:
+        assert api._session is not first_session
+
+    assert first_session.closed
+
+
+async def test_session_negotiates_compression():
+    session = SessionConfig(accept_encoding="gzip").create_session()
+    try:
+        assert session.headers["Accept-Encoding"] == "gzip"
+    finally:
+        await session.close()
+    assert SessionConfig().accept_encoding.startswith("gzip, deflate")
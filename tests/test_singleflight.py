@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientResponseError
+
+from magicpyden.singleflight import SingleFlight
+
+
+async def test_concurrent_identical_requests_share_one_call(
+    fake_magic_eden, offline_api
+):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    fake_magic_eden.payloads["collections/y00ts/stats"] = {"symbol": "y00ts"}
+
+    results = await asyncio.gather(
+        *[offline_api.get_collection_stats("degods") for _ in range(10)],
+        offline_api.get_collection_stats("y00ts"),
+    )
+
+    assert [stats.symbol for stats in results] == ["degods"] * 10 + ["y00ts"]
+    assert results[0] is not results[1]
+    assert len(fake_magic_eden.requests) == 2
+
+    await offline_api.get_collection_stats("degods")
+    assert len(fake_magic_eden.requests) == 3
+
+
+async def test_failures_are_shared_and_not_kept(fake_magic_eden, offline_api):
+    results = await asyncio.gather(
+        *[offline_api.get_collection_stats("missing") for _ in range(5)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(error, ClientResponseError) for error in results)
+    assert len(fake_magic_eden.requests) == 1
+    assert not len(offline_api._in_flight)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return 42
+
+    first = asyncio.ensure_future(flight.share("key", call))
+    second = asyncio.ensure_future(flight.share("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 42
+    assert len(calls) == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
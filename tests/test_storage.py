@@ -0,0 +1,71 @@
+from benchmarks.payloads import ACTIVITY
+from magicpyden.schema import CollectionActivityItem, TokenActivityItem
+from magicpyden.storage import ActivityStore
+
+DAY = 86400
+
+
+def sale(signature, token_mint, buyer, seller, price, block_time, kind="buyNow"):
+    return CollectionActivityItem.parse_obj(
+        {
+            **ACTIVITY,
+            "signature": signature,
+            "tokenMint": token_mint,
+            "buyer": buyer,
+            "seller": seller,
+            "price": price,
+            "blockTime": block_time,
+            "type": kind,
+        }
+    )
+
+
+def make_store():
+    store = ActivityStore()
+    store.add(
+        [
+            sale("s1", "mint1", "alice", "bob", 10, DAY),
+            sale("s2", "mint1", "carol", "alice", 15, DAY + 60),
+            sale("s3", "mint2", "alice", "bob", 20, 2 * DAY),
+            sale("l1", "mint2", None, "alice", 30, 3 * DAY, kind="list"),
+        ]
+    )
+    return store
+
+
+def test_store_deduplicates_by_signature():
+    store = make_store()
+
+    assert store.add([sale("s1", "mint1", "alice", "bob", 10, DAY)]) == 0
+    assert len(store) == 4
+
+
+def test_store_accepts_token_activities():
+    store = ActivityStore()
+    activity = TokenActivityItem.parse_obj({**ACTIVITY, "collection": None})
+
+    assert store.add([activity]) == 1
+    assert store.last_sale(ACTIVITY["tokenMint"]).collection == "degods"
+
+
+def test_volume_per_day_counts_sales_only():
+    volumes = make_store().volume_per_day("degods")
+
+    assert [(item.day, item.volume, item.sales) for item in volumes] == [
+        ("1970-01-02", 25, 2),
+        ("1970-01-03", 20, 1),
+    ]
+
+
+def test_last_sales_per_mint():
+    store = make_store()
+
+    assert store.last_sale("mint1").signature == "s2"
+    assert store.last_sale("missing") is None
+    assert [item.signature for item in store.last_sales("degods")] == ["s3", "s2"]
+
+
+def test_wallet_pnl_realizes_round_trips():
+    pnl = make_store().wallet_pnl("alice")
+
+    assert (pnl.spent, pnl.received, pnl.realized) == (30, 15, 5)
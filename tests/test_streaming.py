@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
+
+from benchmarks.payloads import ACTIVITY
+from magicpyden import MagicEdenApi
+from magicpyden.concurrency import AdaptiveConcurrency
+from magicpyden.endpoint import EndPoint
+from magicpyden.hooks import MetricsCollector
+from magicpyden.resilience import CircuitBreaker, CircuitOpenError, CircuitState
+from magicpyden.schema import CollectionActivityItem
+from magicpyden.streaming import JsonArrayParser
+
+ROUTE = "collections/degods/activities"
+
+
+def parse_in_chunks(document: bytes, size: int):
+    parser = JsonArrayParser()
+    items = []
+    for start in range(0, len(document), size):
+        items.extend(parser.feed(document[start : start + size]))
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_parser_decodes_items_split_across_chunks(size):
+    items = [{"name": "déjà vu", "nested": [1, {"a": "]"}]}, 12345, "x,y", None]
+    document = json.dumps(items, ensure_ascii=False, indent=1).encode()
+
+    assert parse_in_chunks(document, size) == items
+
+
+def test_parser_yields_items_as_soon_as_they_complete():
+    parser = JsonArrayParser()
+
+    assert parser.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(b": 2}, 3") == [{"b": 2}]
+    assert parser.feed(b"4]") == [34]
+    parser.close()
+
+
+@pytest.mark.parametrize(
+    "document", [b"{}", b"[1, 2", b"[1 2]", b"[1] 2", b""], ids=repr
+)
+def test_parser_rejects_invalid_documents(document):
+    with pytest.raises(ValueError):
+        parse_in_chunks(document, 3)
+
+
+def test_parser_accepts_empty_array():
+    assert parse_in_chunks(b" [ ] ", 1) == []
+
+
+async def test_stream_matches_buffered_parsing(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads[ROUTE] = [
+        dict(ACTIVITY, price=index) for index in range(300)
+    ]
+
+    streamed = [
+        item
+        async for item in offline_api.stream_collection_activities("degods", limit=300)
+    ]
+
+    assert streamed == await offline_api.get_collection_activities("degods", limit=300)
+    assert all(isinstance(item, CollectionActivityItem) for item in streamed)
+    assert fake_magic_eden.requests[0][1] == {"offset": "0", "limit": "300"}
+
+
+async def test_stream_yields_items_before_response_completes():
+    rest_requested = asyncio.Event()
+
+    async def handle(request):
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        await response.write(b"[" + json.dumps(ACTIVITY).encode() + b",")
+        await rest_requested.wait()
+        await response.write(json.dumps(dict(ACTIVITY, price=2)).encode() + b"]")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/v2/{route:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with MagicEdenApi(base_url=str(server.make_url("/v2"))) as api:
+            items = api.stream_collection_activities("degods")
+            first = await items.__anext__()
+            rest_requested.set()
+            rest = [item async for item in items]
+    finally:
+        await server.close()
+
+    assert first.price == ACTIVITY["price"]
+    assert [item.price for item in rest] == [2]
+
+
+async def test_stream_retries_before_first_item(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads[ROUTE] = [ACTIVITY]
+    fake_magic_eden.failures.append((503, {"Retry-After": "0"}))
+
+    streamed = [
+        item async for item in offline_api.stream_collection_activities("degods")
+    ]
+
+    assert len(streamed) == 1
+    assert len(fake_magic_eden.requests) == 2
+
+
+async def test_stream_raises_client_errors(fake_magic_eden, offline_api):
+    with pytest.raises(ClientResponseError):
+        async for _ in offline_api.stream_collection_activities("missing"):
+            pass  # noqa: WPS420
+
+
+async def test_stream_fails_fast_while_circuit_is_open(fake_magic_eden):
+    fake_magic_eden.payloads[ROUTE] = [ACTIVITY]
+    breaker = CircuitBreaker(failure_threshold=1)
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, max_retries=0, circuit_breaker=breaker
+    ) as api:
+        fake_magic_eden.failures.append((503, {}))
+        with pytest.raises(ClientResponseError):
+            async for _ in api.stream_collection_activities("degods"):
+                pass  # noqa: WPS420
+        assert breaker.state(EndPoint.collection_activities) == CircuitState.open
+
+        with pytest.raises(CircuitOpenError):
+            async for _ in api.stream_collection_activities("degods"):
+                pass  # noqa: WPS420
+
+    assert len(fake_magic_eden.requests) == 1
+
+
+async def test_stream_success_closes_circuit(fake_magic_eden):
+    fake_magic_eden.payloads[ROUTE] = [ACTIVITY]
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure(EndPoint.collection_activities)
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, circuit_breaker=breaker
+    ) as api:
+        streamed = [item async for item in api.stream_collection_activities("degods")]
+
+    assert len(streamed) == 1
+    breaker.record_failure(EndPoint.collection_activities)
+    assert breaker.state(EndPoint.collection_activities) == CircuitState.closed
+
+
+async def test_stream_reports_parse_time(fake_magic_eden):
+    fake_magic_eden.payloads[ROUTE] = [ACTIVITY, ACTIVITY]
+    metrics = MetricsCollector()
+    async with MagicEdenApi(base_url=fake_magic_eden.base_url, hooks=[metrics]) as api:
+        async for _ in api.stream_collection_activities("degods"):
+            pass  # noqa: WPS420
+
+    endpoint_metrics = metrics.endpoints[EndPoint.collection_activities]
+    assert endpoint_metrics.parse_time.count == 1
+    assert endpoint_metrics.parse_time.total > 0
+
+
+async def test_stream_releases_slot_when_consumer_stops(fake_magic_eden):
+    fake_magic_eden.payloads[ROUTE] = [ACTIVITY, ACTIVITY]
+    concurrency = AdaptiveConcurrency(initial_limit=1)
+    async with MagicEdenApi(
+        base_url=fake_magic_eden.base_url, concurrency=concurrency
+    ) as api:
+        items = api.stream_collection_activities("degods")
+        await items.__anext__()
+        await items.aclose()
+
+        assert concurrency.limiter(EndPoint.collection_activities).in_flight == 0
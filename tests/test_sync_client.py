@@ -0,0 +1,111 @@
+import asyncio
+import inspect
+import threading
+from functools import partial
+
+import pytest
+
+from magicpyden import MagicEdenApi
+from magicpyden.cache import ResponseCache, SQLiteCache
+from magicpyden.endpoint import EndPoint
+from magicpyden.sync_client import MagicEdenSyncClient
+
+
+def in_thread(function, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, partial(function, *args, **kwargs))
+
+
+async def test_sync_client_reuses_one_session(fake_magic_eden):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+    client = MagicEdenSyncClient(base_url=fake_magic_eden.base_url)
+    session = client.api._get_session()  # noqa: WPS437
+
+    first = await in_thread(client.get_collection_stats, "degods")
+    second = await in_thread(client.get_raw, EndPoint.collection_stats, "degods")
+    await in_thread(client.close)
+
+    assert first.symbol == "degods"
+    assert second == b'{"symbol": "degods"}'
+    assert session.closed
+    assert client.closed
+
+
+async def test_sync_client_batch_reports_errors_per_key(fake_magic_eden):
+    for name in ("a", "b"):
+        fake_magic_eden.payloads[f"collections/{name}/stats"] = {"symbol": name}
+
+    def run_batch():
+        with MagicEdenSyncClient(
+            base_url=fake_magic_eden.base_url, max_retries=0
+        ) as client:
+            return client.batch("get_collection_stats", ["a", "b", "missing", "a"])
+
+    results = await in_thread(run_batch)
+
+    assert results["a"].value.symbol == "a"
+    assert results["b"].value.symbol == "b"
+    assert not results["missing"].ok
+    assert len(fake_magic_eden.requests) == 3
+
+
+def test_sync_client_is_safe_across_threads():
+    with MagicEdenSyncClient() as client:
+        loops = []
+        threads = [
+            threading.Thread(target=lambda: loops.append(client.run(_running_loop())))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(set(loops)) == 1
+    with pytest.raises(RuntimeError):
+        client.run(_running_loop())
+    with pytest.raises(AttributeError):
+        client.get_missing_method  # noqa: WPS428
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_sync_client_wraps_every_get_method():
+    get_methods = {
+        name
+        for name, _ in inspect.getmembers(MagicEdenApi, inspect.iscoroutinefunction)
+        if name.startswith("get_")
+    }
+
+    blocking_methods = {
+        name for name in dir(MagicEdenSyncClient) if name.startswith("get_")
+    }
+
+    assert {"get_wallet_portfolio", "get_trait_index"} <= get_methods
+    assert blocking_methods == get_methods
+    assert not any(
+        inspect.iscoroutinefunction(getattr(MagicEdenSyncClient, name))
+        for name in get_methods
+    )
+
+
+async def test_sync_client_uses_sqlite_cache_created_in_caller_thread(
+    fake_magic_eden, tmp_path
+):
+    fake_magic_eden.payloads["collections/degods/stats"] = {"symbol": "degods"}
+
+    def fetch_twice():
+        cache = ResponseCache(SQLiteCache(str(tmp_path / "cache.sqlite")))
+        with MagicEdenSyncClient(
+            base_url=fake_magic_eden.base_url, cache=cache
+        ) as client:
+            stats = [client.get_collection_stats("degods") for _ in range(2)]
+        return cache, stats
+
+    cache, stats = await in_thread(fetch_twice)
+
+    assert [item.symbol for item in stats] == ["degods", "degods"]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(fake_magic_eden.requests) == 1
@@ -0,0 +1,117 @@
+import pytest
+
+from benchmarks.payloads import COLLECTION_LISTING, TOKEN_METADATA
+from magicpyden.schema import CollectionListingItem, TokenMetadata
+from magicpyden.traits import TraitIndex
+
+TRAITS = {
+    "a": {"background": "Pink", "eyes": "Laser"},
+    "b": {"background": "Pink", "eyes": "Sleepy"},
+    "c": {"background": "Blue", "eyes": "Sleepy"},
+    "d": {"background": "Pink"},
+}
+
+
+def token(mint, traits):
+    attributes = [
+        {"trait_type": trait_type, "value": trait_value}
+        for trait_type, trait_value in traits.items()
+    ]
+    return TokenMetadata.parse_obj(
+        dict(TOKEN_METADATA, mintAddress=mint, attributes=attributes)
+    )
+
+
+def listing(mint, price):
+    return CollectionListingItem.parse_obj(
+        dict(COLLECTION_LISTING, tokenMint=mint, price=price)
+    )
+
+
+def naive_score(mint, tokens):
+    trait_types = {trait_type for traits in tokens.values() for trait_type in traits}
+    score = 0
+    for trait_type in trait_types:
+        trait_value = tokens[mint].get(trait_type)
+        same = [traits.get(trait_type) for traits in tokens.values()]
+        score += len(tokens) / same.count(trait_value)
+    return score
+
+
+@pytest.fixture
+def index():
+    trait_index = TraitIndex()
+    trait_index.add(token(mint, traits) for mint, traits in TRAITS.items())
+    return trait_index
+
+
+def test_index_maps_traits_to_mints(index):
+    assert len(index) == 4
+    assert index.mints_with("background", "Pink") == {"a", "b", "d"}
+    assert index.mints_with("eyes", "Closed") == set()
+    assert index.frequencies()[("eyes", "Sleepy")] == 0.5
+
+
+def test_select_intersects_trait_types_and_unites_values(index):
+    assert index.select({"background": "Pink", "eyes": "Sleepy"}) == ["b"]
+    assert index.select({"eyes": ["Laser", "Sleepy"]}) == ["a", "b", "c"]
+    assert index.select({}) == ["a", "b", "c", "d"]
+
+
+def test_rarity_scores_match_naive_computation(index):
+    pytest.importorskip("numpy")
+    scores = index.rarity_scores()
+
+    assert list(scores) == pytest.approx(
+        [naive_score(mint, TRAITS) for mint in index.mints]
+    )
+    assert index.rarest(1)[0][0] == "c"
+
+
+def test_updates_are_incremental(index):
+    pytest.importorskip("numpy")
+    before = index.rarity_scores()
+
+    assert index.add([token("d", {"background": "Blue", "eyes": "Laser"})]) == 0
+    assert index.add([token("e", {"background": "Gold"})]) == 1
+
+    tokens = {**TRAITS, "d": {"background": "Blue", "eyes": "Laser"}}
+    tokens["e"] = {"background": "Gold"}
+    assert index.mints_with("background", "Blue") == {"c", "d"}
+    assert list(index.rarity_scores()) == pytest.approx(
+        [naive_score(mint, tokens) for mint in index.mints]
+    )
+    assert len(before) == 4
+
+
+def test_rarity_scores_without_traits():
+    pytest.importorskip("numpy")
+    empty = TraitIndex()
+    assert list(empty.rarity_scores()) == []
+    assert empty.rarest(1) == []
+
+    traitless = TraitIndex()
+    traitless.add([token("m1", {}), token("m2", {})])
+    assert list(traitless.rarity_scores()) == [0, 0]
+    assert traitless.rarest(1) == [("m1", 0)]
+
+
+def test_listings_with_traits_are_sorted_by_price(index):
+    listings = [listing("a", 3), listing("b", 1), listing("c", 0.5), listing("x", 2)]
+
+    matched = index.listings_with(listings, {"background": "Pink"})
+
+    assert [item.token_mint for item in matched] == ["b", "a"]
+
+
+async def test_api_indexes_fetched_metadata(fake_magic_eden, offline_api):
+    for mint, traits in TRAITS.items():
+        fake_magic_eden.payloads[f"tokens/{mint}"] = token(mint, traits).dict(
+            by_alias=True
+        )
+
+    index = await offline_api.get_trait_index(["a", "b", "missing"])
+    await offline_api.get_trait_index(["c", "d"], index=index)
+
+    assert sorted(index.mints) == ["a", "b", "c", "d"]
+    assert index.mints_with("eyes", "Sleepy") == {"b", "c"}
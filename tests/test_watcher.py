@@ -0,0 +1,78 @@
+from aiohttp import ClientResponseError
+
+from benchmarks.payloads import COLLECTION_LISTING
+from magicpyden.watcher import CollectionWatcher, ListingChange, OrderBook
+
+ROUTE = "collections/degods/listings"
+
+
+def listing(token_address: str, price: float) -> dict:
+    return {**COLLECTION_LISTING, "tokenAddress": token_address, "price": price}
+
+
+def test_order_book_diffs_snapshots():
+    book = OrderBook("degods")
+
+    added = book.apply([listing("a", 3), listing("b", 1), listing("c", 2)])
+    assert [event.change for event in added] == [ListingChange.added] * 3
+    assert book.floor.token_address == "b"
+
+    events = book.apply([listing("a", 0.5), listing("c", 2), listing("d", 4)])
+    changes = {(event.change, event.listing.token_address) for event in events}
+    assert changes == {
+        (ListingChange.removed, "b"),
+        (ListingChange.price_changed, "a"),
+        (ListingChange.added, "d"),
+    }
+    assert [item.token_address for item in book.top(2)] == ["a", "c"]
+    assert (
+        next(
+            event.previous_price
+            for event in events
+            if event.change is ListingChange.price_changed
+        )
+        == 3
+    )
+
+    assert book.apply([listing("a", 0.5), listing("c", 2), listing("d", 4)]) == []
+    assert len(book) == 3
+    assert "b" not in book
+
+
+async def test_watcher_refreshes_across_pages_and_adapts(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads[ROUTE] = [
+        listing(str(index), index) for index in range(25)
+    ]
+    watcher = CollectionWatcher(offline_api, ["degods"], min_interval=1, max_interval=8)
+
+    events = await watcher.refresh("degods")
+    assert len(events) == 25
+    assert watcher.floor("degods").token_address == "0"
+    assert watcher.intervals["degods"] == 1
+
+    assert await watcher.refresh("degods") == []
+    assert watcher.intervals["degods"] == 1.5
+
+
+async def test_watch_streams_events(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads[ROUTE] = [listing("a", 1)]
+    watcher = CollectionWatcher(offline_api, ["degods"])
+
+    async for event in watcher.watch():
+        assert event.change is ListingChange.added
+        break
+
+
+async def test_watch_backs_off_failing_collection(fake_magic_eden, offline_api):
+    fake_magic_eden.payloads[ROUTE] = [listing("a", 1)]
+    watcher = CollectionWatcher(
+        offline_api, ["missing", "degods"], min_interval=1, max_interval=8
+    )
+
+    async for event in watcher.watch():
+        assert event.collection == "degods"
+        break
+
+    assert isinstance(watcher.last_error("missing"), ClientResponseError)
+    assert watcher.intervals["missing"] == 1.5
+    assert watcher.last_error("degods") is None